@@ -0,0 +1,484 @@
+"""
+avaliador_base.py
+Base comum e registro dos avaliadores de indicadores (TagAlongEvaluator, PVPEvaluator, ...).
+Cada indicador é declarado como dado na seção avaliadores do catálogo (indicadores.json):
+textos, entradas, cálculos e faixas. O registro lê as declarações na primeira consulta e monta a
+classe de cada avaliador só quando ela é pedida pelo nome, uma única vez; analiseativos.py expõe
+as classes por esse registro.
+Além do avaliar de uma linha, todo avaliador oferece avaliar_many, que classifica colunas inteiras,
+em lista ou array do NumPy, de uma vez, devolvendo um vetor compacto de códigos de faixa e os
+resultados compartilhados de cada código.
+"""
+
+import inspect
+import math
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from calculos_indicadores import CALCULOS, numerico
+from catalogo_indicadores import CATALOGO, CatalogoIndicadores
+
+# Código dos valores que não caem em nenhuma faixa, o mesmo de classificacao_vetorizada.
+SEM_FAIXA = -1
+
+
+# Resultados já criados, pelos seus textos, compartilhados entre as avaliações.
+_RESULTADOS_IND = {}
+# Limite de resultados guardados, para que mensagens de erro variadas não cresçam sem fim.
+_RESULTADOS_IND_MAXIMO = 4096
+
+
+class ResultadoIND:
+    """
+    Resultado imutável da avaliação de um indicador. Resultados com os mesmos textos são um
+    único objeto, criado na primeira vez e compartilhado por todas as avaliações, até o limite
+    de _RESULTADOS_IND_MAXIMO resultados guardados.
+    """
+
+    __slots__ = ('classificacao', 'faixa', 'descricao', 'definicao', 'agrupador', 'formula',
+                 'riscos', 'referencia_cruzada', 'recomendacao')
+
+    # pylint: disable=too-many-arguments
+    def __new__(cls, classificacao, faixa, descricao, definicao, agrupador, formula, riscos,
+                referencia_cruzada, recomendacao):
+        """
+        Devolve o resultado compartilhado dos textos recebidos, criando-o só na primeira vez. Os
+        espaços no início e no fim dos textos longos são removidos uma única vez, na criação.
+        """
+        chave = (classificacao, faixa, descricao, definicao, agrupador, formula, riscos,
+                 referencia_cruzada, recomendacao)
+        resultado = _RESULTADOS_IND.get(chave)
+
+        if resultado is None:
+            # Sem passar pelo __setattr__ bloqueado.
+            resultado = object.__new__(cls)
+            valores = (classificacao, faixa, descricao.strip(), definicao.strip(), agrupador,
+                       formula, riscos.strip(), referencia_cruzada.strip(), recomendacao.strip())
+
+            for nome, valor in zip(cls.__slots__, valores):
+                object.__setattr__(resultado, nome, valor)
+
+            if len(_RESULTADOS_IND) < _RESULTADOS_IND_MAXIMO:
+                _RESULTADOS_IND[chave] = resultado
+
+        return resultado
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError('ResultadoIND é imutável.')
+
+    def __delattr__(self, nome):
+        raise AttributeError('ResultadoIND é imutável.')
+
+    def __reduce__(self):
+        return ResultadoIND, tuple(getattr(self, nome) for nome in self.__slots__)
+
+    def __repr__(self):
+        return f"<ResultadoIND: {self.classificacao} | Faixa: {self.faixa}>"
+
+    def to_dict(self):
+        """Devolve uma cópia do resultado como dicionário, com todos os atributos."""
+
+        return {
+            'classificacao': self.classificacao,
+            'faixa': self.faixa,
+            'descricao': self.descricao,
+            'definicao': self.definicao,
+            'agrupador': self.agrupador,
+            'formula': self.formula,
+            'riscos': self.riscos,
+            'referencia_cruzada': self.referencia_cruzada,
+            'recomendacao': self.recomendacao
+        }
+
+
+class Classificacoes(NamedTuple):
+    """
+    Classificações de um lote: o código de cada linha (int8, SEM_FAIXA para entradas inválidas
+    ou fora das faixas) e o resultado compartilhado de cada código, na ordem das faixas.
+    """
+
+    codigos: Any
+    resultados: Tuple
+
+    def resultado(self, posicao: int) -> Optional[ResultadoIND]:
+        """Devolve o resultado da linha em uma posição do lote, ou None se não tiver faixa."""
+
+        codigo = self.codigos[posicao]
+
+        return None if codigo == SEM_FAIXA else self.resultados[codigo]
+
+    def classificacoes(self) -> List[Optional[str]]:
+        """Devolve a classificação de cada linha do lote, como 'Ótimo', ou None."""
+
+        nomes = [resultado.classificacao for resultado in self.resultados] + [None]
+
+        # SEM_FAIXA (-1) aponta para o None do fim da lista.
+        return [nomes[codigo] for codigo in self.codigos.tolist()]
+
+
+def coluna_numerica(valores):
+    """
+    Valida e converte uma coluna com a mesma regra de avaliar (calculos_indicadores.numerico).
+    Devolve os valores em float64 e a máscara das linhas inválidas. Arrays e listas só de
+    números são convertidos de uma vez; as demais colunas, valor a valor, e os valores que avaliar
+    recusaria, como '-1', ' 2', '1e3' ou None, viram NaN e ficam marcados como inválidos. NaN
+    numérico é um valor válido, classificado como em avaliar.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    array = np.asarray(valores)
+
+    # Booleanos, inteiros e floats: todos numéricos para avaliar, como bool, int e float.
+    if array.dtype.kind in 'biuf':
+        return array.astype(np.float64), np.zeros(array.shape, dtype=bool)
+
+    validos = [numerico(valor) for valor in valores]
+    numeros = [float(valor) if valido else math.nan for valor, valido in zip(valores, validos)]
+
+    return np.array(numeros, dtype=np.float64), ~np.array(validos, dtype=bool)
+
+
+def _limite(valor: Optional[float], infinito: float) -> float:
+    """Converte o limite de uma faixa declarada; null é o infinito do lado correspondente."""
+
+    return infinito if valor is None else valor
+
+
+def _contem(faixa: Tuple, valor) -> bool:
+    """
+    Indica se o valor está na faixa, comparando como a cadeia de if/elif original: só os limites
+    finitos são comparados, o inferior antes do superior.
+    """
+    _, inferior, inferior_inclusivo, superior, superior_inclusivo = faixa
+
+    if inferior == superior:
+        return valor == inferior
+    if inferior != -math.inf \
+            and not (valor >= inferior if inferior_inclusivo else valor > inferior):
+        return False
+    if superior != math.inf \
+            and not (valor <= superior if superior_inclusivo else valor < superior):
+        return False
+
+    return True
+
+
+class AvaliadorBase:
+    """
+    Base dos avaliadores. Cada subclasse é montada pelo RegistroAvaliadores a partir da sua
+    declaração; avaliar, avaliar_many, gerar_resultado e _erro são os mesmos para todas.
+    """
+
+    # Preenchidos por montar_classe a partir da declaração.
+    DECLARACAO: Dict = {}
+    _assinatura: inspect.Signature = inspect.Signature()
+    _faixas: Tuple = ()
+    _resultados: Tuple = ()
+    _vetorizavel = False
+
+    def __init__(self):
+        self.definicao = self.DECLARACAO['definicao']
+        self.agrupador = self.DECLARACAO['agrupador']
+        self.formula = self.DECLARACAO['formula']
+
+    def avaliar(self, *valores, **nomeados) -> Optional[ResultadoIND]:
+        """
+        Avalia uma linha, com as entradas na ordem da declaração (ou pelo nome). Devolve o
+        resultado compartilhado da faixa, um resultado de erro para entradas inválidas, ou None
+        se o valor não cair em nenhuma faixa.
+        """
+        argumentos = self._assinatura.bind(*valores, **nomeados)
+        argumentos.apply_defaults()
+
+        try:
+            codigo = self._codigo(argumentos.arguments)
+        except Exception as e:  # pylint: disable=broad-except
+            return self._erro(mensagem=str(e))
+
+        return None if codigo == SEM_FAIXA else self._resultados[codigo]
+
+    def _codigo(self, variaveis: Dict) -> int:
+        """Valida as entradas, faz os cálculos declarados e devolve o código da faixa."""
+
+        entradas = self.DECLARACAO['entradas']
+
+        for entrada in entradas:
+            if 'mensagem' in entrada and not numerico(variaveis[entrada['nome']]):
+                raise ValueError(entrada['mensagem'])
+
+        for entrada in entradas:
+            if 'mensagem' in entrada:
+                variaveis[entrada['nome']] = float(variaveis[entrada['nome']])
+
+        for calculo in self.DECLARACAO['calculos']:
+            if 'razao' in calculo:
+                numerador, denominador = (variaveis[nome] for nome in calculo['razao'])
+                if denominador == 0:
+                    raise ValueError(calculo['mensagem'])
+                variaveis[calculo['resultado']] = numerador / denominador
+            else:
+                funcao = CALCULOS[calculo['funcao']]
+                variaveis[calculo['resultado']] = funcao(*(variaveis[nome]
+                                                           for nome in calculo['argumentos']))
+
+        for codigo, faixa in enumerate(self._faixas):
+            if _contem(faixa, variaveis[faixa[0]]):
+                return codigo
+
+        return SEM_FAIXA
+
+    def avaliar_many(self, *colunas) -> Classificacoes:
+        """
+        Avalia um lote. Recebe uma coluna por entrada, cada uma em lista, tupla ou array do NumPy,
+        como avaliar_many(valores) ou avaliar_many(lucros, receitas). Devolve o código de faixa de
+        cada linha e os resultados compartilhados de cada código.
+
+        Os avaliadores só de entradas numéricas e razões entre elas são classificados de forma
+        vetorizada, com as mesmas regras de avaliar: as linhas que avaliar recusaria, como
+        entradas não numéricas ou razões por zero, ficam sem faixa, e NaN recebe a faixa que
+        avaliar lhe daria. Os demais, como Beta e FCD, avaliam linha a linha.
+        """
+        # As colunas seguem as mesmas regras dos argumentos de avaliar.
+        self._assinatura.bind(*colunas)
+
+        if self._vetorizavel:
+            return Classificacoes(self._codigos_vetorizados(colunas), self._resultados)
+
+        return self._avaliar_linhas(colunas)
+
+    def _codigos_vetorizados(self, colunas):
+        """Classifica colunas numéricas com operações do NumPy, sem um laço por linha."""
+
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        nomes = list(self._assinatura.parameters)
+        convertidas = [coluna_numerica(coluna) for coluna in colunas]
+        variaveis = dict(zip(nomes, np.broadcast_arrays(*(valores for valores, _ in convertidas))))
+        invalidas = np.zeros(variaveis[nomes[0]].shape, dtype=bool)
+
+        for _, mascara in convertidas:
+            invalidas |= mascara
+
+        for calculo in self.DECLARACAO['calculos']:
+            numerador, denominador = (variaveis[nome] for nome in calculo['razao'])
+            zero = denominador == 0
+            invalidas |= zero
+            with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+                variaveis[calculo['resultado']] = np.divide(numerador, denominador,
+                                                            out=np.full(zero.shape, np.nan),
+                                                            where=~zero)
+
+        tabela = self.tabela_faixas()
+
+        if tabela is not None:
+            codigos = tabela.classificar(variaveis[self.DECLARACAO['variavel']])
+        else:
+            # Faixas sobre variáveis diferentes: vale a primeira que contém a linha.
+            codigos = np.full(invalidas.shape, SEM_FAIXA, dtype=np.int8)
+            for codigo, faixa in reversed(list(enumerate(self._faixas))):
+                codigos[_mascara(faixa, variaveis[faixa[0]])] = codigo
+
+        codigos[invalidas] = SEM_FAIXA
+
+        return codigos
+
+    def _avaliar_linhas(self, colunas) -> Classificacoes:
+        """Avalia linha a linha; erros e valores fora das faixas recebem SEM_FAIXA."""
+
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        linhas = list(zip(*colunas))
+        codigos = np.full(len(linhas), SEM_FAIXA, dtype=np.int8)
+
+        for posicao, linha in enumerate(linhas):
+            argumentos = self._assinatura.bind(*linha)
+            argumentos.apply_defaults()
+
+            try:
+                codigos[posicao] = self._codigo(argumentos.arguments)
+            except Exception:  # pylint: disable=broad-except
+                continue
+
+        return Classificacoes(codigos, self._resultados)
+
+    @classmethod
+    def tabela_faixas(cls):
+        """
+        Devolve as faixas como TabelaFaixas de classificacao_vetorizada, montada no primeiro uso,
+        ou None quando as faixas não são todas sobre a mesma variável.
+        """
+        if '_tabela' not in cls.__dict__:
+            cls._tabela = _tabela(cls)
+
+        return cls._tabela
+
+    def gerar_resultado(self, classificacao, faixa, descricao, riscos, referencia, recomendacao):
+        """Cria um ResultadoIND com os textos do avaliador; exige textos não vazios."""
+
+        for param, nome in [(classificacao, 'classificacao'), (faixa, 'faixa'),
+                            (descricao, 'descricao'), (riscos, 'riscos'),
+                            (referencia, 'referencia'), (recomendacao, 'recomendacao')]:
+            if not isinstance(param, str) or not param.strip():
+                raise ValueError(f"O parâmetro '{nome}' deve ser uma string não vazia.")
+
+        return ResultadoIND(classificacao=classificacao, faixa=faixa, descricao=descricao,
+                            definicao=self.definicao, agrupador=self.agrupador,
+                            formula=self.formula, riscos=riscos, referencia_cruzada=referencia,
+                            recomendacao=recomendacao)
+
+    def _erro(self, mensagem):
+        """Cria o ResultadoIND de erro, com a mensagem no texto de erro declarado."""
+
+        return ResultadoIND(classificacao='Erro', faixa='N/A',
+                            descricao=self.DECLARACAO['erro'].format(mensagem=mensagem),
+                            definicao=self.definicao, agrupador=self.agrupador,
+                            formula=self.formula, riscos='N/A', referencia_cruzada='N/A',
+                            recomendacao='N/A')
+
+
+def exibir_resultado(resultado: ResultadoIND) -> None:
+    """Imprime os atributos de um ResultadoIND, um por linha, seguidos de uma linha separadora."""
+
+    print("📊 Resultado da Avaliação P/VP")
+    print(f"Classificação: {resultado.classificacao}")
+    print(f"Faixa: {resultado.faixa}")
+    print(f"Descrição: {resultado.descricao}")
+    print(f"Definição: {resultado.definicao}")
+    print(f"Agrupador: {resultado.agrupador}")
+    print(f"Fórmula: {resultado.formula}")
+    print(f"Riscos: {resultado.riscos}")
+    print(f"Referência Cruzada: {resultado.referencia_cruzada}")
+    print(f"Recomendação: {resultado.recomendacao}")
+    print("-" * 60)
+
+
+def _mascara(faixa: Tuple, valores):
+    """Versão vetorizada de _contem: as linhas de um array que estão na faixa."""
+
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    _, inferior, inferior_inclusivo, superior, superior_inclusivo = faixa
+
+    if inferior == superior:
+        return valores == inferior
+
+    dentro = np.ones(valores.shape, dtype=bool)
+
+    if inferior != -math.inf:
+        dentro &= (valores >= inferior) if inferior_inclusivo else (valores > inferior)
+    if superior != math.inf:
+        dentro &= (valores <= superior) if superior_inclusivo else (valores < superior)
+
+    return dentro
+
+
+def _tabela(classe: Type[AvaliadorBase]):
+    """Monta a TabelaFaixas de um avaliador cujas faixas são todas sobre a mesma variável."""
+
+    # pylint: disable=import-outside-toplevel
+    from classificacao_vetorizada import Faixa, TabelaFaixas
+
+    if any(faixa[0] != classe.DECLARACAO['variavel'] for faixa in classe._faixas):
+        return None
+
+    # NaN só está na faixa sem limites finitos, como em _contem.
+    codigo_nan = next((codigo for codigo, faixa in enumerate(classe._faixas)
+                       if faixa[1] == -math.inf and faixa[3] == math.inf), SEM_FAIXA)
+
+    return TabelaFaixas(classe.__name__, [Faixa(*faixa[1:]) for faixa in classe._faixas],
+                        classe._resultados, codigo_nan=codigo_nan)
+
+
+def montar_classe(nome: str, declaracao: Dict) -> Type[AvaliadorBase]:
+    """Monta a classe de um avaliador a partir da sua declaração."""
+
+    variavel = declaracao['variavel']
+    faixas = tuple((dados.get('variavel', variavel),
+                    _limite(dados['inferior'], -math.inf), dados['inferior_inclusivo'],
+                    _limite(dados['superior'], math.inf), dados['superior_inclusivo'])
+                   for dados in declaracao['faixas'])
+
+    parametros = [inspect.Parameter(entrada['nome'], inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                    default=entrada.get('padrao', inspect.Parameter.empty))
+                  for entrada in declaracao['entradas']]
+
+    # Só entradas numéricas e razões entre elas podem ser calculadas em colunas do NumPy.
+    vetorizavel = all('mensagem' in entrada for entrada in declaracao['entradas']) \
+        and all('razao' in calculo for calculo in declaracao['calculos'])
+
+    classe = type(nome, (AvaliadorBase,), {
+        '__doc__': f'Avaliador {nome}, declarado no catálogo de indicadores.',
+        '__module__': 'analiseativos',
+        'DECLARACAO': declaracao,
+        '_assinatura': inspect.Signature(parametros),
+        '_faixas': faixas,
+        '_vetorizavel': vetorizavel,
+    })
+
+    # Um resultado por faixa, criado uma vez e compartilhado por todas as avaliações.
+    modelo = classe()
+    classe._resultados = tuple(modelo.gerar_resultado(dados['classificacao'], dados['faixa'],
+                                                      dados['descricao'], dados['riscos'],
+                                                      dados['referencia'], dados['recomendacao'])
+                               for dados in declaracao['faixas'])
+
+    return classe
+
+
+class RegistroAvaliadores:
+    """
+    Registro dos avaliadores declarados em um catálogo de indicadores. As declarações são lidas
+    na primeira consulta e cada classe é montada só quando pedida pelo nome, como 'PVPEvaluator'.
+    """
+
+    def __init__(self, catalogo: CatalogoIndicadores = CATALOGO):
+        self.__catalogo = catalogo
+        self.__classes: Dict[str, Type[AvaliadorBase]] = {}
+        self.__avaliadores: Dict[str, AvaliadorBase] = {}
+
+    @property
+    def versao(self) -> int:
+        """Versão do catálogo das declarações."""
+
+        return self.__catalogo.versao
+
+    def nomes(self) -> List[str]:
+        """Lista os nomes dos avaliadores declarados."""
+
+        return list(self.__catalogo.avaliadores())
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self.__catalogo.avaliadores()
+
+    def declaracao(self, nome: str) -> Dict:
+        """Devolve a declaração de um avaliador. Levanta KeyError se ele não existir."""
+
+        return self.__catalogo.avaliadores()[nome]
+
+    def classe(self, nome: str) -> Type[AvaliadorBase]:
+        """Devolve a classe de um avaliador, montada na primeira vez que é pedida."""
+
+        classe = self.__classes.get(nome)
+
+        if classe is None:
+            classe = self.__classes[nome] = montar_classe(nome, self.declaracao(nome))
+
+        return classe
+
+    def avaliador(self, nome: str) -> AvaliadorBase:
+        """Devolve uma instância compartilhada de um avaliador."""
+
+        avaliador = self.__avaliadores.get(nome)
+
+        if avaliador is None:
+            avaliador = self.__avaliadores[nome] = self.classe(nome)()
+
+        return avaliador
+
+    def avaliar_many(self, nome: str, *colunas) -> Classificacoes:
+        """Avalia um lote com o avaliador de um indicador. Ver AvaliadorBase.avaliar_many."""
+
+        return self.avaliador(nome).avaliar_many(*colunas)
+
+
+# Registro compartilhado, com as declarações do catálogo de indicadores.
+REGISTRO = RegistroAvaliadores()
@@ -0,0 +1,172 @@
+"""
+avaliador_base_test.py
+Testes da base e do registro dos avaliadores declarados no catálogo de indicadores.
+"""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+import analiseativos
+from avaliador_base import (REGISTRO, SEM_FAIXA, AvaliadorBase, Classificacoes, ResultadoIND,
+                            coluna_numerica, exibir_resultado)
+
+# Números, bordas das faixas, NaN e infinitos, e textos que avaliar aceita ou recusa.
+AMOSTRAS = [-1e9, -1, -0.5, 0, 0.3, 0.5, 1, 1.5, 2, 3, 10, 25, 1e9,
+            math.nan, math.inf, -math.inf,
+            '1.5', '2', '-1', ' 2', '1e3', 'abc', None, True]
+
+VETORIZAVEIS = [nome for nome in REGISTRO.nomes() if REGISTRO.classe(nome)._vetorizavel]
+
+
+def codigo_de_avaliar(avaliador, linha) -> int:
+    """O código de faixa que avaliar dá a uma linha; erros e valores sem faixa são SEM_FAIXA."""
+
+    resultado = avaliador.avaliar(*linha)
+
+    if resultado is None or resultado.classificacao == 'Erro':
+        return SEM_FAIXA
+
+    return avaliador._resultados.index(resultado)
+
+
+def test_coluna_numerica_segue_numerico() -> None:
+    """Só os valores que avaliar aceita são convertidos; NaN numérico continua válido."""
+
+    valores, invalidas = coluna_numerica([1, '2.5', '-1', ' 2', '1e3', None, math.nan])
+
+    assert invalidas.tolist() == [False, False, True, True, True, True, False]
+    assert valores[:2].tolist() == [1.0, 2.5]
+    assert np.isnan(valores[2:]).all()
+
+    valores, invalidas = coluna_numerica(np.array([1, 2, 3]))
+
+    assert valores.dtype == np.float64 and not invalidas.any()
+
+
+@pytest.mark.parametrize('nome', VETORIZAVEIS)
+def test_avaliar_many_concorda_com_avaliar(nome) -> None:
+    """O lote vetorizado dá a cada linha a mesma faixa que avaliar daria."""
+
+    avaliador = REGISTRO.avaliador(nome)
+    entradas = len(avaliador._assinatura.parameters)
+    linhas = list(itertools.product(AMOSTRAS if entradas <= 2 else AMOSTRAS[::3],
+                                    repeat=entradas))
+    colunas = [list(coluna) for coluna in zip(*linhas)]
+
+    codigos = avaliador.avaliar_many(*colunas).codigos.tolist()
+
+    assert codigos == [codigo_de_avaliar(avaliador, linha) for linha in linhas]
+
+
+@pytest.mark.parametrize('valor, classificacao', [
+    (-0.1, 'Crítico'),     # P/VP < 0
+    (0, 'Ótimo'), (0.8, 'Ótimo'),
+    (0.8001, 'Bom'), (1.2, 'Bom'),
+    (4, 'Alto'), (4.0001, 'Excessivo'),
+])
+def test_bordas_das_faixas(valor, classificacao) -> None:
+    """Os limites inclusivos ficam na faixa de baixo; os exclusivos passam para a de cima."""
+
+    resultado = REGISTRO.avaliador('PVPEvaluator').avaliar(valor)
+
+    assert resultado.classificacao == classificacao
+
+
+def classificacao_de_avaliar(avaliador, valor):
+    """A classificação que avaliar dá a um valor, ou None se ele não tiver faixa."""
+
+    resultado = avaliador.avaliar(valor)
+
+    return None if resultado is None else resultado.classificacao
+
+
+def test_lacunas_entre_faixas() -> None:
+    """Valores nas lacunas entre faixas, como Tag Along de 0,5%, não têm faixa."""
+
+    avaliador = REGISTRO.avaliador('TagAlongEvaluator')
+    valores = [0, 0.5, 1, 79.99, 80, 99, 99.5, 100]
+
+    assert avaliador.avaliar(0.5) is None
+    assert avaliador.avaliar(99.5) is None
+    assert avaliador.avaliar(101).classificacao == 'Erro'
+    assert avaliador.avaliar_many(valores).classificacoes() == \
+        [classificacao_de_avaliar(avaliador, valor) for valor in valores]
+
+
+def test_resultados_compartilhados() -> None:
+    """Avaliações da mesma faixa devolvem o mesmo resultado imutável."""
+
+    avaliador = REGISTRO.avaliador('ROEEvaluator')
+    resultado = avaliador.avaliar(18)
+
+    assert isinstance(resultado, ResultadoIND)
+    assert avaliador.avaliar(19) is resultado
+
+    with pytest.raises(AttributeError):
+        resultado.faixa = 'outra'
+
+
+def test_analiseativos_monta_as_classes_no_acesso() -> None:
+    """analiseativos só monta a classe de um avaliador quando ela é acessada pelo nome."""
+
+    vars(analiseativos).pop('ROAEvaluator', None)
+
+    assert 'ROAEvaluator' in dir(analiseativos)
+    assert 'ROAEvaluator' not in vars(analiseativos)
+
+    classe = analiseativos.ROAEvaluator
+
+    assert classe is REGISTRO.classe('ROAEvaluator')
+    assert issubclass(classe, AvaliadorBase)
+    assert vars(analiseativos)['ROAEvaluator'] is classe
+
+    with pytest.raises(AttributeError, match='NaoExisteEvaluator'):
+        analiseativos.NaoExisteEvaluator  # pylint: disable=pointless-statement
+
+
+def test_exibir_resultado(capsys) -> None:
+    """exibir_resultado continua exposto por analiseativos e imprime um atributo por linha."""
+
+    assert analiseativos.exibir_resultado is exibir_resultado
+
+    analiseativos.exibir_resultado(REGISTRO.avaliador('PVPEvaluator').avaliar(1.0))
+    linhas = capsys.readouterr().out.splitlines()
+
+    assert linhas[1:3] == ['Classificação: Bom', 'Faixa: 0.8 < P/VP <= 1.2']
+    assert linhas[-1] == '-' * 60
+
+
+def test_registro_avaliar_many() -> None:
+    """REGISTRO.avaliar_many avalia colunas pelo nome do avaliador, em listas ou arrays."""
+
+    lote = REGISTRO.avaliar_many('LucroLiquidoEvaluator', np.array([10.0, 1.0, 5.0]),
+                                 [100, 0, 'x'])
+
+    assert isinstance(lote, Classificacoes)
+    assert lote.codigos.dtype == np.int8
+    # Razão por zero e texto não numérico ficam sem faixa.
+    assert lote.codigos.tolist()[1:] == [SEM_FAIXA, SEM_FAIXA]
+    assert lote.resultado(0) is REGISTRO.avaliador('LucroLiquidoEvaluator').avaliar(10.0, 100)
+    assert lote.resultado(1) is None
+
+    with pytest.raises(KeyError):
+        REGISTRO.avaliar_many('NaoExisteEvaluator', [1])
+
+
+@pytest.mark.filterwarnings('error::RuntimeWarning')
+@pytest.mark.parametrize('nome', VETORIZAVEIS)
+def test_avaliar_many_sem_avisos_em_extremos(nome) -> None:
+    """Razões que transbordam, como 1e308 / 1e-308, não emitem avisos e seguem avaliar."""
+
+    avaliador = REGISTRO.avaliador(nome)
+    extremos = [1e308, -1e308, 1e-308, -5e-324, 0.0]
+    entradas = len(avaliador._assinatura.parameters)
+    linhas = list(itertools.product(extremos, repeat=entradas))
+    colunas = [list(coluna) for coluna in zip(*linhas)]
+
+    codigos = avaliador.avaliar_many(*colunas).codigos.tolist()
+
+    assert codigos == [codigo_de_avaliar(avaliador, linha) for linha in linhas]
@@ -0,0 +1,263 @@
+"""
+calculos_indicadores.py
+Cálculos dos avaliadores declarados no catálogo indicadores.json que não se resumem a uma razão
+entre duas entradas: Tag Along, Free Float, CAGR, Beta, WACC, FCD, FCF e Liquidez Seca. Cada
+função é registrada pelo nome usado na declaração do avaliador e recebe as entradas pelo nome;
+os erros são ValueError, com a mesma mensagem que o avaliador devolve no resultado de erro.
+"""
+
+from typing import Callable, Dict
+
+# Funções de cálculo pelo nome usado nas declarações dos avaliadores.
+CALCULOS: Dict[str, Callable] = {}
+
+
+def calculo(funcao: Callable) -> Callable:
+    """Registra uma função de cálculo pelo seu nome."""
+
+    CALCULOS[funcao.__name__] = funcao
+
+    return funcao
+
+
+def numerico(valor) -> bool:
+    """Indica se um valor é número, ou texto de um número sem sinal, como '1.5'."""
+
+    return isinstance(valor, (int, float)) or (isinstance(valor, str)
+                                               and valor.replace('.', '', 1).isdigit())
+
+
+def _validar(valores) -> None:
+    """Exige que cada valor, dado com o seu nome, seja numérico."""
+
+    for valor, nome in valores:
+        if not numerico(valor):
+            raise ValueError(f'O valor de {nome} deve ser numérico.')
+
+
+@calculo
+def validar_tag_along(tag_along):
+    """Valida o percentual de Tag Along, que deve ser numérico e estar entre 0% e 100%."""
+
+    try:
+        if not numerico(tag_along):
+            raise ValueError('O valor do Tag Along deve ser numérico.')
+
+        tag_along = float(tag_along)
+
+        if tag_along < 0 or tag_along > 100:
+            raise ValueError('O Tag Along deve estar entre 0% e 100%.')
+
+        return tag_along
+    except Exception as e:
+        raise ValueError(f'Erro ao validar o Tag Along: {str(e)}') from e
+
+
+@calculo
+def calcular_free_float(acoes_em_circulacao, acoes_restritas, total_acoes):
+    """Calcula o Free Float, em percentual do total de ações."""
+
+    try:
+        _validar([(acoes_em_circulacao, 'Ações em Circulação'),
+                  (acoes_restritas, 'Ações Restritas'),
+                  (total_acoes, 'Total de Ações')])
+
+        acoes_em_circulacao = float(acoes_em_circulacao)
+        acoes_restritas = float(acoes_restritas)
+        total_acoes = float(total_acoes)
+
+        if total_acoes <= 0:
+            raise ValueError('O total de ações deve ser maior que zero.')
+        if acoes_restritas > acoes_em_circulacao:
+            raise ValueError('As ações restritas não podem exceder as ações em circulação.')
+
+        return ((acoes_em_circulacao - acoes_restritas) / total_acoes) * 100
+    except Exception as e:
+        raise ValueError(f'Erro ao calcular o Free Float: {str(e)}') from e
+
+
+def _cagr(valor_inicial, valor_final, anos, nomes, mensagem_inicial):
+    """Calcula o CAGR entre dois valores; nomes e mensagem_inicial mudam com o indicador."""
+
+    try:
+        _validar(zip((valor_inicial, valor_final, anos), nomes))
+
+        valor_inicial = float(valor_inicial)
+        valor_final = float(valor_final)
+        anos = float(anos)
+
+        if valor_inicial <= 0:
+            raise ValueError(mensagem_inicial)
+        if anos <= 0:
+            raise ValueError('O número de anos deve ser maior que zero.')
+
+        return (valor_final / valor_inicial) ** (1 / anos) - 1
+    except Exception as e:
+        raise ValueError(f'Erro ao calcular o CAGR: {str(e)}') from e
+
+
+@calculo
+def calcular_cagr_lucros(valor_inicial, valor_final, anos=5):
+    """Calcula o CAGR dos lucros líquidos."""
+
+    return _cagr(valor_inicial, valor_final, anos,
+                 ('Valor Inicial do Lucro Líquido', 'Valor Final do Lucro Líquido',
+                  'Número de Anos'),
+                 'O valor inicial do lucro líquido deve ser maior que zero.')
+
+
+@calculo
+def calcular_cagr_receitas(valor_inicial, valor_final, anos=5):
+    """Calcula o CAGR das receitas."""
+
+    return _cagr(valor_inicial, valor_final, anos,
+                 ('Valor Inicial', 'Valor Final', 'Número de Anos'),
+                 'O valor inicial das receitas deve ser maior que zero.')
+
+
+@calculo
+def calcular_beta(retornos_acao, retornos_mercado):
+    """
+    Calcula o Beta: a covariância dos retornos da ação com os do mercado sobre a variância
+    destes.
+    """
+
+    try:
+        if not isinstance(retornos_acao, (list, tuple)) \
+                or not isinstance(retornos_mercado, (list, tuple)):
+            raise ValueError('Retornos da ação e do mercado devem ser listas ou tuplas.')
+        if len(retornos_acao) != len(retornos_mercado):
+            raise ValueError('Retornos da ação e do mercado devem ter o mesmo tamanho.')
+        if len(retornos_acao) < 2:
+            raise ValueError('É necessário pelo menos dois períodos de retornos '
+                             'para calcular o Beta.')
+
+        for r_a, r_m in zip(retornos_acao, retornos_mercado):
+            if not numerico(r_a):
+                raise ValueError('Os retornos da ação devem ser numéricos.')
+            if not numerico(r_m):
+                raise ValueError('Os retornos do mercado devem ser numéricos.')
+
+        retornos_acao = [float(r) for r in retornos_acao]
+        retornos_mercado = [float(r) for r in retornos_mercado]
+
+        media_acao = sum(retornos_acao) / len(retornos_acao)
+        media_mercado = sum(retornos_mercado) / len(retornos_mercado)
+        covariancia = sum((r_a - media_acao) * (r_m - media_mercado)
+                          for r_a, r_m in zip(retornos_acao, retornos_mercado)) \
+            / (len(retornos_acao) - 1)
+        variancia_mercado = sum((r_m - media_mercado) ** 2
+                                for r_m in retornos_mercado) / (len(retornos_mercado) - 1)
+
+        if variancia_mercado == 0:
+            raise ValueError('A variância dos retornos do mercado não pode ser zero.')
+
+        return covariancia / variancia_mercado
+    except Exception as e:
+        raise ValueError(f'Erro ao calcular o Beta: {str(e)}') from e
+
+
+@calculo
+def calcular_wacc(equity, divida, custo_equity, custo_divida, taxa_imposto):
+    """Calcula o custo médio ponderado de capital (WACC)."""
+
+    try:
+        _validar([(equity, 'Equity'),
+                  (divida, 'Dívida'),
+                  (custo_equity, 'Custo do Equity'),
+                  (custo_divida, 'Custo da Dívida'),
+                  (taxa_imposto, 'Taxa de Imposto')])
+
+        equity = float(equity)
+        divida = float(divida)
+        custo_equity = float(custo_equity)
+        custo_divida = float(custo_divida)
+        taxa_imposto = float(taxa_imposto)
+
+        valor_total = equity + divida
+        if valor_total == 0:
+            raise ValueError('O valor total (Equity + Dívida) não pode ser zero.')
+
+        proporcao_equity = equity / valor_total
+        proporcao_divida = divida / valor_total
+
+        return (proporcao_equity * custo_equity) \
+            + (proporcao_divida * custo_divida * (1 - taxa_imposto))
+    except Exception as e:
+        raise ValueError(f'Erro ao calcular o WACC: {str(e)}') from e
+
+
+@calculo
+def calcular_fcd(fcffs_projetados, wacc, taxa_crescimento_perpetuo, anos_projetados):
+    """
+    Calcula o Fluxo de Caixa Descontado: os FCFFs projetados e a perpetuidade, a valor
+    presente.
+    """
+
+    try:
+        if not isinstance(fcffs_projetados, (list, tuple)) \
+                or len(fcffs_projetados) != anos_projetados:
+            raise ValueError('fcffs_projetados deve ser uma lista com tamanho igual '
+                             'a anos_projetados.')
+        for fcff in fcffs_projetados:
+            if not numerico(fcff):
+                raise ValueError('Cada FCFF projetado deve ser numérico.')
+        if not numerico(wacc):
+            raise ValueError('O WACC deve ser numérico.')
+        if not numerico(taxa_crescimento_perpetuo):
+            raise ValueError('A taxa de crescimento perpétuo deve ser numérica.')
+        if not isinstance(anos_projetados, int) or anos_projetados <= 0:
+            raise ValueError('anos_projetados deve ser um inteiro positivo.')
+
+        wacc = float(wacc)
+        taxa_crescimento_perpetuo = float(taxa_crescimento_perpetuo)
+        fcffs_projetados = [float(fcff) for fcff in fcffs_projetados]
+
+        if wacc <= taxa_crescimento_perpetuo:
+            raise ValueError('O WACC deve ser maior que a taxa de crescimento perpétuo '
+                             'para calcular o valor terminal.')
+
+        valor_presente_fcffs = 0
+        for t in range(1, anos_projetados + 1):
+            valor_presente_fcffs += fcffs_projetados[t - 1] / ((1 + wacc) ** t)
+
+        fcff_terminal = fcffs_projetados[-1] * (1 + taxa_crescimento_perpetuo)
+        valor_terminal = fcff_terminal / (wacc - taxa_crescimento_perpetuo)
+        valor_terminal_presente = valor_terminal / ((1 + wacc) ** anos_projetados)
+
+        return valor_presente_fcffs + valor_terminal_presente
+    except Exception as e:
+        raise ValueError(f'Erro ao calcular o FCD: {str(e)}') from e
+
+
+@calculo
+def calcular_fcf(ebit, taxa_imposto, depreciacao_amortizacao, variacao_capital_giro, capex):
+    """Calcula o Fluxo de Caixa Livre."""
+
+    try:
+        _validar([(ebit, 'EBIT'),
+                  (taxa_imposto, 'Taxa de Imposto'),
+                  (depreciacao_amortizacao, 'Depreciação e Amortização'),
+                  (variacao_capital_giro, 'Variação no Capital de Giro'),
+                  (capex, 'CAPEX')])
+
+        ebit = float(ebit)
+        taxa_imposto = float(taxa_imposto)
+        depreciacao_amortizacao = float(depreciacao_amortizacao)
+        variacao_capital_giro = float(variacao_capital_giro)
+        capex = float(capex)
+
+        return (ebit * (1 - taxa_imposto)) + depreciacao_amortizacao \
+            - variacao_capital_giro - capex
+    except Exception as e:
+        raise ValueError(f'Erro ao calcular o FCF: {str(e)}') from e
+
+
+@calculo
+def calcular_liquidez_seca(ativo_circulante, estoques, passivo_circulante):
+    """Calcula a Liquidez Seca: o ativo circulante sem os estoques sobre o passivo circulante."""
+
+    if passivo_circulante == 0:
+        raise ValueError('O Passivo Circulante não pode ser zero para calcular a Liquidez Seca.')
+
+    return (ativo_circulante - estoques) / passivo_circulante
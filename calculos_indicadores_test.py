@@ -0,0 +1,91 @@
+"""
+calculos_indicadores_test.py
+Testes dos cálculos dos avaliadores: valores, textos de erro e o encadeamento das exceções.
+"""
+
+import pytest
+
+from calculos_indicadores import (CALCULOS, calcular_beta, calcular_cagr_lucros,
+                                  calcular_cagr_receitas, calcular_fcd, calcular_fcf,
+                                  calcular_free_float, calcular_liquidez_seca, calcular_wacc,
+                                  numerico, validar_tag_along)
+
+
+def test_calculos_registrados_pelo_nome() -> None:
+    """Cada função é registrada pelo nome usado nas declarações dos avaliadores."""
+
+    assert CALCULOS['calcular_wacc'] is calcular_wacc
+    assert set(CALCULOS) == {'validar_tag_along', 'calcular_free_float', 'calcular_cagr_lucros',
+                             'calcular_cagr_receitas', 'calcular_beta', 'calcular_wacc',
+                             'calcular_fcd', 'calcular_fcf', 'calcular_liquidez_seca'}
+
+
+@pytest.mark.parametrize('valor, esperado', [
+    (1, True), (1.5, True), (True, True), ('1.5', True), ('10', True),
+    ('-1', False), (' 2', False), ('1e3', False), ('1.2.3', False), ('', False), (None, False),
+])
+def test_numerico(valor, esperado) -> None:
+    """Só números e textos de números sem sinal, espaço ou expoente são numéricos."""
+
+    assert numerico(valor) is esperado
+
+
+def test_valores_calculados() -> None:
+    """Os cálculos devolvem os valores das fórmulas."""
+
+    assert validar_tag_along('80') == 80.0
+    assert calcular_free_float(100, 20, 200) == pytest.approx(40.0)
+    assert calcular_cagr_lucros(100, 121, 2) == pytest.approx(0.1)
+    assert calcular_cagr_receitas(100, 100) == pytest.approx(0.0)
+    assert calcular_beta([1, 2, 3], [1, 2, 3]) == pytest.approx(1.0)
+    assert calcular_wacc(50, 50, 0.1, 0.1, 0) == pytest.approx(0.1)
+    assert calcular_fcd([100], 0.1, 0, 1) == pytest.approx(100 / 1.1 + 1000 / 1.1)
+    assert calcular_fcf(100, 0.3, 10, 5, 20) == pytest.approx(55.0)
+    assert calcular_liquidez_seca(200, 50, 100) == pytest.approx(1.5)
+
+
+@pytest.mark.parametrize('funcao, argumentos, mensagem', [
+    (validar_tag_along, ('x',),
+     'Erro ao validar o Tag Along: O valor do Tag Along deve ser numérico.'),
+    (validar_tag_along, (101,),
+     'Erro ao validar o Tag Along: O Tag Along deve estar entre 0% e 100%.'),
+    (calcular_free_float, (10, 20, 100),
+     'Erro ao calcular o Free Float: As ações restritas não podem exceder as ações em '
+     'circulação.'),
+    (calcular_free_float, (10, 'x', 100),
+     'Erro ao calcular o Free Float: O valor de Ações Restritas deve ser numérico.'),
+    (calcular_cagr_lucros, (0, 10, 5),
+     'Erro ao calcular o CAGR: O valor inicial do lucro líquido deve ser maior que zero.'),
+    (calcular_cagr_receitas, (10, 20, 0),
+     'Erro ao calcular o CAGR: O número de anos deve ser maior que zero.'),
+    (calcular_beta, ([1], [1]),
+     'Erro ao calcular o Beta: É necessário pelo menos dois períodos de retornos para '
+     'calcular o Beta.'),
+    (calcular_beta, ([1, 2], [1, 1]),
+     'Erro ao calcular o Beta: A variância dos retornos do mercado não pode ser zero.'),
+    (calcular_wacc, (0, 0, 0.1, 0.1, 0.3),
+     'Erro ao calcular o WACC: O valor total (Equity + Dívida) não pode ser zero.'),
+    (calcular_fcd, ([100], 0.05, 0.05, 1),
+     'Erro ao calcular o FCD: O WACC deve ser maior que a taxa de crescimento perpétuo para '
+     'calcular o valor terminal.'),
+    (calcular_fcd, ([100], 0.1, 0, 2),
+     'Erro ao calcular o FCD: fcffs_projetados deve ser uma lista com tamanho igual a '
+     'anos_projetados.'),
+    (calcular_fcf, ('x', 0.3, 10, 5, 20),
+     'Erro ao calcular o FCF: O valor de EBIT deve ser numérico.'),
+])
+def test_textos_de_erro(funcao, argumentos, mensagem) -> None:
+    """Os erros são ValueError com o texto do avaliador, encadeados ao erro original."""
+
+    with pytest.raises(ValueError) as erro:
+        funcao(*argumentos)
+
+    assert str(erro.value) == mensagem
+    assert isinstance(erro.value.__cause__, ValueError)
+
+
+def test_liquidez_seca_sem_passivo() -> None:
+    """A Liquidez Seca não é calculada com passivo circulante zero."""
+
+    with pytest.raises(ValueError, match='O Passivo Circulante não pode ser zero'):
+        calcular_liquidez_seca(100, 10, 0)
@@ -0,0 +1,294 @@
+"""
+catalogo_indicadores.py
+Catálogo único e versionado dos indicadores, em indicadores.json:
+- indicadores: as faixas e os textos de cada função evaluate_*, uma vez por indicador; p_l,
+  p_vp e p_ebitda têm também as declarações próprias de indicadores_selecionados;
+- modulos: as funções que analisefundamentalista e indicadores_selecionados expõem e o indicador
+  de cada uma;
+- metricas: as faixas por categoria de financial_metrics_to_excel.py, com as faixas de referência
+  e os nomes que eram exportados em indicadores_completo.json;
+- avaliadores: as declarações dos avaliadores de analiseativos.py;
+- conflitos: as faixas que as métricas e os avaliadores dão a um indicador e que divergem das
+  suas faixas em indicadores.
+As métricas e os avaliadores que medem a mesma grandeza de um indicador apontam para ele pelo campo
+'indicador'. As três seções foram escritas para usos diferentes e não foram unificadas: as
+métricas usam as seis categorias da planilha, muitas vezes com percentuais em fração (ROE 0.15,
+não 15); os avaliadores têm as suas próprias classificações (Bom, Elevado, Excessivo) e
+limites. Assim, o P/L de 8 é Ótimo em indicadores, Bom nas métricas (5 a 10) e Ótimo no
+PLEvaluator, mas o de 12 é Moderado em indicadores e nas métricas e Bom no PLEvaluator. Todas as
+divergências restantes estão na seção conflitos, que CatalogoIndicadores.conflitos() recalcula a
+partir das faixas.
+O arquivo é lido uma única vez por processo. Uma forma binária (marshal, que não executa código
+ao ser lido) pode ser gerada por um passo explícito, python catalogo_indicadores.py, no diretório
+de cache do usuário ($XDG_CACHE_HOME/pyfundamentus ou ~/.cache/pyfundamentus). Ela é identificada
+pelo hash do conteúdo do JSON: enquanto o JSON não muda, as execuções a carregam em vez de
+interpretar o JSON; quando muda, o JSON é lido de novo. Ler o catálogo nunca grava arquivos.
+"""
+
+import hashlib
+import json
+import marshal
+import math
+import os
+import sys
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+# Catálogo dos indicadores, ao lado deste módulo.
+CAMINHO_CATALOGO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'indicadores.json')
+
+# Formato da forma binária; mudar o que é guardado nela exige mudar este número.
+FORMATO_CACHE = 2
+
+# Diretório de cache do usuário, onde a forma binária é gerada.
+DIRETORIO_CACHE = os.path.join(os.environ.get('XDG_CACHE_HOME')
+                               or os.path.join(os.path.expanduser('~'), '.cache'),
+                               'pyfundamentus')
+
+# Categorias das métricas, na ordem da planilha, e o nome exibido de cada uma.
+CATEGORIAS = {
+    'critico': 'Crítico',
+    'pessimo': 'Péssimo',
+    'ruim': 'Ruim',
+    'moderado': 'Moderado',
+    'bom': 'Bom',
+    'otimo': 'Ótimo',
+}
+
+
+def _limite(valor: Optional[float], infinito: float) -> float:
+    """Converte o limite de uma categoria; null é o infinito do lado correspondente."""
+
+    return infinito if valor is None else valor
+
+
+def _intervalos(faixas: List[Tuple]) -> List[Tuple]:
+    """Ordena (inferior, superior, classificação); a faixa sem limites fica no fim."""
+
+    return sorted(faixas, key=lambda faixa: (faixa[0] is None and faixa[1] is None,
+                                              _limite(faixa[0], -math.inf),
+                                              _limite(faixa[1], math.inf)))
+
+
+def _texto_intervalos(faixas: List[Tuple]) -> List[str]:
+    """Escreve as faixas como '0 a 10: Ótimo', com -inf e inf; a faixa sem limites é 'demais'."""
+
+    return [f'{_limite(inferior, -math.inf)} a {_limite(superior, math.inf)}: {classificacao}'
+            if inferior is not None or superior is not None else f'demais: {classificacao}'
+            for inferior, superior, classificacao in faixas]
+
+
+class CatalogoIndicadores:
+    """
+    Catálogo dos indicadores lido de um arquivo JSON. O conteúdo é carregado na primeira
+    consulta, da forma binária quando há uma gerada para o conteúdo atual, e compartilhado por
+    todos os módulos.
+    """
+
+    def __init__(self, caminho: str = CAMINHO_CATALOGO, diretorio_cache: str = DIRETORIO_CACHE):
+        self.__caminho = caminho
+        self.__diretorio_cache = diretorio_cache
+        self.__dados: Optional[Dict] = None
+
+    def __dados_lidos(self) -> Dict:
+        """Carrega o catálogo, uma única vez."""
+
+        if self.__dados is None:
+            self.__dados = self.__carregar()
+
+        return self.__dados
+
+    def __ler(self) -> bytes:
+        """Lê o conteúdo do JSON."""
+
+        with open(self.__caminho, 'rb') as arquivo:
+            return arquivo.read()
+
+    def __chave(self, conteudo: bytes) -> str:
+        """Hash do conteúdo do JSON, do formato da forma binária e da versão do marshal."""
+
+        prefixo = f'{FORMATO_CACHE}:{marshal.version}:{sys.version_info[:2]}:'.encode()
+
+        return hashlib.sha256(prefixo + conteudo).hexdigest()
+
+    def __prefixo_cache(self) -> str:
+        """Início do nome das formas binárias deste catálogo, como 'indicadores-'."""
+
+        return os.path.splitext(os.path.basename(self.__caminho))[0] + '-'
+
+    def caminho_cache(self, chave: str) -> str:
+        """Caminho da forma binária do conteúdo de uma chave."""
+
+        return os.path.join(self.__diretorio_cache, f'{self.__prefixo_cache()}{chave}.marshal')
+
+    def __carregar(self) -> Dict:
+        """Lê a forma binária do conteúdo atual, se foi gerada, ou o JSON. Não grava nada."""
+
+        conteudo = self.__ler()
+        chave = self.__chave(conteudo)
+
+        try:
+            with open(self.caminho_cache(chave), 'rb') as arquivo:
+                guardada, dados = marshal.load(arquivo)
+            if guardada == chave:
+                return dados
+        except (OSError, EOFError, ValueError, TypeError):
+            # Ausente, corrompida ou de outro formato: o JSON é a fonte.
+            pass
+
+        return json.loads(conteudo)
+
+    def compilar(self) -> str:
+        """
+        Gera a forma binária do conteúdo atual no diretório de cache, de uma só vez, e remove as
+        formas binárias de conteúdos anteriores. Devolve o caminho gerado.
+        """
+        conteudo = self.__ler()
+        chave = self.__chave(conteudo)
+        destino = self.caminho_cache(chave)
+
+        os.makedirs(self.__diretorio_cache, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(dir=self.__diretorio_cache, suffix='.tmp')
+
+        try:
+            with os.fdopen(descritor, 'wb') as arquivo:
+                marshal.dump((chave, json.loads(conteudo)), arquivo)
+            os.replace(temporario, destino)
+        except BaseException:
+            os.remove(temporario)
+            raise
+
+        for nome in os.listdir(self.__diretorio_cache):
+            caminho = os.path.join(self.__diretorio_cache, nome)
+            if nome.startswith(self.__prefixo_cache()) and nome.endswith('.marshal') \
+                    and caminho != destino:
+                os.remove(caminho)
+
+        return destino
+
+    @property
+    def versao(self) -> int:
+        """Versão do catálogo."""
+
+        return self.__dados_lidos()['versao']
+
+    def indicadores(self) -> List[str]:
+        """Lista os indicadores das funções evaluate_*, sem o prefixo, como 'p_l'."""
+
+        return list(self.__dados_lidos()['indicadores'])
+
+    def indicador(self, chave: str) -> Dict:
+        """Devolve a declaração de um indicador. Levanta KeyError se ele não existir."""
+
+        return self.__dados_lidos()['indicadores'][chave]
+
+    def modulo(self, nome: str) -> Dict[str, str]:
+        """
+        Devolve as funções que um módulo, como 'analisefundamentalista', expõe: o nome sem o
+        prefixo evaluate_, como 'p_l', e o indicador declarado de que ela é montada.
+        """
+
+        return self.__dados_lidos()['modulos'][nome]
+
+    def avaliadores(self) -> Dict[str, Dict]:
+        """Declarações dos avaliadores de analiseativos, pelo nome da classe."""
+
+        return self.__dados_lidos()['avaliadores']
+
+    def metricas(self) -> Dict[str, Dict]:
+        """
+        Devolve as métricas no formato de financial_metrics: por métrica, o intervalo de cada
+        categoria ({'min', 'max'}, com -inf e inf), 'descricao', 'agrupador' e 'descr<categoria>'.
+        """
+        metricas = {}
+
+        for rotulo, metrica in self.__dados_lidos()['metricas'].items():
+            categorias = metrica['categorias']
+            dados = {categoria: {'min': _limite(categorias[categoria]['min'], -math.inf),
+                                 'max': _limite(categorias[categoria]['max'], math.inf)}
+                     for categoria in CATEGORIAS}
+            dados['descricao'] = metrica['descricao']
+            dados['agrupador'] = metrica['agrupador']
+            dados.update((f'descr{categoria}', categorias[categoria]['descricao'])
+                         for categoria in CATEGORIAS)
+            metricas[rotulo] = dados
+
+        return metricas
+
+    def __faixas_vinculadas(self, chave: str) -> Dict[str, List[Tuple]]:
+        """
+        As faixas de um indicador, em 'indicadores', e as das métricas ('metricas:<rótulo>') e dos
+        avaliadores ('avaliadores:<classe>') que apontam para ele, como (inferior, superior,
+        classificação).
+        """
+        dados = self.__dados_lidos()
+        vinculadas = {'indicadores': _intervalos([
+            (faixa['inferior'], faixa['superior'], faixa['classificacao'])
+            for faixa in dados['indicadores'][chave]['faixas']])}
+
+        for rotulo, metrica in dados['metricas'].items():
+            if metrica.get('indicador') == chave:
+                vinculadas[f'metricas:{rotulo}'] = _intervalos([
+                    (metrica['categorias'][categoria]['min'],
+                     metrica['categorias'][categoria]['max'], nome)
+                    for categoria, nome in CATEGORIAS.items()])
+
+        for classe, avaliador in dados['avaliadores'].items():
+            if avaliador.get('indicador') == chave:
+                vinculadas[f'avaliadores:{classe}'] = _intervalos([
+                    (faixa['inferior'], faixa['superior'], faixa['classificacao'])
+                    for faixa in avaliador['faixas']])
+
+        return vinculadas
+
+    def conflitos(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Recalcula as divergências entre as seções: por indicador, as suas faixas e as das
+        métricas e avaliadores vinculados cujos limites ou classificações diferem delas. Os
+        textos e a inclusividade dos limites não são comparados.
+        """
+        conflitos = {}
+
+        for chave in self.indicadores():
+            vinculadas = self.__faixas_vinculadas(chave)
+            divergentes = {nome: _texto_intervalos(faixas) for nome, faixas in vinculadas.items()
+                           if faixas != vinculadas['indicadores']}
+            if divergentes:
+                conflitos[chave] = {'indicadores': _texto_intervalos(vinculadas['indicadores']),
+                                    **divergentes}
+
+        return conflitos
+
+    def conflitos_documentados(self) -> Dict[str, Dict[str, List[str]]]:
+        """Devolve a seção conflitos do catálogo, que documenta as divergências conhecidas."""
+
+        return self.__dados_lidos()['conflitos']
+
+    def interpretacoes(self) -> List[Dict[str, str]]:
+        """
+        Devolve uma linha por métrica e categoria, com as colunas de indicadores_completo.json:
+        Indicador, Classificação, Faixa de Referência, Interpretação e Classificação2.
+        """
+        linhas = []
+
+        for metrica in self.__dados_lidos()['metricas'].values():
+            for categoria, nome in CATEGORIAS.items():
+                dados = metrica['categorias'][categoria]
+                linhas.append({
+                    'Indicador': metrica['nome'],
+                    'Classificação': nome,
+                    'Faixa de Referência': dados.get('referencia', ''),
+                    'Interpretação': dados['descricao'],
+                    'Classificação2': nome,
+                })
+
+        return linhas
+
+
+# Catálogo compartilhado, com o conteúdo de indicadores.json.
+CATALOGO = CatalogoIndicadores()
+
+
+if __name__ == '__main__':
+    # Passo explícito de compilação: gera a forma binária do catálogo atual.
+    print(f'Catálogo versão {CATALOGO.versao} compilado em {CATALOGO.compilar()}')
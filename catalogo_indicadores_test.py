@@ -0,0 +1,106 @@
+"""
+catalogo_indicadores_test.py
+Testes do catálogo dos indicadores: leitura sem gravação e a forma binária gerada pelo passo de
+compilação, identificada pelo hash do conteúdo.
+"""
+
+import json
+import os
+
+from catalogo_indicadores import CAMINHO_CATALOGO, CATALOGO, CatalogoIndicadores
+
+
+def copiar_catalogo(destino) -> str:
+    """Copia indicadores.json para um diretório de teste e devolve o caminho da cópia."""
+
+    caminho = os.path.join(destino, 'indicadores.json')
+
+    with open(CAMINHO_CATALOGO, 'rb') as origem, open(caminho, 'wb') as copia:
+        copia.write(origem.read())
+
+    return caminho
+
+
+def test_ler_nao_grava(tmp_path) -> None:
+    """Consultar o catálogo não cria arquivos, nem ao lado do JSON nem no cache."""
+
+    caminho = copiar_catalogo(tmp_path)
+    catalogo = CatalogoIndicadores(caminho, str(tmp_path / 'cache'))
+
+    assert catalogo.versao == CATALOGO.versao
+    assert catalogo.indicadores() == CATALOGO.indicadores()
+    assert os.listdir(tmp_path) == ['indicadores.json']
+
+
+def test_compilar_e_carregar(tmp_path) -> None:
+    """A forma binária compilada é usada enquanto o conteúdo do JSON não muda."""
+
+    caminho = copiar_catalogo(tmp_path)
+    cache = tmp_path / 'cache'
+    anterior = CatalogoIndicadores(caminho, str(cache)).compilar()
+
+    assert os.path.basename(anterior).startswith('indicadores-')
+    assert CatalogoIndicadores(caminho, str(cache)).metricas() == CATALOGO.metricas()
+
+    # Um conteúdo novo não corresponde à forma binária anterior: o JSON é lido de novo.
+    with open(caminho, encoding='utf-8') as arquivo:
+        dados = json.load(arquivo)
+    dados['versao'] += 1
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(dados, arquivo, ensure_ascii=False)
+
+    assert CatalogoIndicadores(caminho, str(cache)).versao == CATALOGO.versao + 1
+
+    # Compilar de novo substitui a forma binária do conteúdo anterior.
+    atual = CatalogoIndicadores(caminho, str(cache)).compilar()
+
+    assert atual != anterior
+    assert os.listdir(cache) == [os.path.basename(atual)]
+    assert CatalogoIndicadores(caminho, str(cache)).versao == CATALOGO.versao + 1
+
+
+def test_forma_binaria_invalida(tmp_path) -> None:
+    """Uma forma binária corrompida é ignorada e o JSON é lido."""
+
+    caminho = copiar_catalogo(tmp_path)
+    destino = CatalogoIndicadores(caminho, str(tmp_path / 'cache')).compilar()
+
+    with open(destino, 'wb') as arquivo:
+        arquivo.write(b'corrompida')
+
+    assert CatalogoIndicadores(caminho, str(tmp_path / 'cache')).versao == CATALOGO.versao
+
+
+def test_conflitos_documentados() -> None:
+    """A seção conflitos lista todas as divergências entre as faixas das seções, e só elas."""
+
+    assert CATALOGO.conflitos() == CATALOGO.conflitos_documentados()
+
+    # O P/L de 12 é Moderado em indicadores e nas métricas, mas Bom no PLEvaluator.
+    p_l = CATALOGO.conflitos()['p_l']
+
+    assert '10 a 15: Moderado' in p_l['indicadores']
+    assert '10 a 15: Moderado' in p_l['metricas:P/L']
+    assert '10 a 15: Bom' in p_l['avaliadores:PLEvaluator']
+
+
+def test_conflito_novo_aparece(tmp_path) -> None:
+    """Mudar as faixas de um avaliador vinculado muda as divergências calculadas."""
+
+    caminho = copiar_catalogo(tmp_path)
+
+    with open(caminho, encoding='utf-8') as arquivo:
+        dados = json.load(arquivo)
+
+    dados['avaliadores']['PLEvaluator']['faixas'] = dados['indicadores']['p_l']['faixas']
+    dados['avaliadores']['VPAEvaluator']['indicador'] = 'vpa'
+
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(dados, arquivo)
+
+    catalogo = CatalogoIndicadores(caminho, str(tmp_path / 'cache'))
+    conflitos = catalogo.conflitos()
+
+    assert 'avaliadores:PLEvaluator' not in conflitos['p_l']
+    assert 'avaliadores:VPAEvaluator' in conflitos['vpa']
+    assert conflitos != catalogo.conflitos_documentados()
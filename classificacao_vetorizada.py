@@ -0,0 +1,446 @@
+"""
+classificacao_vetorizada.py
+Motor de classificação vetorizada dos indicadores do catálogo (catalogo_indicadores.py).
+As faixas de cada indicador são lidas uma única vez da sua declaração e guardadas em vetores
+ordenados de limites. Uma coluna inteira de valores é classificada com numpy.searchsorted em uma
+só chamada, devolvendo códigos inteiros de faixa que apontam para resultados criados uma vez por
+faixa, em vez de montar um dicionário de textos para cada valor.
+Os resultados são registros imutáveis (ResultadoFaixa), compartilhados por todas as avaliações
+da mesma faixa. As funções evaluate_* de analisefundamentalista e indicadores_selecionados são
+montadas aqui, a partir do catálogo, e devolvem esses registros.
+"""
+
+import inspect
+import logging
+import math
+from bisect import bisect_left
+from collections.abc import Mapping as MapeamentoAbstrato
+from typing import (Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional,
+                    Sequence, Tuple)
+
+import numpy as np
+
+from catalogo_indicadores import CATALOGO
+
+LOGGER = logging.getLogger(__name__)
+
+# Código dos valores que não caem em nenhuma faixa, como NaN.
+SEM_FAIXA = -1
+
+# Valor a partir do qual os indicadores monetários dividem o valor pela escala declarada.
+LIMIAR_ESCALA = 1_000_000
+
+
+class Faixa(NamedTuple):
+    """
+    Intervalo de uma faixa, com os limites e se cada um pertence a ela. Uma faixa sem limite
+    inferior ou superior, como "x < 0" ou "x > 4", inclui -inf ou inf.
+    """
+
+    inferior: float
+    inferior_inclusivo: bool
+    superior: float
+    superior_inclusivo: bool
+
+
+class ResultadoFaixa(MapeamentoAbstrato):
+    """
+    Resultado imutável da avaliação de um indicador em uma faixa. É criado uma vez por faixa e
+    compartilhado; aceita acesso como dicionário (resultado['faixa']) e por atributo. Os campos
+    riscos e referencia_cruzada só existem nas funções que os devolvem.
+    """
+
+    CAMPOS = ('classificacao', 'faixa', 'descricao', 'definicao', 'agrupador', 'formula',
+              'riscos', 'referencia_cruzada')
+
+    __slots__ = CAMPOS + ('_chaves',)
+
+    def __init__(self, classificacao: str, faixa: str, descricao: str, definicao: str,
+                 agrupador: str, formula: str, riscos: Optional[str] = None,
+                 referencia_cruzada: Optional[str] = None):
+        valores = (classificacao, faixa, descricao, definicao, agrupador, formula,
+                   riscos, referencia_cruzada)
+
+        for nome, valor in zip(self.CAMPOS, valores):
+            object.__setattr__(self, nome, valor)
+
+        object.__setattr__(self, '_chaves', tuple(nome for nome, valor in zip(self.CAMPOS, valores)
+                                                  if valor is not None))
+
+    @classmethod
+    def do_dicionario(cls, resultado: Optional[Mapping]) -> Optional['ResultadoFaixa']:
+        """Converte o dicionário devolvido por uma função evaluate_*."""
+
+        if resultado is None or isinstance(resultado, cls):
+            return resultado
+
+        return cls(**{nome: resultado[nome] for nome in cls.CAMPOS if nome in resultado})
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError(f'{type(self).__name__} é imutável.')
+
+    def __delattr__(self, nome):
+        raise AttributeError(f'{type(self).__name__} é imutável.')
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, nome) for nome in self.CAMPOS)
+
+    def __getitem__(self, chave: str) -> str:
+        if chave not in self._chaves:
+            raise KeyError(chave)
+
+        return getattr(self, chave)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._chaves)
+
+    def __len__(self) -> int:
+        return len(self._chaves)
+
+    def __repr__(self) -> str:
+        return f'<ResultadoFaixa: {self.classificacao} | Faixa: {self.faixa}>'
+
+    def to_dict(self) -> Dict[str, str]:
+        """Devolve uma cópia do resultado como dicionário."""
+
+        return dict(self.items())
+
+
+def _contiguas(anterior: Faixa, faixa: Faixa) -> bool:
+    """Indica se uma faixa começa exatamente onde a anterior termina."""
+
+    return (faixa.inferior, faixa.inferior_inclusivo) == (anterior.superior,
+                                                          not anterior.superior_inclusivo)
+
+
+def segmentar(faixas: Sequence[Faixa]) -> Tuple[List[float], List[bool], List[int]]:
+    """
+    Divide a reta em segmentos consecutivos: as faixas e as lacunas entre elas. Devolve o limite
+    superior de cada segmento, se o limite pertence a ele e o código do segmento, que é a
+    posição da faixa ou SEM_FAIXA para as lacunas.
+    """
+    limites: List[float] = []
+    inclusivos: List[bool] = []
+    codigos: List[int] = []
+
+    # A reta começa em -inf, fora de qualquer faixa.
+    anterior = Faixa(-np.inf, False, -np.inf, False)
+
+    for codigo, faixa in enumerate(faixas):
+        if not _contiguas(anterior, faixa) and faixa.inferior != -np.inf:
+            limites.append(faixa.inferior)
+            inclusivos.append(not faixa.inferior_inclusivo)
+            codigos.append(SEM_FAIXA)
+
+        limites.append(faixa.superior)
+        inclusivos.append(faixa.superior_inclusivo)
+        codigos.append(codigo)
+        anterior = faixa
+
+    return limites, inclusivos, codigos
+
+
+def _limite(valor: Optional[float], infinito: float) -> float:
+    """Converte o limite de uma faixa declarada; null é o infinito do lado correspondente."""
+
+    return infinito if valor is None else valor
+
+
+def _senao(dados: Mapping) -> bool:
+    """Indica se a faixa declarada é o else da cadeia: sem limites, cobre o que sobra acima."""
+
+    return dados['inferior'] is None and dados['superior'] is None
+
+
+def faixas_da_declaracao(declaradas: Sequence[Mapping]) -> List[Faixa]:
+    """
+    Converte as faixas declaradas de um indicador, em ordem. As faixas podem deixar lacunas entre
+    si, como em "x == 0" seguido de "1 <= x < 80"; os valores nas lacunas não têm faixa. A última
+    pode ser o else, que cobre tudo acima da anterior, desde que não haja lacunas antes dela.
+    """
+    faixas: List[Faixa] = []
+
+    for dados in declaradas:
+        if _senao(dados):
+            if not faixas or not all(_contiguas(anterior, faixa)
+                                     for anterior, faixa in zip(faixas, faixas[1:])):
+                raise ValueError('O else de uma cadeia de faixas não pode cobrir lacunas.')
+
+            anterior = faixas[-1]
+            faixas.append(Faixa(anterior.superior, not anterior.superior_inclusivo, np.inf, True))
+        else:
+            faixas.append(Faixa(_limite(dados['inferior'], -np.inf), dados['inferior_inclusivo'],
+                                _limite(dados['superior'], np.inf), dados['superior_inclusivo']))
+
+    for anterior, faixa in zip(faixas, faixas[1:]):
+        if (faixa.inferior, not faixa.inferior_inclusivo) < (anterior.superior,
+                                                             anterior.superior_inclusivo):
+            raise ValueError(f'Faixas fora de ordem: {anterior}, {faixa}')
+
+    return faixas
+
+
+def _na_faixa(dados: Mapping, valor) -> bool:
+    """
+    Testa o valor como o if da faixa declarada: "x < c", "x > c", "x == c", "a <= x < b" ou else.
+    Valores que não se comparam com números levantam o mesmo TypeError do if.
+    """
+    if _senao(dados):
+        return True
+
+    inferior, superior = dados['inferior'], dados['superior']
+
+    if inferior is None:
+        return valor <= superior if dados['superior_inclusivo'] else valor < superior
+    if superior is None:
+        return valor >= inferior if dados['inferior_inclusivo'] else valor > inferior
+    if inferior == superior:
+        return valor == inferior
+
+    return ((inferior <= valor if dados['inferior_inclusivo'] else inferior < valor)
+            and (valor <= superior if dados['superior_inclusivo'] else valor < superior))
+
+
+def _escala(declaracao: Mapping) -> Optional[Tuple[float, bool]]:
+    """Divisor dos valores monetários do indicador e se o limiar vale para o valor absoluto."""
+
+    escala = declaracao['escala']
+
+    return None if escala is None else (escala['divisor'], escala['absoluto'])
+
+
+def _converter(valor, escala: Tuple[float, bool]) -> float:
+    """
+    Converte o valor de um indicador monetário: textos como 'R$ 1.234,56' são sempre divididos
+    pela escala; números, só a partir de LIMIAR_ESCALA.
+    """
+    divisor, absoluto = escala
+
+    if isinstance(valor, str):
+        valor = valor.replace('R$', '').replace(' ', '')
+        valor = valor.replace('.', '').replace(',', '.')
+        return float(valor) / divisor
+
+    return float(valor) / divisor if (abs(valor) if absoluto else valor) >= LIMIAR_ESCALA \
+        else float(valor)
+
+
+def resultados_da_declaracao(declaracao: Mapping) -> List[ResultadoFaixa]:
+    """Cria o resultado de cada faixa declarada, com os textos comuns do indicador."""
+
+    return [ResultadoFaixa(dados['classificacao'], dados['faixa'], dados['descricao'],
+                           declaracao['definicao'], declaracao['agrupador'], declaracao['formula'],
+                           dados.get('riscos'), dados.get('referencia_cruzada'))
+            for dados in declaracao['faixas']]
+
+
+class TabelaFaixas:
+    """
+    Faixas de um indicador prontas para classificação vetorizada: os limites superiores dos
+    segmentos (faixas e lacunas entre elas) em um vetor ordenado, se cada limite pertence ao
+    próprio segmento, o código de cada segmento e o resultado de cada faixa.
+    """
+
+    __slots__ = ('nome', 'limites', 'inclusivos', 'codigos', 'resultados', 'escala', 'codigo_nan',
+                 '_escalares')
+
+    def __init__(self, nome: str, faixas: Sequence[Faixa], resultados: Sequence,
+                 escala: Optional[Tuple[float, bool]] = None, codigo_nan: int = SEM_FAIXA):
+        limites, inclusivos, codigos = segmentar(faixas)
+
+        self.nome = nome
+        self.limites = np.array(limites, dtype=np.float64)
+        self.inclusivos = np.array(inclusivos, dtype=bool)
+        # Um código a mais, no fim, para os valores acima do último segmento.
+        self.codigos = np.array(codigos + [SEM_FAIXA], dtype=np.int8)
+        self.resultados = tuple(resultados)
+        self.escala = escala
+        # NaN não se compara com nenhum limite: como no if, só o else da cadeia o aceita.
+        self.codigo_nan = codigo_nan
+        # Os mesmos segmentos em tuplas, mais rápidas que o NumPy para um único valor.
+        self._escalares = (tuple(limites), tuple(inclusivos), tuple(self.codigos.tolist()))
+
+    @classmethod
+    def da_declaracao(cls, nome: str, declaracao: Mapping) -> 'TabelaFaixas':
+        """Monta a tabela de um indicador a partir da sua declaração no catálogo."""
+
+        declaradas = declaracao['faixas']
+        codigo_nan = next((codigo for codigo, dados in enumerate(declaradas) if _senao(dados)),
+                          SEM_FAIXA)
+
+        return cls(nome, faixas_da_declaracao(declaradas), resultados_da_declaracao(declaracao),
+                   _escala(declaracao), codigo_nan)
+
+    def classificar_valor(self, valor: float) -> int:
+        """Classifica um único valor, sem passar pelo NumPy. Mesmo resultado de classificar."""
+
+        if self.escala is not None:
+            divisor, absoluto = self.escala
+            if (abs(valor) if absoluto else valor) >= LIMIAR_ESCALA:
+                valor = valor / divisor
+
+        if math.isnan(valor):
+            return self.codigo_nan
+
+        limites, inclusivos, codigos = self._escalares
+        segmento = bisect_left(limites, valor)
+
+        if segmento < len(limites) and valor == limites[segmento] and not inclusivos[segmento]:
+            segmento += 1
+
+        return codigos[segmento]
+
+    def classificar(self, valores) -> np.ndarray:
+        """
+        Classifica todos os valores de uma vez. Devolve o código da faixa de cada valor,
+        na ordem das faixas declaradas, ou SEM_FAIXA para valores fora de todas elas. NaN recebe
+        o código do else da cadeia, como na função evaluate_*, ou SEM_FAIXA se não houver else.
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+
+        if self.escala is not None:
+            divisor, absoluto = self.escala
+            referencia = np.abs(valores) if absoluto else valores
+            valores = np.where(referencia >= LIMIAR_ESCALA, valores / divisor, valores)
+
+        segmentos = np.searchsorted(self.limites, valores, side='left')
+
+        # Um valor igual a um limite que não pertence ao segmento passa para o seguinte.
+        dentro = segmentos < len(self.limites)
+        posicoes = np.minimum(segmentos, len(self.limites) - 1)
+        segmentos += dentro & (valores == self.limites[posicoes]) & ~self.inclusivos[posicoes]
+
+        codigos = self.codigos[segmentos]
+        codigos[np.isnan(valores)] = self.codigo_nan
+
+        return codigos
+
+    def resultado(self, codigo: int) -> Optional[ResultadoFaixa]:
+        """Devolve o resultado compartilhado de uma faixa, ou None para SEM_FAIXA."""
+
+        return None if codigo == SEM_FAIXA else self.resultados[codigo]
+
+
+# Tabela de cada indicador do catálogo, montada no primeiro uso.
+_TABELAS: Dict[str, TabelaFaixas] = {}
+
+
+def tabela_do_indicador(indicador: str) -> TabelaFaixas:
+    """Devolve a tabela compartilhada de um indicador, como 'p_l' ou 'evaluate_p_l'."""
+
+    chave = indicador[len('evaluate_'):] if indicador.startswith('evaluate_') else indicador
+    tabela = _TABELAS.get(chave)
+
+    if tabela is None:
+        tabela = _TABELAS[chave] = TabelaFaixas.da_declaracao(f'evaluate_{chave}',
+                                                              CATALOGO.indicador(chave))
+
+    return tabela
+
+
+def montar_funcao(funcao: str, modulo: str) -> Callable:
+    """
+    Monta a função evaluate_<funcao> de um módulo a partir da declaração do seu indicador. Ela
+    devolve o ResultadoFaixa compartilhado da faixa do valor, None se ele não cair em nenhuma
+    faixa, ou um resultado de erro para valores inválidos, como as funções escritas à mão
+    faziam.
+    """
+    chave = CATALOGO.modulo(modulo)[funcao]
+    declaracao = CATALOGO.indicador(chave)
+    variavel = declaracao['variavel']
+    assinatura = inspect.Signature([inspect.Parameter(variavel,
+                                                      inspect.Parameter.POSITIONAL_OR_KEYWORD)])
+    escala = _escala(declaracao)
+
+    def avaliar(*valores, **nomeados):
+        # Uma chamada comum, evaluate_p_l(8.5), não passa pela assinatura.
+        valor = valores[0] if len(valores) == 1 and not nomeados \
+            else assinatura.bind(*valores, **nomeados).arguments[variavel]
+        tabela = tabela_do_indicador(chave)
+
+        if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+            codigo = tabela.classificar_valor(valor)
+
+            if codigo != SEM_FAIXA:
+                return tabela.resultados[codigo]
+
+        # Textos monetários, NaN e inválidos seguem a cadeia de faixas, na ordem declarada.
+        try:
+            if escala is not None:
+                valor = _converter(valor, escala)
+
+            for dados, resultado in zip(declaracao['faixas'], tabela.resultados):
+                if _na_faixa(dados, valor):
+                    return resultado
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.debug('Erro ao classificar %s: %s', chave, e)
+            return ResultadoFaixa('Erro', 'N/A', declaracao['erro'].format(erro=str(e)),
+                                  declaracao['definicao'], declaracao['agrupador'],
+                                  declaracao['formula'])
+
+        return None
+
+    avaliar.__name__ = avaliar.__qualname__ = f'evaluate_{funcao}'
+    avaliar.__module__ = modulo
+    avaliar.__doc__ = declaracao['documentacao']
+    avaliar.__signature__ = assinatura
+
+    return avaliar
+
+
+def funcoes_do_catalogo(modulo: str) -> Dict[str, Callable]:
+    """Monta as funções evaluate_* que um módulo expõe, como 'analisefundamentalista'."""
+
+    return {f'evaluate_{funcao}': montar_funcao(funcao, modulo)
+            for funcao in CATALOGO.modulo(modulo)}
+
+
+class MotorClassificacao:
+    """
+    Classifica colunas de indicadores com as faixas do catálogo, pelos indicadores que um módulo
+    expõe, por padrão analisefundamentalista. As tabelas são montadas na primeira vez que cada
+    indicador é usado e reaproveitadas depois.
+    """
+
+    def __init__(self, modulo: str = 'analisefundamentalista'):
+        self.modulo = modulo
+
+    def indicadores(self) -> List[str]:
+        """Lista os indicadores do módulo, sem o prefixo evaluate_."""
+
+        return sorted(CATALOGO.modulo(self.modulo))
+
+    def tabela(self, indicador: str) -> TabelaFaixas:
+        """Devolve a tabela de um indicador do módulo, como 'p_l' ou 'evaluate_p_l'."""
+
+        funcao = indicador[len('evaluate_'):] if indicador.startswith('evaluate_') else indicador
+
+        return tabela_do_indicador(CATALOGO.modulo(self.modulo).get(funcao, funcao))
+
+    def classificar(self, indicador: str, valores) -> np.ndarray:
+        """Classifica uma coluna de valores de um indicador, devolvendo os códigos de faixa."""
+
+        return self.tabela(indicador).classificar(valores)
+
+    def classificar_colunas(self, colunas: Mapping[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+        """Classifica várias colunas, uma por indicador, como as de um DataFrame."""
+
+        return {indicador: self.classificar(indicador, valores)
+                for indicador, valores in colunas.items()}
+
+    def resultados(self, indicador: str, codigos: Sequence[int]) -> List[Optional[ResultadoFaixa]]:
+        """Converte códigos de faixa nos resultados compartilhados de cada faixa."""
+
+        tabela = self.tabela(indicador)
+
+        return [tabela.resultado(codigo) for codigo in codigos]
+
+    def avaliar(self, indicador: str,
+                valores: Sequence[float]) -> List[Tuple[float, Optional[ResultadoFaixa]]]:
+        """Avalia uma coluna, devolvendo cada valor com a referência ao resultado da sua faixa."""
+
+        return list(zip(valores, self.resultados(indicador, self.classificar(indicador, valores))))
+
+
+# Motor compartilhado, com os indicadores de analisefundamentalista.
+MOTOR = MotorClassificacao()
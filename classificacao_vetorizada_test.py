@@ -0,0 +1,162 @@
+"""
+classificacao_vetorizada_test.py
+Testes do motor de classificação vetorizada: segmentos, limites inclusivos e exclusivos, lacunas,
+NaN, escala monetária e a concordância do MOTOR com as funções evaluate_*.
+"""
+
+import logging
+import math
+
+import numpy as np
+import pytest
+
+import analisefundamentalista
+import indicadores_selecionados
+from catalogo_indicadores import CATALOGO
+from classificacao_vetorizada import (MOTOR, SEM_FAIXA, Faixa, MotorClassificacao, ResultadoFaixa,
+                                      TabelaFaixas, montar_funcao, segmentar, tabela_do_indicador)
+
+# "x < 0", "0 <= x <= 10", "10 < x < 20", lacuna em [20, 30), "x >= 30".
+FAIXAS = [Faixa(-np.inf, False, 0, False),
+          Faixa(0, True, 10, True),
+          Faixa(10, False, 20, False),
+          Faixa(30, True, np.inf, True)]
+
+
+def tabela_de_teste(escala=None) -> TabelaFaixas:
+    """Tabela com FAIXAS e um resultado por faixa."""
+
+    resultados = [ResultadoFaixa(nome, nome, '', '', '', '')
+                  for nome in ('negativo', 'baixo', 'medio', 'alto')]
+
+    return TabelaFaixas('teste', FAIXAS, resultados, escala)
+
+
+def test_segmentar_com_lacuna() -> None:
+    """A lacuna entre duas faixas vira um segmento SEM_FAIXA."""
+
+    limites, inclusivos, codigos = segmentar(FAIXAS)
+
+    assert limites == [0, 10, 20, 30, np.inf]
+    assert inclusivos == [False, True, False, False, True]
+    assert codigos == [0, 1, 2, SEM_FAIXA, 3]
+
+
+@pytest.mark.parametrize('valor, codigo', [
+    (-1e300, 0), (-0.001, 0),
+    (0, 1), (10, 1),                      # limites inclusivos
+    (10.0001, 2), (19.999, 2),
+    (20, SEM_FAIXA), (25, SEM_FAIXA),     # limite exclusivo e lacuna
+    (29.999, SEM_FAIXA), (30, 3), (1e300, 3),
+    (np.inf, 3), (-np.inf, 0),
+    (math.nan, SEM_FAIXA),
+])
+def test_classificar_limites(valor, codigo) -> None:
+    """O vetor e o valor único dão o mesmo código nos limites, lacunas e NaN."""
+
+    tabela = tabela_de_teste()
+
+    assert tabela.classificar([valor]).tolist() == [codigo]
+    assert tabela.classificar_valor(valor) == codigo
+
+
+def test_classificar_escala() -> None:
+    """Valores a partir de LIMIAR_ESCALA são divididos; o absoluto vale para negativos."""
+
+    tabela = tabela_de_teste(escala=(1_000_000, False))
+    valores = [999_999, 1_000_000, 15_000_000, -15_000_000]
+
+    # 999_999 fica como está; 1e6 vira 1; 15e6 vira 15; -15e6 não é dividido.
+    assert tabela.classificar(valores).tolist() == [3, 1, 2, 0]
+    assert [tabela.classificar_valor(valor) for valor in valores] == [3, 1, 2, 0]
+
+    absoluta = tabela_de_teste(escala=(1_000_000, True))
+
+    assert absoluta.classificar([-15_000_000]).tolist() == [0]
+    assert absoluta.classificar_valor(-500_000_000) == 0
+    assert absoluta.classificar([-5_000_000, 5_000_000]).tolist() == [0, 1]
+
+
+def test_nan_segue_o_else() -> None:
+    """NaN recebe a faixa do else da cadeia, como no if original, ou nenhuma sem else."""
+
+    # vpa termina com um else ('Ótimo'); roe termina com "x > 25", sem else.
+    assert analisefundamentalista.evaluate_vpa(math.nan).classificacao == 'Ótimo'
+    assert MOTOR.resultados('vpa', MOTOR.classificar('vpa', [math.nan]))[0] is \
+        analisefundamentalista.evaluate_vpa(math.nan)
+
+    assert analisefundamentalista.evaluate_roe(math.nan) is None
+    assert MOTOR.classificar('roe', [math.nan]).tolist() == [SEM_FAIXA]
+
+
+def test_montar_funcao() -> None:
+    """A função montada tem o nome e a assinatura declarados e trata textos e erros."""
+
+    evaluate_p_l = montar_funcao('p_l', 'analisefundamentalista')
+
+    assert evaluate_p_l.__name__ == 'evaluate_p_l'
+    assert list(evaluate_p_l.__signature__.parameters) == [CATALOGO.indicador('p_l')['variavel']]
+    assert evaluate_p_l(8.5) is tabela_do_indicador('p_l').resultados[1]
+    assert evaluate_p_l(p_l=8.5) is evaluate_p_l(8.5)
+    assert evaluate_p_l('abc').classificacao == 'Erro'
+
+    evaluate_divida_bruta = montar_funcao('divida_bruta', 'analisefundamentalista')
+
+    # Textos monetários são sempre divididos pela escala.
+    assert evaluate_divida_bruta('R$ 1.500.000.000,00') is evaluate_divida_bruta(1.5e9)
+
+
+def test_indicadores_selecionados_mantem_as_suas_declaracoes() -> None:
+    """p_vp, p_l e p_ebitda de indicadores_selecionados seguem as faixas e textos do módulo."""
+
+    evaluate_p_vp = indicadores_selecionados.evaluate_p_vp
+
+    assert evaluate_p_vp.__name__ == 'evaluate_p_vp'
+    assert evaluate_p_vp(-0.1).classificacao == 'Fora da faixa'
+    assert evaluate_p_vp(3.5).classificacao == 'Crítico'
+    assert analisefundamentalista.evaluate_p_vp(-0.1).classificacao == 'Crítico'
+    assert 'riscos' not in indicadores_selecionados.evaluate_p_l(8)
+    assert 'riscos' in analisefundamentalista.evaluate_p_l(8)
+
+    motor = MotorClassificacao('indicadores_selecionados')
+
+    assert 'p_vp' in motor.indicadores()
+    assert motor.resultados('p_vp', motor.classificar('p_vp', [3.5]))[0] is evaluate_p_vp(3.5)
+
+
+def test_erro_vai_para_o_log(capsys, caplog) -> None:
+    """Valores inválidos devolvem o resultado de erro e são registrados no log, sem print."""
+
+    evaluate_p_l = montar_funcao('p_l', 'analisefundamentalista')
+
+    with caplog.at_level(logging.DEBUG, logger='classificacao_vetorizada'):
+        assert evaluate_p_l('abc').classificacao == 'Erro'
+
+    assert capsys.readouterr().out == ''
+    assert 'p_l' in caplog.text
+
+
+def valores_de_borda(tabela: TabelaFaixas):
+    """Os limites de uma tabela, os seus vizinhos imediatos e alguns valores extremos."""
+
+    valores = [-1e12, -1.0, 0.0, 1e12, math.nan]
+
+    for limite in tabela.limites[np.isfinite(tabela.limites)].tolist():
+        valores += [limite, np.nextafter(limite, -np.inf), np.nextafter(limite, np.inf)]
+
+        if tabela.escala is not None:
+            valores += [limite * tabela.escala[0], limite * tabela.escala[0] + 1]
+
+    return valores
+
+
+@pytest.mark.parametrize('indicador', MOTOR.indicadores())
+def test_motor_concorda_com_evaluate(indicador) -> None:
+    """MOTOR.classificar dá o mesmo resultado da função evaluate_* em cada valor de borda."""
+
+    funcao = getattr(analisefundamentalista, f'evaluate_{indicador}')
+    valores = valores_de_borda(MOTOR.tabela(indicador))
+    resultados = MOTOR.resultados(indicador, MOTOR.classificar(indicador, valores))
+
+    for valor, resultado in zip(valores, resultados):
+        assert funcao(valor) is resultado, (indicador, valor)
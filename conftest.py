@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: conftest.py
+#  Version: 0.0.4
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Shared test fixtures."""
+
+import pytest
+
+from fundamentus.drivers.cache_manager import CacheManager
+from fundamentus.drivers.http_session_pool import configure_shared_session_pool
+from fundamentus.drivers.rate_limiter import configure_shared_rate_limiter
+from fundamentus.stages.processing.parse_result_cache import \
+    configure_shared_parse_cache
+from fundamentus.utilities.stage_metrics import configure_shared_stage_metrics
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache() -> None:
+    """Give each test an empty in-memory HTTP cache.
+
+    Mocked responses must not leak between tests through the caches,
+    and the rate limiter and stage metrics start from zero.
+    """
+
+    configure_shared_session_pool(cache_manager=CacheManager(backend='memory'))
+    configure_shared_rate_limiter()
+    configure_shared_parse_cache()
+    configure_shared_stage_metrics()
+
+    yield
+
+    configure_shared_session_pool(cache_manager=CacheManager(backend='memory'))
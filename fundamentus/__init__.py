@@ -24,7 +24,9 @@ empowering investors with comprehensive market analysis.
 
 """
 
+from fundamentus.main.async_fundamentus_pipeline import \
+    AsyncFundamentusPipeline as AsyncPipeline
 from fundamentus.main.fundamentus_pipeline import FundamentusPipeline as Pipeline
 
 
-__all__ = ['Pipeline']
+__all__ = ['AsyncPipeline', 'Pipeline']
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: information_codec.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Information Codec.
+
+Converts the transformed information to and from plain JSON, so results
+kept on disk are read back as data and never executed, as unpickling a
+file from a configurable path would. Each item is stored as its metadata
+key and value, and the title and tooltip of every key are stored once,
+in a metadata table registered again when the information is decoded.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from fundamentus.contracts.information_contract import METADATA_REGISTRY, InformationItem
+from fundamentus.contracts.transform_contract import TransformContract
+
+# Version of the stored form, bumped when it changes incompatibly.
+FORMAT_VERSION = 1
+
+# The title and tooltip of each metadata key.
+MetadataTable = Dict[str, List[str]]
+
+
+def encode_information(information: Any, metadata: MetadataTable) -> Any:
+    """Return the plain JSON form of some transformed information.
+
+    :param information: Any: Sections, items and values, nested in dicts and lists.
+    :param metadata: dict: Table receiving the title and tooltip of every item.
+    :return: Any: The information made of JSON types only.
+    :raises TypeError: If a value has no JSON form.
+    """
+
+    if isinstance(information, InformationItem):
+        if information.key not in metadata:
+            metadata[information.key] = [information.title, information.tooltip]
+
+        return {'$item': information.key,
+                'value': encode_information(information.value, metadata)}
+
+    if isinstance(information, Decimal):
+        return {'$decimal': str(information)}
+
+    if isinstance(information, dict):
+        return {str(key): encode_information(value, metadata)
+                for key, value in information.items()}
+
+    if isinstance(information, (list, tuple)):
+        return [encode_information(value, metadata) for value in information]
+
+    if information is None or isinstance(information, (str, int, float)):
+        return information
+
+    raise TypeError(f'Cannot encode {type(information).__name__} information.')
+
+
+def register_metadata(metadata: MetadataTable) -> None:
+    """Register the title and tooltip of every key in a metadata table.
+
+    :param metadata: dict: The title and tooltip of each key.
+    :raises ValueError: If a key does not match its path, title and tooltip.
+    """
+
+    for key, (title, tooltip) in metadata.items():
+        path = key.rpartition('#')[0]
+
+        if METADATA_REGISTRY.key(title, tooltip, path) != key:
+            raise ValueError(f'The metadata key {key!r} does not match its title and tooltip.')
+
+        METADATA_REGISTRY.register(title, tooltip, path)
+
+
+def decode_information(data: Any, metadata: MetadataTable) -> Any:
+    """Return the transformed information of its plain JSON form.
+
+    :param data: Any: The information made of JSON types only.
+    :param metadata: dict: The title and tooltip of every item, already registered.
+    :return: Any: Sections, items and values, nested in dicts and lists.
+    :raises ValueError: If an item refers to a key missing from the table.
+    """
+
+    if isinstance(data, dict):
+        if '$item' in data:
+            key = data['$item']
+
+            if key not in metadata:
+                raise ValueError(f'The metadata key {key!r} is missing from the table.')
+
+            title, tooltip = metadata[key]
+
+            return InformationItem(title, tooltip,
+                                   decode_information(data['value'], metadata),
+                                   path=key.rpartition('#')[0])
+
+        if '$decimal' in data:
+            return Decimal(data['$decimal'])
+
+        return {key: decode_information(value, metadata) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [decode_information(value, metadata) for value in data]
+
+    return data
+
+
+def dumps_contract(contract: TransformContract) -> str:
+    """Return the JSON form of a transform contract.
+
+    :param contract: TransformContract: The transformed information.
+    :return: str: The JSON document.
+    """
+
+    metadata: MetadataTable = {}
+    information = encode_information(contract.transformed_information, metadata)
+
+    return json.dumps({'version': FORMAT_VERSION,
+                       'metadata': metadata,
+                       'information': information},
+                      ensure_ascii=False)
+
+
+def loads_contract(document: str) -> TransformContract:
+    """Return the transform contract of its JSON form.
+
+    :param document: str: The JSON document.
+    :return: TransformContract: The transformed information.
+    :raises ValueError: If the document is not a stored contract.
+    """
+
+    data = json.loads(document)
+
+    try:
+        if data['version'] != FORMAT_VERSION:
+            raise ValueError(f'Unsupported information format: {data["version"]!r}.')
+
+        register_metadata(data['metadata'])
+
+        return TransformContract(decode_information(data['information'], data['metadata']))
+    except (KeyError, TypeError) as error:
+        raise ValueError(f'Malformed information document: {error}.') from error
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: information_codec_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Information Codec Test."""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.stages.processing.process_pool_processor import process_html
+
+from .information_codec import dumps_contract, loads_contract
+from .information_contract import InformationItem
+from .transform_contract import TransformContract
+
+
+def test_contract_round_trip() -> None:
+    """Test that a transformed page is read back with its values and metadata."""
+
+    contract = process_html(HTML_COLLECTOR_MOCK['content'])
+    restored = loads_contract(dumps_contract(contract))
+
+    assert restored == contract
+
+    restored_item = restored.transformed_information['financial_summary']['market_valuation']
+    item = contract.transformed_information['financial_summary']['market_valuation']
+
+    assert restored_item.title == item.title
+    assert type(restored_item.value) is type(item.value)
+
+
+def test_values_keep_their_types() -> None:
+    """Test that decimals, floats and texts keep their types."""
+
+    information = {'values': {
+        'decimal': InformationItem('Decimal', 'Um decimal.', Decimal('3.160')),
+        'float': InformationItem('Float', 'Um float.', 0.557),
+        'text': InformationItem('Data', 'Uma data.', '31/03/2024'),
+    }}
+
+    restored = loads_contract(dumps_contract(TransformContract(information)))
+    values = restored.transformed_information['values']
+
+    assert values['decimal'].value == Decimal('3.160')
+    assert str(values['decimal'].value) == '3.160'
+    assert values['float'].value == 0.557
+    assert values['text'].value == '31/03/2024'
+
+
+def test_document_is_plain_json() -> None:
+    """Test that the document stores each title and tooltip once."""
+
+    information = {'first': InformationItem('ROE', 'Retorno.', Decimal('1'), path='a.roe'),
+                   'second': InformationItem('ROE', 'Retorno.', Decimal('2'), path='a.roe')}
+
+    document = json.loads(dumps_contract(TransformContract(information)))
+
+    assert list(document['metadata'].values()) == [['ROE', 'Retorno.']]
+    assert document['information']['first'] == {'$item': information['first'].key,
+                                                'value': {'$decimal': '1'}}
+
+
+def test_rejects_tampered_metadata() -> None:
+    """Test that a key not matching its title and tooltip is rejected."""
+
+    item = InformationItem('ROE', 'Retorno.', Decimal('1'), path='a.roe')
+    document = json.loads(dumps_contract(TransformContract({'roe': item})))
+    document['metadata'][item.key] = ['ROE', 'Outro texto.']
+
+    with pytest.raises(ValueError):
+        loads_contract(json.dumps(document))
+
+
+def test_rejects_malformed_document() -> None:
+    """Test that a document that is not a stored contract is rejected."""
+
+    with pytest.raises(ValueError):
+        loads_contract('{"version": 1}')
+
+    with pytest.raises(ValueError):
+        loads_contract('not json')
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: information_contract.py
-#  Version: 0.0.1
+#  Version: 0.0.5
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -19,25 +19,183 @@
 """Information Contract Module.
 
 Provides a data structure for storing and managing collected financial information
-within the Python Fundamentus API, using a dataclass for enhanced readability and
-efficiency.
+within the Python Fundamentus API. The title and tooltip of an information are
+the same for every stock, so they are kept once in a shared metadata registry,
+and each item holds only its metadata key and its value.
 """
 
-from dataclasses import dataclass
+import hashlib
+import re
+import unicodedata
 from decimal import Decimal
+from threading import Lock
+from typing import Dict, NamedTuple, Tuple
+
+
+class InformationMetadata(NamedTuple):
+    """Represents the title and tooltip shared by every item of an information."""
+
+    title: str
+    tooltip: str
+
+
+class MetadataRegistry:
+    """Represents the registry of the titles and tooltips of the information.
+
+    Each distinct title and tooltip pair is registered once. Its key is the
+    collector key path of the information, like
+    "oscillations.variation_day", followed by a digest of the title and
+    tooltip, like "oscillations.variation_day#3f0c2a91". The key depends
+    only on the path and the texts, not on the order in which pages were
+    read, so it is the same in every process and run, and a path whose
+    title changes, like the yearly oscillations, gets a new key. Items
+    built without a path use the snake case form of the title instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the class."""
+
+        self.__keys: Dict[Tuple[str, str, str], str] = {}
+        self.__metadata: Dict[str, InformationMetadata] = {}
+        self.__lock = Lock()
+
+    @staticmethod
+    def __slug(title: str) -> str:
+        """Return the snake case form of a title, without accents."""
+
+        ascii_title = unicodedata.normalize('NFKD', title).encode('ascii', 'ignore').decode()
+        slug = re.sub(r'[^a-z0-9]+', '_', ascii_title.lower()).strip('_')
+
+        return slug or 'information'
+
+    def key(self, title: str, tooltip: str, path: str = '') -> str:
+        """Return the key of a title and tooltip pair, without registering it.
+
+        :param title: str: The name or title of the information.
+        :param tooltip: str: The description of the information.
+        :param path: str: The collector key path, like "balance_sheet.equity".
+        :return: str: The key, the same in every process.
+        """
+
+        digest = hashlib.sha256(f'{title}\x1f{tooltip}'.encode()).hexdigest()[:8]
+
+        return f'{path or self.__slug(title)}#{digest}'
+
+    def register(self, title: str, tooltip: str, path: str = '') -> str:
+        """Register a title and tooltip pair.
+
+        :param title: str: The name or title of the information.
+        :param tooltip: str: The description of the information.
+        :param path: str: The collector key path, like "balance_sheet.equity".
+        :return: str: The key of the pair, the same on every call and process.
+        :raises ValueError: If the key is registered with another pair.
+        """
+
+        key = self.__keys.get((path, title, tooltip))
+
+        if key is not None:
+            return key
+
+        metadata = InformationMetadata(title, tooltip)
+        key = self.key(title, tooltip, path)
+
+        with self.__lock:
+            registered = self.__metadata.setdefault(key, metadata)
+
+            if registered != metadata:
+                raise ValueError(f'The metadata key {key!r} is registered with {registered}.')
+
+            self.__keys[(path, title, tooltip)] = key
+
+        return key
+
+    def get(self, key: str) -> InformationMetadata:
+        """Return the title and tooltip of a key.
+
+        :param key: str: The key of the information.
+        :return: InformationMetadata: The title and tooltip.
+        :raises KeyError: If the key is not registered.
+        """
+
+        return self.__metadata[key]
+
+    def __len__(self) -> int:
+        """Return the number of registered pairs."""
+
+        return len(self.__metadata)
+
+
+# Process-wide registry shared by every information item.
+METADATA_REGISTRY = MetadataRegistry()
 
 
-@dataclass
 class InformationItem:
     """Represents a single item of collected financial information.
 
+    The item is immutable and slotted. Its title and tooltip are looked up
+    in the shared registry, so they are not repeated for every stock.
+
     Attributes:
+        key (str): The key of the title and tooltip in the metadata registry,
+                   the collector key path and a digest of the texts.
         title (str): The name or title of the information.
         tooltip (str): A brief description or tooltip associated with the information.
         value (Decimal): The numeric value of the information, stored as
-                         a Decimal for precision.
+                         a Decimal for precision, or as a float when the
+                         transformer runs in the float numeric mode.
     """
 
-    title: str
-    tooltip: str
-    value: Decimal
+    __slots__ = ('key', 'value')
+
+    def __init__(self, title: str, tooltip: str, value: Decimal, path: str = '') -> None:
+        """Initialize the class.
+
+        :param title: str: The name or title of the information.
+        :param tooltip: str: The description of the information.
+        :param value: Decimal: The value of the information.
+        :param path: str: The collector key path, like "balance_sheet.equity".
+        """
+
+        object.__setattr__(self, 'key', METADATA_REGISTRY.register(title, tooltip, path))
+        object.__setattr__(self, 'value', value)
+
+    @property
+    def title(self) -> str:
+        """Return the name or title of the information."""
+
+        return METADATA_REGISTRY.get(self.key).title
+
+    @property
+    def tooltip(self) -> str:
+        """Return the description of the information."""
+
+        return METADATA_REGISTRY.get(self.key).tooltip
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f'cannot assign to attribute {name!r}')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'cannot delete attribute {name!r}')
+
+    @property
+    def path(self) -> str:
+        """Return the collector key path of the information."""
+
+        return self.key.rpartition('#')[0]
+
+    def __reduce__(self) -> Tuple:
+        # Another process has its own registry, so the metadata travels along.
+        return InformationItem, (self.title, self.tooltip, self.value, self.path)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, InformationItem):
+            return NotImplemented
+
+        return (self.key, self.value) == (other.key, other.value)
+
+    def __hash__(self) -> int:
+        return hash((self.key, self.value))
+
+    def __repr__(self) -> str:
+        return (f'InformationItem(title={self.title!r}, tooltip={self.tooltip!r}, '
+                f'value={self.value!r})')
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: information_contract_test.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Information Contract Test."""
+
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from .information_contract import (METADATA_REGISTRY, InformationItem,
+                                   MetadataRegistry)
+
+
+def test_information_item_shares_metadata() -> None:
+    """Test that items of the same information share one registry entry."""
+
+    first = InformationItem('Valor de mercado', 'Valor de mercado da empresa.', Decimal(1))
+    second = InformationItem('Valor de mercado', 'Valor de mercado da empresa.', Decimal(2))
+
+    assert first.key == second.key == METADATA_REGISTRY.key('Valor de mercado',
+                                                            'Valor de mercado da empresa.')
+    assert first.key.startswith('valor_de_mercado#')
+    assert first.title == 'Valor de mercado'
+    assert first.tooltip == 'Valor de mercado da empresa.'
+    assert METADATA_REGISTRY.get(first.key) == (first.title, first.tooltip)
+    assert not hasattr(first, '__dict__')
+
+
+def test_information_item_is_frozen() -> None:
+    """Test that an item cannot be modified."""
+
+    item = InformationItem('P/L', 'Preço dividido pelo lucro.', Decimal('3.16'))
+
+    with pytest.raises(AttributeError, match='cannot assign'):
+        item.value = Decimal(0)
+
+    with pytest.raises(AttributeError, match='cannot delete'):
+        del item.value
+
+
+def test_information_item_pickle() -> None:
+    """Test that an item keeps its metadata through pickling."""
+
+    item = InformationItem('ROE', 'Retorno sobre o Patrimônio Líquido.', 0.557)
+    restored = pickle.loads(pickle.dumps(item))
+
+    assert restored == item
+    assert restored.title == 'ROE'
+    assert hash(restored) == hash(item)
+
+
+def test_metadata_registry_keys_are_stable() -> None:
+    """Test that keys come from the path and texts, whatever the registration order."""
+
+    first, second = MetadataRegistry(), MetadataRegistry()
+
+    day = first.register('Dia', '', 'oscillations.variation_day')
+    tooltip_day = first.register('dia', 'Variação do dia.', 'oscillations.variation_day')
+
+    assert second.register('dia', 'Variação do dia.', 'oscillations.variation_day') == tooltip_day
+    assert second.register('Dia', '', 'oscillations.variation_day') == day
+    assert day != tooltip_day
+    assert day.startswith('oscillations.variation_day#')
+    assert first.register('Dia', '', 'oscillations.variation_day') == day
+    assert first.register('Mês', '').startswith('mes#')
+    assert len(first) == 3
+
+
+def test_information_item_path() -> None:
+    """Test that an item keeps its collector key path, also through pickling."""
+
+    item = InformationItem('P/L', 'Preço dividido pelo lucro.', Decimal('3.16'),
+                           path='valuation_indicators.price_divided_by_profit_title')
+    restored = pickle.loads(pickle.dumps(item))
+
+    assert item.path == 'valuation_indicators.price_divided_by_profit_title'
+    assert restored.key == item.key
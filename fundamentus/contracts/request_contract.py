@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: request_contract.py
-#  Version: 0.0.1
+#  Version: 0.0.2
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -23,10 +23,14 @@ the outcome of an HTTP request including its status, request details, and respon
 
 This structured approach facilitates the handling and analysis of HTTP request operations
 across the API.
+
+The `revalidated` field tells whether an expired cached page was confirmed unchanged
+by the server (304 Not Modified), so its body was not downloaded again.
 """
 
 from collections import namedtuple
 
 # A contract for HTTP request results.
 RequestContract = namedtuple('RequestContract',
-                             ['status_code', 'request', 'response'])
+                             ['status_code', 'request', 'response', 'revalidated'],
+                             defaults=(False,))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_http_requester.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Asynchronous HTTP Requester.
+
+This module is responsible for making many HTTP requests concurrently,
+bounded by a semaphore and by the shared rate limiter, over a single
+asynchronous HTTP client.
+
+The responses are not cached: unlike the HttpRequester, this requester does
+not go through the CacheManager session nor revalidate expired pages with
+conditional requests (If-None-Match / If-Modified-Since), because the HTTP
+cache is built on requests_cache, which does not support httpx. Every page
+is downloaded again on each run; the parse result cache only avoids parsing
+an unchanged page twice.
+
+"""
+
+import asyncio
+from typing import Dict
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from fundamentus.contracts.request_contract import RequestContract
+from fundamentus.drivers.rate_limiter import (RateLimiter,
+                                              get_shared_rate_limiter)
+from fundamentus.utilities.config import MAX_CONCURRENCY
+from fundamentus.utilities.random_user_agent import get_random_user_agent
+from .interfaces.async_http_requester import AsyncHttpRequesterInterface
+
+
+class AsyncHttpRequester(AsyncHttpRequesterInterface):
+    """Represents many concurrent HTTP requests to the same URL.
+
+    It must be used as an asynchronous context manager, which opens
+    and closes the underlying HTTP client. The responses bypass the HTTP
+    response cache, so every request reaches the server.
+    """
+
+    def __init__(self, url: str,
+                 max_concurrency: int = MAX_CONCURRENCY,
+                 transport: 'httpx.AsyncBaseTransport' = None,
+                 rate_limiter: RateLimiter = None) -> None:
+        """Initialize the class.
+
+        :param url: str: URL to make the requests.
+        :param max_concurrency: int: Maximum number of requests in flight.
+        :param rate_limiter: RateLimiter: Request rate limiter,
+                             defaults to the process-wide shared limiter.
+        :param transport: httpx.AsyncBaseTransport: Custom transport of the client.
+        :raises ImportError: If httpx is not installed.
+        """
+
+        if httpx is None:
+            raise ImportError('The asynchronous requester requires httpx: '
+                              'pip install pyfundamentus[async]')
+
+        self.__url = url
+        self.__max_concurrency = max_concurrency
+        self.__transport = transport
+        self.__rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.__headers = {"User-Agent": get_random_user_agent()}
+
+        self.__client = None
+        self.__semaphore = None
+
+    async def __aenter__(self) -> 'AsyncHttpRequester':
+        """Open the HTTP client."""
+
+        limits = httpx.Limits(max_connections=self.__max_concurrency,
+                              max_keepalive_connections=self.__max_concurrency)
+
+        self.__client = httpx.AsyncClient(headers=self.__headers,
+                                          limits=limits,
+                                          transport=self.__transport)
+        self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+
+        return self
+
+    async def __aexit__(self, *exception_information) -> None:
+        """Close the HTTP client."""
+
+        await self.__client.aclose()
+
+        self.__client = None
+        self.__semaphore = None
+
+    async def make_request(self, params: Dict) -> RequestContract:
+        """Make request to the url and return the response.
+
+        :param params: dict: Parameters to make the request.
+        :return: RequestContract: Response of the request.
+        :raises HTTPStatusError: If the request fails.
+        """
+
+        async with self.__semaphore:
+            attempt = 0
+
+            while True:
+                await self.__rate_limiter.acquire_async()
+                response = await self.__client.get(self.__url, params=params)
+
+                if not self.__rate_limiter.should_retry(response.status_code, attempt):
+                    break
+
+                await self.__rate_limiter.backoff_async(attempt,
+                                                        response.headers.get('Retry-After'))
+                attempt += 1
+
+        response.raise_for_status()
+
+        return RequestContract(status_code=response.status_code,
+                               request=response.request,
+                               response=response)
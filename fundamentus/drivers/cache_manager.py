@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: cache_manager.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Cache Manager.
+
+This module is responsible for configuring the HTTP response cache once,
+instead of installing it globally on every request.
+
+"""
+
+import requests
+import requests_cache
+
+from fundamentus.utilities.config import (CACHE_BACKEND, CACHE_EXPIRE_AFTER,
+                                          CACHE_NAME)
+
+# Cache backends supported by the API.
+CACHE_BACKENDS = ('sqlite', 'memory', 'filesystem')
+
+
+class CacheManager:
+    """Represents the configuration of the HTTP response cache."""
+
+    def __init__(self,
+                 backend: str = CACHE_BACKEND,
+                 cache_name: str = CACHE_NAME,
+                 expire_after: int = CACHE_EXPIRE_AFTER) -> None:
+        """Initialize the class.
+
+        :param backend: str: Cache backend (sqlite, memory or filesystem),
+                        None disables the cache.
+        :param cache_name: str: Cache path (database file or directory).
+        :param expire_after: int: Time, in seconds, until a response expires.
+        :raises ValueError: If the backend is not supported.
+        """
+
+        if backend is not None and backend not in CACHE_BACKENDS:
+            raise ValueError(f'Invalid cache backend: {backend}. '
+                             f'Choose from: {", ".join(CACHE_BACKENDS)}.')
+
+        self.__backend = backend
+        self.__cache_name = cache_name
+        self.__expire_after = expire_after
+
+    @property
+    def backend(self) -> str:
+        """Return the cache backend."""
+
+        return self.__backend
+
+    @property
+    def cache_name(self) -> str:
+        """Return the cache path."""
+
+        return self.__cache_name
+
+    @property
+    def expire_after(self) -> int:
+        """Return the time, in seconds, until a response expires."""
+
+        return self.__expire_after
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the responses are cached."""
+
+        return self.__backend is not None
+
+    def create_session(self) -> requests.Session:
+        """Create a session bound to the configured cache backend.
+
+        The backend is opened only here, so every request made through
+        the session only performs a cache lookup.
+
+        :return: requests.Session: A cached session, or a plain session
+                 when the cache is disabled.
+        """
+
+        if not self.enabled:
+            return requests.Session()
+
+        return requests_cache.CachedSession(cache_name=self.__cache_name,
+                                            backend=self.__backend,
+                                            expire_after=self.__expire_after)
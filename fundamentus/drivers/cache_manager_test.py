@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: cache_manager_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Cache Manager Test."""
+
+import pytest
+import requests
+import requests_cache
+
+from .cache_manager import CacheManager
+from .http_requester import HttpRequester
+from .http_session_pool import HttpSessionPool
+from .mocks.http_requester import REQUESTER_MOCK
+
+
+def test_create_cached_session() -> None:
+    """Test the cache manager creates a cached session."""
+
+    cache_manager = CacheManager(backend='memory', expire_after=60)
+    session = cache_manager.create_session()
+
+    assert cache_manager.enabled
+    assert isinstance(session, requests_cache.CachedSession)
+    assert session.expire_after == 60
+
+
+def test_create_session_without_cache() -> None:
+    """Test the cache manager creates a plain session when disabled."""
+
+    cache_manager = CacheManager(backend=None)
+    session = cache_manager.create_session()
+
+    assert not cache_manager.enabled
+    assert not isinstance(session, requests_cache.CachedSession)
+    assert isinstance(session, requests.Session)
+
+
+def test_invalid_backend() -> None:
+    """Test the cache manager rejects an unknown backend."""
+
+    with pytest.raises(ValueError):
+        CacheManager(backend='redis')
+
+
+def test_cache_is_not_installed_globally(requests_mock) -> None:
+    """Test the requests are cached without patching requests globally.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    url = 'https://www.fundamentus.com.br/detalhes.php'
+    payload = {'papel': 'MGLU3'}
+
+    requests_mock.get(url=url,
+                      status_code=REQUESTER_MOCK['status_code'],
+                      text=REQUESTER_MOCK['content'])
+
+    pool = HttpSessionPool(cache_manager=CacheManager(backend='memory'))
+
+    for _ in range(3):
+        HttpRequester(url=url, params=payload, session_pool=pool).make_request()
+
+    assert requests.Session is requests.sessions.Session
+    assert requests_mock.call_count == 1
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: http_requester.py
-#  Version: 0.1.1
+#  Version: 0.1.6
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -19,19 +19,57 @@
 
 This module is responsible for collecting the HTML information from the response.
 
+The stock page is walked only once: the tags are indexed by ancestor, tag name
+and class, so the extraction of each section does not walk the page again.
+The listing page is collected by the soup_listing module.
+
 """
 
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
 
 from bs4 import BeautifulSoup as bs
+from bs4.builder import builder_registry
+
+from fundamentus.utilities.config import PARSER
+from fundamentus.utilities.sections import truncate_page, validate_sections
 
 from .interfaces.html_collector import HtmlCollectorInterface
+from .soup_index import index_soup
+from .soup_listing import (LISTING_TABLE, collect_companies,
+                           collect_listing_tables, collect_property_funds)
+
+# BeautifulSoup parsers that build the same tree from the Fundamentus pages.
+SOUP_PARSERS = ('html.parser', 'lxml')
 
 
 # pylint: disable=too-many-locals
 class HtmlCollector(HtmlCollectorInterface):
     """Represents a HTML collector."""
 
+    def __init__(self, parser: str = PARSER) -> None:
+        """Initialize the class.
+
+        :param parser: str: BeautifulSoup parser (html.parser or lxml).
+        :raises ValueError: If the parser is not supported.
+        :raises ImportError: If the parser is not installed.
+        """
+
+        if parser not in SOUP_PARSERS:
+            raise ValueError(f'Invalid parser: {parser}. '
+                             f'Choose from: {", ".join(SOUP_PARSERS)}.')
+
+        if builder_registry.lookup(parser) is None:
+            raise ImportError(f'The {parser} parser is not installed: '
+                              'pip install pyfundamentus[fast]')
+
+        self.__parser = parser
+
+    @property
+    def parser(self) -> str:
+        """Return the name of the parser backend."""
+
+        return self.__parser
+
     @staticmethod
     def __processing_data_title(soup: bs) -> str:
         """Process data title information.
@@ -637,7 +675,8 @@ class HtmlCollector(HtmlCollectorInterface):
         gross_debt_by_equity_value = self.__processing_data_value(
             information[1])
 
-        # Dívida Bruta total (Dívida + Debêntures) menos caixa dividido pelo Patrimônio Líquido.
+        # Dívida Bruta total (Dívida + Debêntures) menos caixa dividido pelo
+        # Patrimônio Líquido.
         net_debt_by_equity_title = self.__processing_data_title(information[2])
         net_debt_by_equity_tooltip = self.__processing_data_tooltip(
             information[2])
@@ -841,64 +880,50 @@ class HtmlCollector(HtmlCollectorInterface):
 
         return {'twelve_months': twelve_months, 'three_months': three_months}
 
-    def collect_all_information(self, html: str) -> Dict:
+    def collect_all_information(self,
+                                html: str,
+                                sections: Optional[Iterable[str]] = None) -> Dict:
         """Collect information from the html.
 
         param: html (str): HTML content.
+        param: sections (Iterable[str]): Sections to collect, like PRICE_SECTIONS;
+               None collects every section.
 
         :return: dict: Dictionary with the collected information.
+        :raises ValueError: If a section is unknown or the page is not from a stock.
         """
 
-        soup = bs(html, 'html.parser')
-
-        if soup.find('table',
-                     {'class': 'table table-default table-sort table-resultados-trimestrais'}):
-            raise ValueError('The HTML content is not from a stock.')
-
-        # Extract the identification of the stock.
-        stock_identification = self.__extraction_stock_identification(soup)
-
-        # Extract the financial summary of the stock.
-        financial_summary = self.__extraction_financial_summary(soup)
-
-        # Extract the price of the stock.
-        price = self.__extraction_price(soup)
-
-        # Extract the detailed information of the stock.
-        detailed_information = self.__extraction_detailed_information(soup)
+        sections = validate_sections(sections)
 
-        # Extract the oscillations of the stock.
-        oscillations = self.__extraction_oscillations(soup)
+        # Walk the page once, up to the last requested section; every find
+        # below is then a lookup in the index.
+        soup = index_soup(bs(truncate_page(html, sections), self.__parser))
 
-        # Extract the stock valuation indicators.
-        valuation_indicators = self.__extraction_valuation_indicators(soup)
-
-        # Extract the stock profitability indicators.
-        profitability_indicators = self.__extraction_profitability_indicators(
-            soup)
-
-        # Extract the stock indebtedness indicators.
-        indebtedness_indicators = self.__extraction_indebtedness_indicators(
-            soup)
-
-        # Extract the stock balance sheet.
-        balance_sheet = self.__extraction_balance_sheet(soup)
+        if soup.find('table', LISTING_TABLE):
+            raise ValueError('The HTML content is not from a stock.')
 
-        # Extract the stock income statement.
-        income_statement = self.__extraction_income_statement(soup)
-
-        return {
-            'identification': stock_identification,
-            'financial_summary': financial_summary,
-            'price': price,
-            'detailed_information': detailed_information,
-            'oscillations': oscillations,
-            'valuation_indicators': valuation_indicators,
-            'profitability_indicators': profitability_indicators,
-            'indebtedness_indicators': indebtedness_indicators,
-            'balance_sheet': balance_sheet,
-            'income_statement': income_statement
-        }
+        # Each section, with its raw key and its extraction, in page order.
+        extractions = (
+            ('stock_identification', 'identification',
+             self.__extraction_stock_identification),
+            ('financial_summary', 'financial_summary', self.__extraction_financial_summary),
+            ('price_information', 'price', self.__extraction_price),
+            ('detailed_information', 'detailed_information',
+             self.__extraction_detailed_information),
+            ('oscillations', 'oscillations', self.__extraction_oscillations),
+            ('valuation_indicators', 'valuation_indicators',
+             self.__extraction_valuation_indicators),
+            ('profitability_indicators', 'profitability_indicators',
+             self.__extraction_profitability_indicators),
+            ('indebtedness_indicators', 'indebtedness_indicators',
+             self.__extraction_indebtedness_indicators),
+            ('balance_sheet', 'balance_sheet', self.__extraction_balance_sheet),
+            ('income_statement', 'income_statement', self.__extraction_income_statement)
+        )
+
+        return {raw_section: extraction(soup)
+                for section, raw_section, extraction in extractions
+                if section in sections}
 
     def collect_list_of_companies(self, html: str) -> List[Dict]:
         """Collect list of companies from Fundamentus website.
@@ -907,26 +932,9 @@ class HtmlCollector(HtmlCollectorInterface):
         :return: list: list of companies collected.
         """
 
-        soup = bs(html, 'html.parser')
-        tables = soup.find_all('table', {
-            'class':
-            'table table-default table-sort table-resultados-trimestrais'
-        })
-        companies = tables[0].find_all('tr')
-
-        companies_list = []
-        for company in companies[1:]:
-            company_code, company_name, corporate_name = company.find_all('td')
-            company_link = company_code.find('a')['href']
-
-            companies_list.append({
-                'code': company_code.text,
-                'name': company_name.text,
-                'corporate_name': corporate_name.text,
-                'link': company_link
-            })
+        tables = collect_listing_tables(html, self.__parser)
 
-        return companies_list
+        return collect_companies(tables[0])
 
     def collect_list_of_property_funds(self, html: str) -> List[Dict]:
         """Collect list of companies from Fundamentus website.
@@ -935,22 +943,20 @@ class HtmlCollector(HtmlCollectorInterface):
         :return: list: list of companies collected.
         """
 
-        soup = bs(html, 'html.parser')
-        tables = soup.find_all('table', {
-            'class':
-            'table table-default table-sort table-resultados-trimestrais'
-        })
-        funds = tables[1].find_all('tr')
-
-        funds_list = []
-        for fund in funds[1:]:
-            fund_code, fund_name = fund.find_all('td')
-            fund_link = fund_code.find('a')['href']
-
-            funds_list.append({
-                'code': fund_code.text,
-                'name': fund_name.text,
-                'link': fund_link
-            })
-
-        return funds_list
+        tables = collect_listing_tables(html, self.__parser)
+
+        return collect_property_funds(tables[1])
+
+    def collect_listings(self, html: str) -> Dict[str, List[Dict]]:
+        """Collect the companies and the property funds from a single parse.
+
+         param: html (str): HTML content.
+        :return: dict: lists of companies and property funds collected.
+        """
+
+        tables = collect_listing_tables(html, self.__parser)
+
+        return {
+            'companies': collect_companies(tables[0]),
+            'property_funds': collect_property_funds(tables[1])
+        }
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: html_collector_factory.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""HTML Collector Factory.
+
+This module chooses the HTML collector of a parser backend.
+
+"""
+
+from fundamentus.utilities.config import PARSER
+
+from .html_collector import SOUP_PARSERS, HtmlCollector
+from .interfaces.html_collector import HtmlCollectorInterface
+from .selectolax_html_collector import SelectolaxHtmlCollector
+
+# Parser backends supported by the API.
+PARSERS = SOUP_PARSERS + ('selectolax',)
+
+
+def create_html_collector(parser: str = PARSER) -> HtmlCollectorInterface:
+    """Create the HTML collector of a parser backend.
+
+    :param parser: str: Parser backend (html.parser, lxml or selectolax).
+    :return: HtmlCollectorInterface: Collector of the parser backend.
+    :raises ValueError: If the parser is not supported.
+    :raises ImportError: If the parser is not installed.
+    """
+
+    if parser not in PARSERS:
+        raise ValueError(f'Invalid parser: {parser}. '
+                         f'Choose from: {", ".join(PARSERS)}.')
+
+    if parser == 'selectolax':
+        return SelectolaxHtmlCollector()
+
+    return HtmlCollector(parser=parser)
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: html_collector_test.py
-#  Version: 0.0.9
+#  Version: 0.0.12
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -18,7 +18,12 @@
 
 """Html Collector Test"""
 
+import pytest
+
+from fundamentus.utilities.config import SECTIONS
+
 from .html_collector import HtmlCollector
+from .html_collector_factory import create_html_collector
 from .mocks.companies_list import COMPANIES_LIST_MOCK
 from .mocks.html_collector import HTML_COLLECTOR_MOCK
 
@@ -68,3 +73,74 @@ def test_collect_list_of_property_funds() -> None:
 
     assert isinstance(collect_list_of_property_funds, list)
     assert isinstance(collect_list_of_property_funds[0], dict)
+
+
+@pytest.mark.parametrize('parser', ['lxml', 'selectolax'])
+def test_parser_backends(parser: str) -> None:
+    """Test every parser backend collects identical information."""
+
+    pytest.importorskip(parser)
+
+    reference = HtmlCollector(parser='html.parser')
+    collector = create_html_collector(parser)
+
+    assert collector.parser == parser
+    assert collector.collect_all_information(HTML_COLLECTOR_MOCK['content']) == \
+        reference.collect_all_information(HTML_COLLECTOR_MOCK['content'])
+    assert collector.collect_list_of_companies(COMPANIES_LIST_MOCK['content']) == \
+        reference.collect_list_of_companies(COMPANIES_LIST_MOCK['content'])
+    assert collector.collect_list_of_property_funds(COMPANIES_LIST_MOCK['content']) == \
+        reference.collect_list_of_property_funds(COMPANIES_LIST_MOCK['content'])
+    assert collector.collect_listings(COMPANIES_LIST_MOCK['content']) == \
+        reference.collect_listings(COMPANIES_LIST_MOCK['content'])
+
+
+@pytest.mark.parametrize('parser', ['html.parser', 'lxml', 'selectolax'])
+@pytest.mark.parametrize('sections', [
+    ['price_information', 'valuation_indicators'],
+    ['stock_identification'],
+    ['oscillations', 'income_statement'],
+    list(SECTIONS)
+])
+def test_collect_sections(parser: str, sections: list) -> None:
+    """Test only the requested sections are collected, identical to the whole page."""
+
+    if parser != 'html.parser':
+        pytest.importorskip(parser)
+
+    collector = create_html_collector(parser)
+    everything = collector.collect_all_information(HTML_COLLECTOR_MOCK['content'])
+    collected = collector.collect_all_information(HTML_COLLECTOR_MOCK['content'], sections)
+
+    raw_sections = {'stock_identification': 'identification', 'price_information': 'price'}
+    expected = [raw_sections.get(section, section) for section in SECTIONS
+                if section in sections]
+
+    assert list(collected) == expected
+    assert collected == {section: everything[section] for section in expected}
+
+
+def test_collect_invalid_section() -> None:
+    """Test an unknown section is refused."""
+
+    with pytest.raises(ValueError):
+        HtmlCollector().collect_all_information(HTML_COLLECTOR_MOCK['content'], ['prices'])
+
+
+def test_collect_listings() -> None:
+    """Test the companies and property funds are collected from one parse."""
+
+    collector = HtmlCollector()
+    listings = collector.collect_listings(COMPANIES_LIST_MOCK['content'])
+
+    assert listings['companies'] == collector.collect_list_of_companies(
+        COMPANIES_LIST_MOCK['content'])
+    assert listings['property_funds'] == collector.collect_list_of_property_funds(
+        COMPANIES_LIST_MOCK['content'])
+
+
+def test_invalid_parser() -> None:
+    """Test an unknown parser backend is refused."""
+
+    with pytest.raises(ValueError):
+        create_html_collector('regex')
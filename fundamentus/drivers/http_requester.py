@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: http_requester.py
-#  Version: 0.0.5
+#  Version: 0.0.9
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -15,12 +15,23 @@
 #
 #  License: MIT
 # ------------------------------------------------------------------------------
-"""HTTP Requester - This module is responsible for making HTTP requests."""
+"""HTTP Requester - This module is responsible for making HTTP requests.
+
+Expired cached pages are revalidated with a conditional request (If-None-Match
+and If-Modified-Since, from the ETag and Last-Modified headers stored with the
+page). A 304 Not Modified answer refreshes the cache expiration and reuses the
+cached body. Pages served without those headers are downloaded again.
+"""
+
+from typing import List, Tuple
 
 import requests
-import requests_cache
 
 from fundamentus.contracts.request_contract import RequestContract
+from fundamentus.drivers.http_session_pool import (HttpSessionPool,
+                                                   get_shared_session_pool)
+from fundamentus.drivers.rate_limiter import (RateLimiter,
+                                              get_shared_rate_limiter)
 from fundamentus.utilities.random_user_agent import get_random_user_agent
 from .interfaces.http_requester import HttpRequesterInterface
 
@@ -29,38 +40,60 @@ from .interfaces.http_requester import HttpRequesterInterface
 class HttpRequester(HttpRequesterInterface):
     """Represents a complete HTTP request."""
 
-    def __init__(self, url: str, params: dict) -> None:
+    def __init__(self, url: str, params: dict,
+                 session_pool: HttpSessionPool = None,
+                 rate_limiter: RateLimiter = None) -> None:
         """Initialize the class.
 
         :param url: str: URL to make the request.
         :param params: dict: Parameters to make the request.
+        :param session_pool: HttpSessionPool: Pool of keep-alive connections,
+                             defaults to the process-wide shared pool.
+        :param rate_limiter: RateLimiter: Request rate limiter,
+                             defaults to the process-wide shared limiter.
         """
 
         self.__url = url
         self.__params = params
         self.__headers = {"User-Agent": get_random_user_agent()}
         self.__fundamentus_request = RequestContract
+        self.__session_pool = session_pool or get_shared_session_pool()
+        self.__rate_limiter = rate_limiter or get_shared_rate_limiter()
 
-    @staticmethod
-    def __send_http_request(prepared_request: requests.PreparedRequest) -> requests.Response:
-        """Send the HTTP request.
+    def __send_http_request(
+            self, prepared_request: requests.PreparedRequest) -> Tuple[requests.Response, bool]:
+        """Send the HTTP request, retrying while the response is throttled.
 
         :param prepared_request: requests.PreparedRequest: Prepared request.
-        :return: requests.Response: Response of the request.
+        :return: tuple: Response of the request, and whether it is a cached
+                 page revalidated by the server.
         :raises HTTPError: If the request fails.
         """
 
-        # Cache is expired after 12 hours (43200 seconds).
-        requests_cache.install_cache(cache_name='fundamentus_cache',
-                                     backend='sqlite',
-                                     expire_after=43200)
+        # Every response received, including a 304 replaced by the cached page.
+        status_codes: List[int] = []
+        prepared_request.register_hook('response',
+                                       lambda response, **_: status_codes.append(
+                                           response.status_code))
+
+        attempt = 0
+
+        while True:
+            self.__rate_limiter.acquire()
+            response = self.__session_pool.send(prepared_request)
+
+            if not self.__rate_limiter.should_retry(response.status_code, attempt):
+                break
+
+            self.__rate_limiter.backoff(attempt, response.headers.get('Retry-After'))
+            attempt += 1
 
-        with requests.Session() as session:
-            response = session.send(prepared_request)
+        response.raise_for_status()
 
-            response.raise_for_status()
+        revalidated = (requests.codes.not_modified in status_codes
+                       and getattr(response, 'from_cache', False))
 
-            return response
+        return response, revalidated
 
     def make_request(self) -> RequestContract:
         """Make request to the url and return the response.
@@ -76,10 +109,11 @@ class HttpRequester(HttpRequesterInterface):
                                        headers=self.__headers)
 
             prepared_request = request.prepare()
-            response = self.__send_http_request(prepared_request)
+            response, revalidated = self.__send_http_request(prepared_request)
 
             return self.__fundamentus_request(status_code=response.status_code,
                                               request=request,
-                                              response=response)
+                                              response=response,
+                                              revalidated=revalidated)
         except requests.exceptions.RequestException as error:
             raise error
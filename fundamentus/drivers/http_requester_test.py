@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: http_requester_test.py
-#  Version: 0.0.2
+#  Version: 0.0.3
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -18,10 +18,14 @@
 
 """HTTP Requester Test."""
 
+from datetime import datetime
+
 import pytest
 from requests.exceptions import RequestException
 
+from .cache_manager import CacheManager
 from .http_requester import HttpRequester
+from .http_session_pool import HttpSessionPool
 from .mocks.http_requester import REQUESTER_MOCK
 
 
@@ -67,3 +71,39 @@ def test_make_request_error(requests_mock) -> None:
         requester.make_request()
     except RequestException as error:
         assert error is not None
+
+
+def test_make_request_revalidation(requests_mock) -> None:
+    """Test an expired cached page is revalidated with a conditional request.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    url = 'https://www.fundamentus.com.br/detalhes.php'
+    payload = {'papel': 'MGLU3'}
+
+    requests_mock.get(url=url,
+                      status_code=REQUESTER_MOCK['status_code'],
+                      text=REQUESTER_MOCK['content'],
+                      headers={'ETag': '"MGLU3-2023Q3"'})
+    requests_mock.get(url=url,
+                      request_headers={'If-None-Match': '"MGLU3-2023Q3"'},
+                      status_code=304)
+
+    # Every page expires as soon as it is cached.
+    session_pool = HttpSessionPool(cache_manager=CacheManager(backend='memory',
+                                                              expire_after=datetime(2000, 1, 1)))
+
+    try:
+        first_response = HttpRequester(url=url, params=payload,
+                                       session_pool=session_pool).make_request()
+        second_response = HttpRequester(url=url, params=payload,
+                                        session_pool=session_pool).make_request()
+    finally:
+        session_pool.close()
+
+    assert not first_response.revalidated
+    assert second_response.revalidated
+    assert second_response.status_code == REQUESTER_MOCK['status_code']
+    assert second_response.response.text == REQUESTER_MOCK['content']
+    assert requests_mock.request_history[1].headers['If-None-Match'] == '"MGLU3-2023Q3"'
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: http_session_pool.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""HTTP Session Pool.
+
+This module keeps a process-wide keep-alive HTTP session, so every request
+made to the Fundamentus website reuses the already opened TCP/TLS connections
+instead of paying a new handshake per ticker.
+
+"""
+
+from threading import Lock
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fundamentus.drivers.cache_manager import CacheManager
+from fundamentus.utilities.config import (MAX_RETRIES, POOL_CONNECTIONS,
+                                          POOL_MAXSIZE)
+
+
+class HttpSessionPool:
+    """Represents a shared pool of keep-alive HTTP connections."""
+
+    def __init__(self,
+                 pool_connections: int = POOL_CONNECTIONS,
+                 pool_maxsize: int = POOL_MAXSIZE,
+                 max_retries: int = MAX_RETRIES,
+                 cache_manager: CacheManager = None) -> None:
+        """Initialize the class.
+
+        :param pool_connections: int: Number of host pools to keep cached.
+        :param pool_maxsize: int: Maximum number of connections kept per host.
+        :param max_retries: int: Retries made on connection errors.
+        :param cache_manager: CacheManager: HTTP response cache configuration,
+                              defaults to the one defined in config.py.
+        """
+
+        self.__pool_connections = pool_connections
+        self.__pool_maxsize = pool_maxsize
+        self.__max_retries = max_retries
+        self.__cache_manager = cache_manager or CacheManager()
+
+        self.__session = None
+        self.__lock = Lock()
+
+    def __create_session(self) -> requests.Session:
+        """Create a session mounted with the pooled adapter.
+
+        :return: requests.Session: Session ready to be shared.
+        """
+
+        adapter = HTTPAdapter(pool_connections=self.__pool_connections,
+                              pool_maxsize=self.__pool_maxsize,
+                              max_retries=Retry(total=self.__max_retries))
+
+        session = self.__cache_manager.create_session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    @property
+    def cache_manager(self) -> CacheManager:
+        """Return the HTTP response cache configuration."""
+
+        return self.__cache_manager
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the shared session, creating it on first use.
+
+        :return: requests.Session: The shared session.
+        """
+
+        if self.__session is None:
+            with self.__lock:
+                if self.__session is None:
+                    self.__session = self.__create_session()
+
+        return self.__session
+
+    def send(self, prepared_request: requests.PreparedRequest) -> requests.Response:
+        """Send a prepared request through the shared session.
+
+        :param prepared_request: requests.PreparedRequest: Prepared request.
+        :return: requests.Response: Response of the request.
+        """
+
+        return self.session.send(prepared_request)
+
+    def connection_statistics(self) -> Dict[str, int]:
+        """Report how many connections were opened and how many were reused.
+
+        :return: dict: Number of requests, opened connections and reused connections.
+        """
+
+        requests_sent = 0
+        connections_opened = 0
+
+        if self.__session is not None:
+            for adapter in set(self.__session.adapters.values()):
+                for key in adapter.poolmanager.pools.keys():
+                    pool = adapter.poolmanager.pools[key]
+                    requests_sent += pool.num_requests
+                    connections_opened += pool.num_connections
+
+        return {
+            'requests': requests_sent,
+            'connections': connections_opened,
+            'reused_connections': max(requests_sent - connections_opened, 0)
+        }
+
+    def close(self) -> None:
+        """Close the shared session and release all pooled connections."""
+
+        with self.__lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
+
+
+# Process-wide pool shared by every pipeline.
+__SHARED_SESSION_POOL = HttpSessionPool()
+
+
+def get_shared_session_pool() -> HttpSessionPool:
+    """Return the process-wide session pool.
+
+    :return: HttpSessionPool: The shared session pool.
+    """
+
+    return __SHARED_SESSION_POOL
+
+
+def configure_shared_session_pool(pool_connections: int = POOL_CONNECTIONS,
+                                  pool_maxsize: int = POOL_MAXSIZE,
+                                  max_retries: int = MAX_RETRIES,
+                                  cache_manager: CacheManager = None) -> HttpSessionPool:
+    """Replace the process-wide session pool with a new configuration.
+
+    Meant to be called once, before the pipelines are created. Pipelines
+    created earlier keep using the previous pool.
+
+    :param pool_connections: int: Number of host pools to keep cached.
+    :param pool_maxsize: int: Maximum number of connections kept per host.
+    :param max_retries: int: Retries made on connection errors.
+    :param cache_manager: CacheManager: HTTP response cache configuration.
+    :return: HttpSessionPool: The new shared session pool.
+    """
+
+    global __SHARED_SESSION_POOL  # pylint: disable=global-statement
+
+    __SHARED_SESSION_POOL.close()
+    __SHARED_SESSION_POOL = HttpSessionPool(pool_connections=pool_connections,
+                                            pool_maxsize=pool_maxsize,
+                                            max_retries=max_retries,
+                                            cache_manager=cache_manager)
+
+    return __SHARED_SESSION_POOL
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: http_session_pool_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""HTTP Session Pool Test."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import requests
+
+from .cache_manager import CacheManager
+from .http_session_pool import HttpSessionPool, get_shared_session_pool
+from .mocks.http_requester import REQUESTER_MOCK
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answer every GET with the requester mock, keeping the connection open."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Send the mocked page."""
+
+        content = REQUESTER_MOCK['content'].encode('utf-8')
+
+        self.send_response(REQUESTER_MOCK['status_code'])
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+        """Silence the server log."""
+
+
+def test_shared_session_pool() -> None:
+    """Test the shared session pool is a single instance."""
+
+    assert get_shared_session_pool() is get_shared_session_pool()
+    assert get_shared_session_pool().session is get_shared_session_pool().session
+
+
+def test_connection_reuse() -> None:
+    """Test the pooled session reuses the same connection."""
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    pool = HttpSessionPool(pool_connections=1,
+                           pool_maxsize=1,
+                           max_retries=0,
+                           cache_manager=CacheManager(backend=None))
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    try:
+        for page in range(3):
+            request = requests.Request(method='GET', url=f'{url}/{page}').prepare()
+            response = pool.send(request)
+
+            assert response.text == REQUESTER_MOCK['content']
+
+        statistics = pool.connection_statistics()
+
+        assert statistics['requests'] == 3
+        assert statistics['connections'] == 1
+        assert statistics['reused_connections'] == 2
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    assert pool.connection_statistics()['requests'] == 0
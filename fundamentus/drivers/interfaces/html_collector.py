@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: http_requester.py
-#  Version: 0.0.2
+#  Version: 0.0.6
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -19,16 +19,29 @@
 """Html Collector Interface."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
 
 
 # pylint: disable=too-few-public-methods
 class HtmlCollectorInterface(ABC):
-    """Represents a complete HTML collector."""
+    """Represents a complete HTML collector.
+
+    Every parser backend must collect identical dictionaries from the same HTML.
+    """
+
+    @property
+    @abstractmethod
+    def parser(self) -> str:
+        """Name of the parser backend."""
+
+        raise NotImplementedError("You should implement this method.")
 
     @abstractmethod
-    def collect_all_information(self, html: str) -> Dict:
-        """Collect all information from single stock from Fundamentus website."""
+    def collect_all_information(self,
+                                html: str,
+                                sections: Optional[Iterable[str]] = None) -> Dict:
+        """Collect all information, or only some sections, from single stock
+        from Fundamentus website."""
 
         raise NotImplementedError("You should implement this method.")
 
@@ -43,3 +56,9 @@ class HtmlCollectorInterface(ABC):
         """Collect list of companies from Fundamentus website."""
 
         raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def collect_listings(self, html: str) -> Dict[str, List[Dict]]:
+        """Collect lists of companies and property funds from a single parse."""
+
+        raise NotImplementedError("You should implement this method.")
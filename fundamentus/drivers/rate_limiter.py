@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: rate_limiter.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Rate Limiter.
+
+This module keeps the requests made to the Fundamentus website under a
+configurable rate, with a token bucket shared by threads and asynchronous
+tasks, and backs off exponentially, with jitter, when the website answers
+with 429 or 5xx.
+
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Dict, Optional
+
+from fundamentus.utilities.config import (BACKOFF_FACTOR, BACKOFF_MAX,
+                                          BACKOFF_RETRIES, RATE_LIMIT,
+                                          RATE_LIMIT_BURST, RETRY_STATUSES)
+
+
+def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """Parse the Retry-After header.
+
+    :param retry_after: str: Header value, in seconds or as an HTTP date.
+    :return: float: Seconds to wait, or None when the header is missing or invalid.
+    """
+
+    if not retry_after:
+        return None
+
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+    return max((retry_date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Represents a token bucket with exponential backoff on throttled responses.
+
+    Tokens are reserved under a lock, so a single instance can be shared by
+    threads and asynchronous tasks. A request that finds the bucket empty
+    waits for its reserved token instead of polling.
+    """
+
+    def __init__(self,
+                 requests_per_second: float = RATE_LIMIT,
+                 burst: int = RATE_LIMIT_BURST,
+                 max_retries: int = BACKOFF_RETRIES,
+                 backoff_factor: float = BACKOFF_FACTOR,
+                 backoff_max: float = BACKOFF_MAX,
+                 retry_statuses: tuple = RETRY_STATUSES) -> None:
+        """Initialize the class.
+
+        :param requests_per_second: float: Sustained request rate, None disables the limit.
+        :param burst: int: Number of requests that may be sent at once.
+        :param max_retries: int: Retries made on a throttled response.
+        :param backoff_factor: float: Base delay, in seconds, of the exponential backoff.
+        :param backoff_max: float: Maximum delay, in seconds, between two retries.
+        :param retry_statuses: tuple: Status codes that are retried.
+        :raises ValueError: If the rate or the burst is not positive.
+        """
+
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError('The request rate must be positive.')
+
+        if burst < 1:
+            raise ValueError('The burst must be at least one request.')
+
+        self.__rate = requests_per_second
+        self.__burst = burst
+        self.__max_retries = max_retries
+        self.__backoff_factor = backoff_factor
+        self.__backoff_max = backoff_max
+        self.__retry_statuses = frozenset(retry_statuses)
+
+        self.__tokens = float(burst)
+        self.__last_refill = time.monotonic()
+        self.__lock = Lock()
+
+        self.__requests = 0
+        self.__retries = 0
+        self.__throttled_time = 0.0
+        self.__backoff_time = 0.0
+
+    @property
+    def max_retries(self) -> int:
+        """Return the number of retries made on a throttled response."""
+
+        return self.__max_retries
+
+    def __reserve(self) -> float:
+        """Reserve a token.
+
+        :return: float: Seconds to wait until the reserved token is available.
+        """
+
+        with self.__lock:
+            self.__requests += 1
+
+            if self.__rate is None:
+                return 0.0
+
+            now = time.monotonic()
+            self.__tokens = min(self.__burst,
+                                self.__tokens + (now - self.__last_refill) * self.__rate)
+            self.__last_refill = now
+            self.__tokens -= 1
+
+            delay = -self.__tokens / self.__rate if self.__tokens < 0 else 0.0
+            self.__throttled_time += delay
+
+            return delay
+
+    def acquire(self) -> None:
+        """Block the current thread until a request may be sent."""
+
+        delay = self.__reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Suspend the current task until a request may be sent."""
+
+        delay = self.__reserve()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """Return whether a response must be retried.
+
+        :param status_code: int: Status code of the response.
+        :param attempt: int: Number of retries already made.
+        :return: bool: True if the status is throttled and retries are left.
+        """
+
+        return status_code in self.__retry_statuses and attempt < self.__max_retries
+
+    def retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Compute the delay before the next retry and record it.
+
+        The Retry-After header, when present, is honoured up to the maximum
+        backoff delay, so a server cannot stall the batch; otherwise the delay
+        is drawn at random up to an exponentially growing limit (full jitter),
+        so concurrent requests do not retry in lockstep. The bucket is drained
+        for the same delay, pausing every other request sharing it.
+
+        :param attempt: int: Number of retries already made.
+        :param retry_after: str: Retry-After header of the response.
+        :return: float: Seconds to wait before retrying.
+        """
+
+        delay = parse_retry_after(retry_after)
+
+        if delay is None:
+            delay = random.uniform(0, min(self.__backoff_max,
+                                          self.__backoff_factor * 2 ** attempt))
+        else:
+            delay = min(delay, self.__backoff_max)
+
+        with self.__lock:
+            self.__retries += 1
+            self.__backoff_time += delay
+
+            if self.__rate is not None:
+                self.__tokens = min(self.__tokens, -delay * self.__rate)
+                self.__last_refill = time.monotonic()
+
+        return delay
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """Block the current thread before retrying.
+
+        :param attempt: int: Number of retries already made.
+        :param retry_after: str: Retry-After header of the response.
+        """
+
+        time.sleep(self.retry_delay(attempt, retry_after))
+
+    async def backoff_async(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """Suspend the current task before retrying.
+
+        :param attempt: int: Number of retries already made.
+        :param retry_after: str: Retry-After header of the response.
+        """
+
+        await asyncio.sleep(self.retry_delay(attempt, retry_after))
+
+    def metrics(self) -> Dict[str, float]:
+        """Report how much the requests were throttled.
+
+        :return: dict: Number of requests and retries, and seconds spent
+                 waiting for tokens and backing off.
+        """
+
+        with self.__lock:
+            return {
+                'requests': self.__requests,
+                'retries': self.__retries,
+                'throttled_time': self.__throttled_time,
+                'backoff_time': self.__backoff_time
+            }
+
+
+# Process-wide rate limiter shared by every requester.
+__SHARED_RATE_LIMITER = RateLimiter()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter.
+
+    :return: RateLimiter: The shared rate limiter.
+    """
+
+    return __SHARED_RATE_LIMITER
+
+
+def configure_shared_rate_limiter(requests_per_second: float = RATE_LIMIT,
+                                  burst: int = RATE_LIMIT_BURST,
+                                  max_retries: int = BACKOFF_RETRIES,
+                                  backoff_factor: float = BACKOFF_FACTOR,
+                                  backoff_max: float = BACKOFF_MAX) -> RateLimiter:
+    """Replace the process-wide rate limiter with a new configuration.
+
+    Meant to be called once, before the pipelines are created. Pipelines
+    created earlier keep using the previous limiter.
+
+    :param requests_per_second: float: Sustained request rate, None disables the limit.
+    :param burst: int: Number of requests that may be sent at once.
+    :param max_retries: int: Retries made on a throttled response.
+    :param backoff_factor: float: Base delay, in seconds, of the exponential backoff.
+    :param backoff_max: float: Maximum delay, in seconds, between two retries.
+    :return: RateLimiter: The new shared rate limiter.
+    """
+
+    global __SHARED_RATE_LIMITER  # pylint: disable=global-statement
+
+    __SHARED_RATE_LIMITER = RateLimiter(requests_per_second=requests_per_second,
+                                        burst=burst,
+                                        max_retries=max_retries,
+                                        backoff_factor=backoff_factor,
+                                        backoff_max=backoff_max)
+
+    return __SHARED_RATE_LIMITER
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: rate_limiter_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Rate Limiter Test."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests.exceptions import HTTPError
+
+from .http_requester import HttpRequester
+from .mocks.http_requester import REQUESTER_MOCK
+from .rate_limiter import RateLimiter, parse_retry_after
+
+URL = 'https://www.fundamentus.com.br/detalhes.php'
+
+
+def test_parse_retry_after() -> None:
+    """Test the Retry-After header in seconds and as an HTTP date."""
+
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('invalid') is None
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+def test_retry_after_is_clamped() -> None:
+    """Test the Retry-After delay never exceeds the maximum backoff delay."""
+
+    limiter = RateLimiter(requests_per_second=None, backoff_max=5)
+
+    assert limiter.retry_delay(0, '2') == 2.0
+    assert limiter.retry_delay(0, '3600') == 5
+
+
+def test_rate_limit_shared_by_threads() -> None:
+    """Test the requests of many threads are spaced by the shared bucket."""
+
+    limiter = RateLimiter(requests_per_second=100, burst=1)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: limiter.acquire(), range(11)))
+    elapsed = time.monotonic() - start
+
+    metrics = limiter.metrics()
+
+    assert elapsed >= 0.09
+    assert metrics['requests'] == 11
+    assert metrics['throttled_time'] > 0
+
+
+def test_rate_limit_shared_by_tasks() -> None:
+    """Test the requests of many tasks are spaced by the shared bucket."""
+
+    limiter = RateLimiter(requests_per_second=100, burst=1)
+
+    async def acquire_all() -> None:
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(11)))
+
+    start = time.monotonic()
+    asyncio.run(acquire_all())
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_retry_throttled_response(requests_mock) -> None:
+    """Test a 429 response is retried after the Retry-After header.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    requests_mock.get(URL, [
+        {'status_code': 429, 'headers': {'Retry-After': '0'}},
+        {'status_code': 503},
+        {'status_code': REQUESTER_MOCK['status_code'], 'text': REQUESTER_MOCK['content']}
+    ])
+
+    limiter = RateLimiter(backoff_factor=0.001)
+    requester = HttpRequester(url=URL, params={'papel': 'MGLU3'}, rate_limiter=limiter)
+    response = requester.make_request()
+
+    assert response.status_code == REQUESTER_MOCK['status_code']
+    assert requests_mock.call_count == 3
+    assert limiter.metrics()['retries'] == 2
+
+
+def test_retry_gives_up(requests_mock) -> None:
+    """Test the error is raised once the retries are exhausted.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    requests_mock.get(URL, status_code=503)
+
+    limiter = RateLimiter(max_retries=2, backoff_factor=0.001)
+    requester = HttpRequester(url=URL, params={'papel': 'MGLU3'}, rate_limiter=limiter)
+
+    with pytest.raises(HTTPError):
+        requester.make_request()
+
+    assert requests_mock.call_count == 3
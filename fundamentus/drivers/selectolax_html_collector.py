@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: selectolax_html_collector.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Selectolax HTML Collector.
+
+This module collects the same information as the HtmlCollector, with the
+lexbor engine of selectolax instead of BeautifulSoup. The collected
+dictionaries are identical, only the parsing is faster.
+
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover
+    LexborHTMLParser = None
+
+from fundamentus.utilities.sections import truncate_page, validate_sections
+
+from .interfaces.html_collector import HtmlCollectorInterface
+
+# Table holding the companies and the property funds in the listing page.
+LISTING_TABLE = 'table.table.table-default.table-sort.table-resultados-trimestrais'
+
+# Keys of the oscillations, in the order they appear on the page.
+OSCILLATIONS = ('variation_day', 'variation_month', 'variation_30_days',
+                'variation_12_months', 'variation_2022', 'variation_2021',
+                'variation_2020', 'variation_2019', 'variation_2018',
+                'variation_2017')
+
+# Keys of the indicators, in the order they appear on each frame of the page.
+VALUATION_INDICATORS = ('price_divided_by_profit_title', 'price_divided_by_asset_value',
+                        'price_divided_by_ebit', 'price_divided_by_net_revenue',
+                        'price_divided_by_total_assets',
+                        'price_divided_by_net_current_assets', 'dividend_yield',
+                        'enterprise_value_by_ebitda', 'enterprise_value_by_ebit',
+                        'price_by_working_capital')
+PROFITABILITY_INDICATORS = ('return_on_equity', 'return_on_invested_capital',
+                            'ebit_divided_by_total_assets',
+                            'net_revenue_growth_last_5_years',
+                            'net_revenue_divided_by_total_assets',
+                            'gross_profit_divided_by_net_revenue',
+                            'ebit_divided_by_net_revenue',
+                            'net_income_divided_by_net_revenue')
+INDEBTEDNESS_INDICATORS = ('current_liquidity', 'gross_debt_by_equity',
+                           'net_debt_by_equity', 'net_debt_by_ebitda',
+                           'equity_by_total_assets')
+
+
+class SelectolaxHtmlCollector(HtmlCollectorInterface):
+    """Represents a HTML collector backed by selectolax."""
+
+    def __init__(self) -> None:
+        """Initialize the class.
+
+        :raises ImportError: If selectolax is not installed.
+        """
+
+        if LexborHTMLParser is None:
+            raise ImportError('The selectolax collector requires selectolax: '
+                              'pip install pyfundamentus[fast]')
+
+    @property
+    def parser(self) -> str:
+        """Return the name of the parser backend."""
+
+        return 'selectolax'
+
+    @staticmethod
+    def __processing_data_tooltip(node) -> str:
+        """Process data tooltip information.
+
+        :param node (Node): Node holding the information.
+        :return (str): String with the processed information.
+        """
+
+        tooltip = node.css_first('span.data-tooltip').attributes
+
+        return tooltip['title'] or tooltip['data-original-title']
+
+    def __processing_data(self, node) -> List[str]:
+        """Process the title, tooltip and value of an information.
+
+        :param node (Node): Node holding the information.
+        :return (list): Title, tooltip and value.
+        """
+
+        return [node.css_first('span.data-title').text(),
+                self.__processing_data_tooltip(node),
+                node.css_first('span.data-value').text()]
+
+    def __extraction_indicators(self, frame, keys: tuple) -> Dict:
+        """Extract the indicators of a frame.
+
+        :param frame (Node): Frame holding the indicators.
+        :param keys (tuple): Keys of the indicators, in page order.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        information = frame.css('div.col-6.col-sm-4.col-md-2')
+
+        return {key: self.__processing_data(node) for key, node in zip(keys, information)}
+
+    @staticmethod
+    def __extraction_stock_identification(tree) -> Dict:
+        """Extract the identification of the stock.
+
+        :param tree (LexborHTMLParser): Parsed page.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        return {
+            'symbol': [tree.css_first('h1.acao-papel').text()],
+            'name': [tree.css_first('span.acao-nome').text()]
+        }
+
+    def __extraction_financial_summary(self, frame) -> Dict:
+        """Extract the financial summary of the stock.
+
+        :param frame (Node): Frame holding the financial summary.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        return {
+            key: self.__processing_data(node)
+            for key, node in zip(('market_valuation', 'enterprise_valuation',
+                                  'number_of_shares', 'last_financial_statement',
+                                  'sector', 'subsector'), frame.css('div.data'))
+        }
+
+    def __extraction_price(self, tree) -> Dict:
+        """Extract the price of the stock.
+
+        :param tree (LexborHTMLParser): Parsed page.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        price = tree.css_first('div.frame-cotacao').css('div.data')
+
+        return {
+            'price': self.__processing_data(price[0]),
+            'date': self.__processing_data(price[1])
+        }
+
+    @staticmethod
+    def __extraction_oscillations(tree) -> Dict:
+        """Extract the oscillations of the stock.
+
+        :param tree (LexborHTMLParser): Parsed page.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        oscillations = tree.css_first('div.oscilacoes').css('div.data')
+
+        return {
+            key: [node.css_first('span.data-text').text(),
+                  node.css_first('span.data-value').text()]
+            for key, node in zip(OSCILLATIONS, oscillations)
+        }
+
+    def __extraction_detailed_information(self, tree) -> Dict:
+        """Extract the detailed information of the stock.
+
+        :param tree (LexborHTMLParser): Parsed page.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        information = tree.css_first('div.col.col-xl-auto.vpalpa2-estilo').css('div.data')
+        # The variation at 52 weeks (information[4]) nests the lowest and highest values.
+        variation_52_weeks = information[5:7]
+
+        return {
+            'stock_type': self.__processing_data(information[0]),
+            'traded_volume_per_day': self.__processing_data(information[1]),
+            'equity_value_per_share': self.__processing_data(information[2]),
+            'earnings_per_share': self.__processing_data(information[3]),
+            'variation_52_weeks': {
+                'lowest_value': [self.__processing_data_tooltip(variation_52_weeks[0]),
+                                 variation_52_weeks[0].css_first('span.data-value').text()],
+                'highest_value': [self.__processing_data_tooltip(variation_52_weeks[1]),
+                                  variation_52_weeks[1].css_first('span.data-value').text()]
+            }
+        }
+
+    def __extraction_balance_sheet(self, frame) -> Dict:
+        """Extract the balance sheet of the stock.
+
+        :param frame (Node): Frame holding the balance sheet.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        columns = frame.css('div.col-sm')
+        column_left = columns[0].css('div.data')
+        column_right = columns[1].css('div.data')
+
+        if len(column_left) != 3 or len(column_right) != 3:
+            # Banks report credit portfolio and deposits instead of debts.
+            return {
+                'total_assets': self.__processing_data(column_left[0]),
+                'credit_portfolio': self.__processing_data(column_left[1]),
+                'deposits': self.__processing_data(column_right[0]),
+                'equity': self.__processing_data(column_right[1])
+            }
+
+        return {
+            'total_assets': self.__processing_data(column_left[0]),
+            'current_assets': self.__processing_data(column_left[1]),
+            'cash': self.__processing_data(column_left[2]),
+            'gross_debt': self.__processing_data(column_right[0]),
+            'net_debt': self.__processing_data(column_right[1]),
+            'equity': self.__processing_data(column_right[2])
+        }
+
+    @staticmethod
+    def __extraction_income_statement(frame) -> Dict:
+        """Extract the income statement of the stock.
+
+        :param frame (Node): Frame holding the income statement.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        values = [node.text() for node in frame.css('span.dt-value')]
+        titles = [node.text() for node in frame.css('span.dt-title')]
+        tooltips = [node.attributes['title'] for node in frame.css('span.data-tooltip')]
+
+        # The values alternate between the last 12 and 3 months.
+        keys = ('revenue', 'ebit', 'net_income')
+
+        return {
+            'twelve_months': {key: [titles[index], tooltips[index], values[2 * index]]
+                              for index, key in enumerate(keys)},
+            'three_months': {key: [titles[index], tooltips[index], values[2 * index + 1]]
+                             for index, key in enumerate(keys)}
+        }
+
+    def collect_all_information(self,
+                                html: str,
+                                sections: Optional[Iterable[str]] = None) -> Dict:
+        """Collect information from the html.
+
+        param: html (str): HTML content.
+        param: sections (Iterable[str]): Sections to collect, None collects every section.
+
+        :return: dict: Dictionary with the collected information.
+        :raises ValueError: If a section is unknown or the page is not from a stock.
+        """
+
+        sections = validate_sections(sections)
+        tree = LexborHTMLParser(truncate_page(html, sections))
+
+        if tree.css_first(LISTING_TABLE):
+            raise ValueError('The HTML content is not from a stock.')
+
+        frames = tree.css('div.frame')
+
+        # Each section, with its raw key and its extraction, in page order.
+        extractions = (
+            ('stock_identification', 'identification',
+             lambda: self.__extraction_stock_identification(tree)),
+            ('financial_summary', 'financial_summary',
+             lambda: self.__extraction_financial_summary(frames[0])),
+            ('price_information', 'price', lambda: self.__extraction_price(tree)),
+            ('detailed_information', 'detailed_information',
+             lambda: self.__extraction_detailed_information(tree)),
+            ('oscillations', 'oscillations', lambda: self.__extraction_oscillations(tree)),
+            ('valuation_indicators', 'valuation_indicators',
+             lambda: self.__extraction_indicators(frames[4], VALUATION_INDICATORS)),
+            ('profitability_indicators', 'profitability_indicators',
+             lambda: self.__extraction_indicators(frames[5], PROFITABILITY_INDICATORS)),
+            ('indebtedness_indicators', 'indebtedness_indicators',
+             lambda: self.__extraction_indicators(frames[6], INDEBTEDNESS_INDICATORS)),
+            ('balance_sheet', 'balance_sheet', lambda: self.__extraction_balance_sheet(frames[7])),
+            ('income_statement', 'income_statement',
+             lambda: self.__extraction_income_statement(frames[8]))
+        )
+
+        return {raw_section: extraction()
+                for section, raw_section, extraction in extractions
+                if section in sections}
+
+    @staticmethod
+    def __collection_companies(table) -> List[Dict]:
+        """Collect the companies of the listing table.
+
+        :param table (Node): Table of companies.
+        :return: list: list of companies collected.
+        """
+
+        companies_list = []
+        for company in table.css('tr')[1:]:
+            company_code, company_name, corporate_name = company.css('td')
+
+            companies_list.append({
+                'code': company_code.text(),
+                'name': company_name.text(),
+                'corporate_name': corporate_name.text(),
+                'link': company_code.css_first('a').attributes['href']
+            })
+
+        return companies_list
+
+    @staticmethod
+    def __collection_property_funds(table) -> List[Dict]:
+        """Collect the property funds of the listing table.
+
+        :param table (Node): Table of property funds.
+        :return: list: list of property funds collected.
+        """
+
+        funds_list = []
+        for fund in table.css('tr')[1:]:
+            fund_code, fund_name = fund.css('td')
+
+            funds_list.append({
+                'code': fund_code.text(),
+                'name': fund_name.text(),
+                'link': fund_code.css_first('a').attributes['href']
+            })
+
+        return funds_list
+
+    def collect_list_of_companies(self, html: str) -> List[Dict]:
+        """Collect list of companies from Fundamentus website.
+
+         param: html (str): HTML content.
+        :return: list: list of companies collected.
+        """
+
+        return self.__collection_companies(LexborHTMLParser(html).css(LISTING_TABLE)[0])
+
+    def collect_list_of_property_funds(self, html: str) -> List[Dict]:
+        """Collect list of property funds from Fundamentus website.
+
+         param: html (str): HTML content.
+        :return: list: list of property funds collected.
+        """
+
+        return self.__collection_property_funds(LexborHTMLParser(html).css(LISTING_TABLE)[1])
+
+    def collect_listings(self, html: str) -> Dict[str, List[Dict]]:
+        """Collect the companies and the property funds from a single parse.
+
+         param: html (str): HTML content.
+        :return: dict: lists of companies and property funds collected.
+        """
+
+        tables = LexborHTMLParser(html).css(LISTING_TABLE)
+
+        return {
+            'companies': self.__collection_companies(tables[0]),
+            'property_funds': self.__collection_property_funds(tables[1])
+        }
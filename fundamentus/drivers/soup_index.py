@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: soup_index.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Soup Index.
+
+Every `find`/`find_all` on a BeautifulSoup tree walks the whole subtree
+again, so extracting many sections costs one walk per section and per field.
+This module walks the tree once and indexes every classed tag under each of
+its ancestors, so the extraction code keeps calling `find` and `find_all`
+but each call becomes a dictionary lookup.
+
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+# Tags found under an ancestor, by tag name and class.
+IndexKey = Tuple[int, str, str]
+
+
+class IndexedTag:
+    """Represents a tag whose `find` and `find_all` are answered by the index.
+
+    Only the lookups by tag name and class, `{'class': ...}`, are supported,
+    which are the only ones the collector makes.
+    """
+
+    __slots__ = ('__index', '__tag')
+
+    def __init__(self, index: Dict[IndexKey, List[Tag]], tag: Tag) -> None:
+        """Initialize the class.
+
+        :param index: dict: Tags found under each ancestor, by tag name and class.
+        :param tag: Tag: Indexed tag.
+        """
+
+        self.__index = index
+        self.__tag = tag
+
+    @property
+    def text(self) -> str:
+        """Return the text of the tag and its descendants."""
+
+        return self.__tag.text
+
+    def __getitem__(self, attribute: str) -> str:
+        """Return an attribute of the tag."""
+
+        return self.__tag[attribute]
+
+    def find_all(self, name: str, attrs: Dict[str, str]) -> List['IndexedTag']:
+        """Return the descendants with a tag name and class, in document order.
+
+        :param name: str: Tag name.
+        :param attrs: dict: Class of the tags, as `{'class': ...}`.
+        :return: list: Matching descendants.
+        """
+
+        return [IndexedTag(self.__index, tag)
+                for tag in self.__index.get((id(self.__tag), name, attrs['class']), ())]
+
+    def find(self, name: str, attrs: Dict[str, str]) -> Optional['IndexedTag']:
+        """Return the first descendant with a tag name and class.
+
+        :param name: str: Tag name.
+        :param attrs: dict: Class of the tags, as `{'class': ...}`.
+        :return: IndexedTag: First matching descendant, or None.
+        """
+
+        tags = self.__index.get((id(self.__tag), name, attrs['class']))
+
+        return IndexedTag(self.__index, tags[0]) if tags else None
+
+
+def index_soup(soup: BeautifulSoup) -> IndexedTag:
+    """Walk the tree once, indexing every classed tag under each of its ancestors.
+
+    A tag is indexed under each of its classes and under its whole class
+    attribute, as BeautifulSoup matches both.
+
+    :param soup: BeautifulSoup: Parsed page.
+    :return: IndexedTag: Root of the indexed tree.
+    """
+
+    index: Dict[IndexKey, List[Tag]] = defaultdict(list)
+
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+
+        classes = tag.get('class')
+
+        if not classes:
+            continue
+
+        class_names = set(classes)
+        class_names.add(' '.join(classes))
+
+        for ancestor in tag.parents:
+            ancestor_id = id(ancestor)
+
+            for class_name in class_names:
+                index[(ancestor_id, tag.name, class_name)].append(tag)
+
+    return IndexedTag(index, soup)
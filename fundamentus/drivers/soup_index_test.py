@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: soup_index_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Soup Index Test."""
+
+from bs4 import BeautifulSoup as bs
+
+from .mocks.html_collector import HTML_COLLECTOR_MOCK
+from .soup_index import index_soup
+
+
+def test_index_matches_find_all() -> None:
+    """Test the indexed lookups return the same tags as BeautifulSoup."""
+
+    soup = bs(HTML_COLLECTOR_MOCK['content'], 'html.parser')
+    page = index_soup(soup)
+
+    for name, class_name in (('div', 'frame'),
+                             ('div', 'data'),
+                             ('div', 'col-6 col-sm-4 col-md-2'),
+                             ('span', 'data-value')):
+        expected = soup.find_all(name, {'class': class_name})
+        indexed = page.find_all(name, {'class': class_name})
+
+        assert [tag.text for tag in indexed] == [tag.text for tag in expected]
+
+    frame = soup.find_all('div', {'class': 'frame'})[4]
+    indexed_frame = page.find_all('div', {'class': 'frame'})[4]
+
+    assert indexed_frame.find('span', {'class': 'data-title'}).text == \
+        frame.find('span', {'class': 'data-title'}).text
+    assert indexed_frame.find('span', {'class': 'missing'}) is None
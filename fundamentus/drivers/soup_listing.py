@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: soup_listing.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Soup Listing.
+
+This module collects the companies and the property funds of the listing
+page with BeautifulSoup. Only the two listing tables are parsed, the rest
+of the page is skipped by a strainer.
+
+"""
+
+from typing import Dict, List
+
+from bs4 import BeautifulSoup as bs
+from bs4 import SoupStrainer, Tag
+
+# Tables of companies and property funds in the listing page; only they are parsed.
+LISTING_TABLE = {'class': 'table table-default table-sort table-resultados-trimestrais'}
+LISTING_STRAINER = SoupStrainer('table', LISTING_TABLE)
+
+
+def collect_listing_tables(html: str, parser: str) -> List[Tag]:
+    """Parse only the tables of companies and property funds.
+
+    :param html (str): HTML content of the listing page.
+    :param parser (str): BeautifulSoup parser (html.parser or lxml).
+    :return: list: Tables of companies and property funds.
+    """
+
+    soup = bs(html, parser, parse_only=LISTING_STRAINER)
+
+    return soup.find_all('table', LISTING_TABLE)
+
+
+def collect_companies(table: Tag) -> List[Dict]:
+    """Collect the companies of the listing table.
+
+    :param table (Tag): Table of companies.
+    :return: list: list of companies collected.
+    """
+
+    companies = table.find_all('tr')
+
+    companies_list = []
+    for company in companies[1:]:
+        company_code, company_name, corporate_name = company.find_all('td')
+        company_link = company_code.find('a')['href']
+
+        companies_list.append({
+            'code': company_code.text,
+            'name': company_name.text,
+            'corporate_name': corporate_name.text,
+            'link': company_link
+        })
+
+    return companies_list
+
+
+def collect_property_funds(table: Tag) -> List[Dict]:
+    """Collect the property funds of the listing table.
+
+    :param table (Tag): Table of property funds.
+    :return: list: list of property funds collected.
+    """
+
+    funds = table.find_all('tr')
+
+    funds_list = []
+    for fund in funds[1:]:
+        fund_code, fund_name = fund.find_all('td')
+        fund_link = fund_code.find('a')['href']
+
+        funds_list.append({
+            'code': fund_code.text,
+            'name': fund_name.text,
+            'link': fund_link
+        })
+
+    return funds_list
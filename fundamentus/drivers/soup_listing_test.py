@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: soup_listing_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Soup Listing Test."""
+
+from .mocks.companies_list import COMPANIES_LIST_MOCK
+from .soup_listing import (collect_companies, collect_listing_tables,
+                           collect_property_funds)
+
+
+def test_collect_listing_tables() -> None:
+    """Test only the tables of companies and property funds are parsed."""
+
+    tables = collect_listing_tables(COMPANIES_LIST_MOCK['content'], 'html.parser')
+
+    assert len(tables) == 2
+
+    companies = collect_companies(tables[0])
+    funds = collect_property_funds(tables[1])
+
+    assert companies and set(companies[0]) == {'code', 'name', 'corporate_name', 'link'}
+    assert funds and set(funds[0]) == {'code', 'name', 'link'}
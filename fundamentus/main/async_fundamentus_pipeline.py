@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_fundamentus_pipeline.py
+#  Version: 0.0.12
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Asynchronous API
+
+This module provides a batch interface that downloads the detailed information
+of many companies concurrently, and then processes each page through the same
+collector and transformer used by the FundamentusPipeline.
+"""
+
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, Tuple, Union
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.async_http_requester import AsyncHttpRequester
+from fundamentus.drivers.html_collector_factory import create_html_collector
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.stages.extraction.extractor_html_information import \
+    ExtractorHtmlInformation as Extractor
+from fundamentus.stages.loading.checkpoint_journal import CheckpointJournal
+from fundamentus.stages.processing.incremental_refresh import \
+    IncrementalRefresh
+from fundamentus.stages.processing.parse_result_cache import (
+    ParseResultCache, get_shared_parse_cache)
+from fundamentus.stages.processing.process_pool_processor import \
+    ProcessPoolProcessor
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation as Transformer
+
+from fundamentus.utilities.config import (INTERFACE, MAX_CONCURRENCY,
+                                          MAX_WORKERS, NUMERIC_MODE, PARSER,
+                                          URL)
+from fundamentus.utilities.stage_metrics import (StageMetrics,
+                                                 get_shared_stage_metrics)
+from fundamentus.utilities.universe_snapshot import UniverseSnapshot
+
+
+class AsyncFundamentusPipeline:
+    """
+    A batch pipeline for accessing the financial information
+    of many companies listed on Bovespa at once.
+
+    The pages are downloaded concurrently, with at most `max_concurrency`
+    requests in flight, and each page is collected and transformed as soon
+    as its download finishes. With `parallel_processing`, the collect and
+    transform stages run in a pool of `max_workers` processes, so the
+    parsing does not block the downloads. Pages already transformed are
+    served from the parse result cache shared with the FundamentusPipeline.
+    With an `incremental` state, the fundamental sections of a company are
+    transformed again only when its last financial statement date changes.
+    With a checkpoint `journal`, each completed company is recorded as soon
+    as it is ready, and a run created with `resume` skips the companies a
+    previous, interrupted, run already completed.
+
+    Attributes:
+        tickers (Iterable[str]): The ticker symbols of the companies.
+        url (str): The base URL for the HTTP requests.
+        interface (str): The interface for the HTTP requests.
+        max_concurrency (int): The maximum number of requests in flight.
+        parallel_processing (bool): Whether the pages are parsed in worker processes.
+        max_workers (int): The number of worker processes.
+        parse_cache (ParseResultCache): The transformed pages, keyed by
+                                        their content hash.
+        parser (str): The HTML parser backend.
+        numeric_mode (str): The type of the transformed numbers.
+        incremental (IncrementalRefresh): The fundamental sections last seen
+                                          for each company.
+        journal (CheckpointJournal): The companies completed by the run.
+        resume (bool): Whether the companies in the journal are skipped.
+        metrics (StageMetrics): The time spent in each stage.
+
+    Methods:
+        get_all_information: Returns the detailed financial information
+                             of every company.
+        get_all_information_async: Coroutine version of get_all_information.
+        stream_all_information_async: Yields the information of each company
+                                      as soon as it is ready.
+        get_universe_snapshot: Returns every company in a columnar snapshot.
+        stage_metrics: Returns the time spent in each stage.
+    """
+
+    def __init__(self,
+                 tickers: Iterable[str],
+                 url: str = URL,
+                 interface: str = INTERFACE,
+                 max_concurrency: int = MAX_CONCURRENCY,
+                 parallel_processing: bool = False,
+                 max_workers: int = MAX_WORKERS,
+                 parse_cache: ParseResultCache = None,
+                 parser: str = PARSER,
+                 numeric_mode: str = NUMERIC_MODE,
+                 incremental: IncrementalRefresh = None,
+                 journal: CheckpointJournal = None,
+                 resume: bool = False,
+                 metrics: StageMetrics = None,
+                 transport=None) -> None:
+        """Initializes the AsyncFundamentusPipeline object.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies.
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            max_concurrency (int): The maximum number of requests in flight.
+            parallel_processing (bool): Whether the pages are parsed in worker processes.
+            max_workers (int): The number of worker processes, None uses every CPU.
+            parse_cache (ParseResultCache): The transformed pages, defaults to
+                                            the process-wide shared cache.
+            parser (str): The HTML parser backend (html.parser, lxml or selectolax).
+            numeric_mode (str): The type of the transformed numbers, 'decimal' or 'float'.
+            incremental (IncrementalRefresh): The fundamental sections last seen for
+                                              each company, None transforms every section.
+            journal (CheckpointJournal): The journal recording each completed company.
+            resume (bool): Whether the companies already in the journal are skipped
+                           and served from their stored results; otherwise the
+                           journal is started anew.
+            metrics (StageMetrics): The time spent in each stage, defaults to
+                                    the process-wide shared metrics.
+            transport (httpx.AsyncBaseTransport): Custom transport of the
+                                                  HTTP client, used by tests.
+        """
+
+        self.__tickers = list(dict.fromkeys(tickers))
+        self.__interface = interface
+
+        # A concurrent HTTP requester.
+        self.__requester = AsyncHttpRequester(url=url,
+                                              max_concurrency=max_concurrency,
+                                              transport=transport)
+        # A HTML information extractor.
+        self.__extractor = Extractor(requester=None, collector=create_html_collector(parser))
+        # A raw information transformer.
+        self.__transformer = Transformer(numeric_mode)
+        # A pool of processes that collects and transforms the pages.
+        self.__processor = (ProcessPoolProcessor(max_workers, parser=parser,
+                                                 numeric_mode=numeric_mode)
+                            if parallel_processing else None)
+        # The parse results shared with every other pipeline.
+        self.__parse_cache = parse_cache or get_shared_parse_cache()
+        # The fundamental sections kept between refreshes.
+        self.__incremental = incremental
+        # The companies completed by this, or by an interrupted, run.
+        self.__journal = journal
+        self.__resume = resume
+        # The time spent in each stage, shared with every other pipeline.
+        self.__metrics = metrics or get_shared_stage_metrics()
+
+    def __process(self, ticker: str, html: str) -> TransformContract:
+        """Collects and transforms the HTML of a single company.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+            html (str): The HTML content of the company page.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        with self.__metrics.time('parse', ticker):
+            extract_contract = self.__extractor.extract_all_information_from_html(html)
+
+        with self.__metrics.time('transform', ticker):
+            return self.__transformer.transform_all_information(extract_contract)
+
+    async def __refresh(self, ticker: str, html: str) -> TransformContract:
+        """Transforms a company, reusing its fundamental sections when still current.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+            html (str): The HTML content of the company page.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        numeric_mode = self.__transformer.numeric_mode
+
+        if self.__processor is not None:
+            return await self.__incremental.refresh_async(
+                ticker, numeric_mode,
+                lambda sections: self.__processor.process_async(html, sections))
+
+        # Only the price sections are collected, unless the statement date changed.
+        return self.__incremental.refresh(
+            ticker, numeric_mode,
+            lambda sections: self.__transformer.transform_all_information(
+                self.__extractor.extract_all_information_from_html(html, sections), sections))
+
+    async def __get_information(self, ticker: str) -> TransformContract:
+        """Downloads and processes the information of a single company.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+
+        Raises:
+            ExtractException: If the download or the extraction fails.
+            TransformException: If the transformation fails.
+        """
+
+        try:
+            with self.__metrics.time('http', ticker):
+                html_information = await self.__requester.make_request(
+                    {'papel': ticker, 'interface': self.__interface})
+        except Exception as exception:
+            raise ExtractException(exception) from exception
+
+        html = html_information.response.text
+        key = self.__parse_cache.key(html, self.__transformer.numeric_mode)
+        contract = self.__parse_cache.get(key)
+
+        if contract is not None:
+            self.__metrics.increment('parse_cache_hit')
+
+            return contract
+
+        self.__metrics.increment('parse_cache_miss')
+
+        # Outside this process, the collect and transform stages are timed together.
+        if self.__incremental is not None:
+            with self.__metrics.time('process', ticker):
+                contract = await self.__refresh(ticker, html)
+        elif self.__processor is not None:
+            with self.__metrics.time('process', ticker):
+                contract = await self.__processor.process_async(html)
+        else:
+            contract = self.__process(ticker, html)
+
+        self.__parse_cache.put(key, contract)
+
+        return contract
+
+    async def __get_tagged_information(
+            self, ticker: str) -> Tuple[str, Union[TransformContract, Exception]]:
+        """Downloads and processes a single company, returning any failure.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+
+        Returns:
+            Tuple[str, Union[TransformContract, Exception]]: The ticker and its
+            contract, or the exception raised.
+        """
+
+        try:
+            return ticker, await self.__get_information(ticker)
+        except Exception as exception:  # pylint: disable=broad-except
+            return ticker, exception
+
+    async def stream_all_information_async(
+            self) -> AsyncIterator[Tuple[str, Union[TransformContract, Exception]]]:
+        """Yields the financial information of each company as soon as it is ready.
+
+        A failure on one company does not abort the batch: its result is the
+        raised exception instead of the contract. When resuming, the companies
+        completed by the previous run are yielded first, from the journal.
+
+        Yields:
+            Tuple[str, Union[TransformContract, Exception]]: The ticker and its
+            contract, or the exception raised, in completion order.
+        """
+
+        tickers = self.__tickers
+
+        if self.__journal is not None:
+            completed = self.__journal.completed() if self.__resume else {}
+
+            if not self.__resume:
+                self.__journal.clear()
+
+            for ticker in tickers:
+                if ticker in completed:
+                    yield ticker, self.__journal.load(completed[ticker])
+
+            tickers = [ticker for ticker in tickers if ticker not in completed]
+
+        with self.__metrics.batch():
+            async with self.__requester:
+                tasks = [asyncio.ensure_future(self.__get_tagged_information(ticker))
+                         for ticker in tickers]
+
+                try:
+                    for task in asyncio.as_completed(tasks):
+                        ticker, result = await task
+                        succeeded = isinstance(result, TransformContract)
+                        self.__metrics.increment('tickers' if succeeded else 'failures')
+
+                        if self.__journal is not None and succeeded:
+                            self.__journal.record(ticker, result)
+
+                        yield ticker, result
+                finally:
+                    for task in tasks:
+                        task.cancel()
+
+                    if self.__processor is not None:
+                        self.__processor.shutdown()
+
+                    if self.__incremental is not None:
+                        self.__incremental.save()
+
+    async def get_all_information_async(self) -> Dict[str, Union[TransformContract, Exception]]:
+        """Retrieves, concurrently, the financial information of every company.
+
+        A failure on one company does not abort the batch: its entry holds
+        the raised exception instead of the contract.
+
+        Returns:
+            Dict[str, Union[TransformContract, Exception]]: The contract, or the
+            exception, of each ticker, in the order the tickers were given.
+        """
+
+        results = {}
+        async for ticker, result in self.stream_all_information_async():
+            results[ticker] = result
+
+        return {ticker: results[ticker] for ticker in self.__tickers}
+
+    def get_all_information(self) -> Dict[str, Union[TransformContract, Exception]]:
+        """Retrieves, concurrently, the financial information of every company.
+
+        Runs get_all_information_async in a new event loop, so it must not be
+        called from a running event loop.
+
+        Returns:
+            Dict[str, Union[TransformContract, Exception]]: The contract, or the
+            exception, of each ticker, in the order the tickers were given.
+        """
+
+        return asyncio.run(self.get_all_information_async())
+
+    def get_universe_snapshot(self) -> UniverseSnapshot:
+        """Retrieves every company into a columnar snapshot.
+
+        Companies that failed are left out of the snapshot.
+
+        Returns:
+            UniverseSnapshot: One row per company, one column per indicator.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+
+        contracts = self.get_all_information()
+
+        with self.__metrics.time('export'):
+            return UniverseSnapshot.from_contracts(contracts)
+
+    def stage_metrics(self) -> StageMetrics:
+        """Returns the time spent in each stage of the pipeline.
+
+        Returns:
+            StageMetrics: The latency histograms and counters of each stage.
+        """
+
+        return self.__metrics
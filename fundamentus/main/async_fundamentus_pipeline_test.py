@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_fundamentus_pipeline_test.py
+#  Version: 0.0.7
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test the AsyncFundamentusPipeline."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.stages.loading.checkpoint_journal import CheckpointJournal
+
+from fundamentus.stages.processing.incremental_refresh import \
+    IncrementalRefresh
+from fundamentus.stages.processing.parse_result_cache import ParseResultCache
+from fundamentus.utilities.stage_metrics import StageMetrics
+
+from .async_fundamentus_pipeline import AsyncFundamentusPipeline
+
+
+def test_get_all_information() -> None:
+    """Test the get_all_information method."""
+
+    tickers = ['MGLU3', 'WEGE3', 'VALE3', 'INVALID']
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params['papel'] == 'INVALID':
+            return httpx.Response(404, text='Not Found')
+
+        return httpx.Response(HTML_COLLECTOR_MOCK['status_code'],
+                              text=HTML_COLLECTOR_MOCK['content'])
+
+    pipeline = AsyncFundamentusPipeline(tickers,
+                                        transport=httpx.MockTransport(handler))
+    response = pipeline.get_all_information()
+
+    assert list(response.keys()) == tickers
+    for ticker in tickers[:-1]:
+        assert isinstance(response[ticker], TransformContract)
+        assert isinstance(response[ticker].transformed_information, dict)
+    assert isinstance(response['INVALID'], ExtractException)
+
+
+def test_get_universe_snapshot() -> None:
+    """Test the failed tickers are left out of the snapshot."""
+
+    pytest.importorskip('numpy')
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params['papel'] == 'INVALID':
+            return httpx.Response(404, text='Not Found')
+
+        return httpx.Response(HTML_COLLECTOR_MOCK['status_code'],
+                              text=HTML_COLLECTOR_MOCK['content'])
+
+    pipeline = AsyncFundamentusPipeline(['WEGE3', 'INVALID'],
+                                        numeric_mode='float',
+                                        transport=httpx.MockTransport(handler))
+    snapshot = pipeline.get_universe_snapshot()
+
+    assert len(snapshot) == 1
+    assert 'valuation_indicators.dividend_yield' in snapshot.numeric_columns
+
+
+def test_get_all_information_max_concurrency() -> None:
+    """Test the number of requests in flight is bounded."""
+
+    tickers = [f'TICK{number}' for number in range(12)]
+    in_flight = {'current': 0, 'maximum': 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        in_flight['current'] += 1
+        in_flight['maximum'] = max(in_flight['maximum'], in_flight['current'])
+        await asyncio.sleep(0.01)
+        in_flight['current'] -= 1
+
+        return httpx.Response(HTML_COLLECTOR_MOCK['status_code'],
+                              text=HTML_COLLECTOR_MOCK['content'])
+
+    pipeline = AsyncFundamentusPipeline(tickers,
+                                        max_concurrency=3,
+                                        transport=httpx.MockTransport(handler))
+    response = pipeline.get_all_information()
+
+    assert len(response) == len(tickers)
+    assert in_flight['maximum'] == 3
+
+
+def test_stream_all_information_parallel_processing() -> None:
+    """Test the pages are parsed in worker processes and streamed as they finish."""
+
+    tickers = ['MGLU3', 'WEGE3', 'VALE3']
+
+    def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        return httpx.Response(HTML_COLLECTOR_MOCK['status_code'],
+                              text=HTML_COLLECTOR_MOCK['content'])
+
+    pipeline = AsyncFundamentusPipeline(tickers,
+                                        parallel_processing=True,
+                                        max_workers=2,
+                                        transport=httpx.MockTransport(handler))
+
+    async def stream() -> list:
+        return [item async for item in pipeline.stream_all_information_async()]
+
+    response = asyncio.run(stream())
+
+    assert sorted(ticker for ticker, _ in response) == sorted(tickers)
+    for _, contract in response:
+        assert isinstance(contract, TransformContract)
+        assert contract == response[0][1]
+
+
+def test_get_all_information_incremental() -> None:
+    """Test the fundamental sections are reused while the statement date is unchanged."""
+
+    def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        return httpx.Response(HTML_COLLECTOR_MOCK['status_code'],
+                              text=HTML_COLLECTOR_MOCK['content'])
+
+    incremental = IncrementalRefresh()
+    responses = []
+
+    for _ in range(2):
+        pipeline = AsyncFundamentusPipeline(['WEGE3', 'VALE3'],
+                                            parse_cache=ParseResultCache(max_entries=0),
+                                            incremental=incremental,
+                                            transport=httpx.MockTransport(handler))
+        responses.append(pipeline.get_all_information())
+
+    assert responses[0] == responses[1]
+    assert incremental.statistics() == {'refreshed': 2, 'reused': 2, 'tickers': 2}
+
+
+def test_get_all_information_resume(tmp_path) -> None:
+    """Test a resumed run requests only the tickers the journal lacks."""
+
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params['papel'])
+
+        if request.url.params['papel'] == 'INVALID':
+            return httpx.Response(404, text='Not Found')
+
+        return httpx.Response(HTML_COLLECTOR_MOCK['status_code'],
+                              text=HTML_COLLECTOR_MOCK['content'])
+
+    journal = CheckpointJournal(str(tmp_path / 'checkpoint.jsonl'))
+    tickers = ['WEGE3', 'VALE3', 'INVALID']
+
+    first = AsyncFundamentusPipeline(tickers[:1],
+                                     journal=journal,
+                                     transport=httpx.MockTransport(handler)).get_all_information()
+    second = AsyncFundamentusPipeline(tickers,
+                                      journal=journal,
+                                      resume=True,
+                                      transport=httpx.MockTransport(handler)).get_all_information()
+
+    assert [ticker.upper() for ticker in requested] == ['WEGE3', 'VALE3', 'INVALID']
+    assert list(second.keys()) == tickers
+    assert second['WEGE3'] == first['WEGE3']
+    assert isinstance(second['INVALID'], ExtractException)
+    assert set(journal.completed()) == {'WEGE3', 'VALE3'}
+
+    AsyncFundamentusPipeline(tickers[:1],
+                             journal=journal,
+                             transport=httpx.MockTransport(handler)).get_all_information()
+
+    assert set(journal.completed()) == {'WEGE3'}
+
+
+def test_get_all_information_stage_metrics() -> None:
+    """Test the download, parse and transform stages are timed for each ticker."""
+
+    def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        return httpx.Response(HTML_COLLECTOR_MOCK['status_code'],
+                              text=HTML_COLLECTOR_MOCK['content'])
+
+    metrics = StageMetrics()
+    pipeline = AsyncFundamentusPipeline(['WEGE3', 'VALE3'],
+                                        parse_cache=ParseResultCache(max_entries=0),
+                                        metrics=metrics,
+                                        transport=httpx.MockTransport(handler))
+    pipeline.get_all_information()
+
+    assert pipeline.stage_metrics() is metrics
+    assert metrics.counters() == {'parse_cache_miss': 2, 'tickers': 2, 'batches': 1}
+    assert set(metrics.ticker('WEGE3')) == {'http', 'parse', 'transform'}
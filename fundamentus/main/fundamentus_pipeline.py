@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: fundamentus_pipeline.py
-#  Version: 0.0.5
+#  Version: 0.0.17
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -25,15 +25,38 @@ Using this API, investors and analysts can quickly obtain detailed data to assis
 investment decision-making.
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+
 from fundamentus.contracts.transform_contract import TransformContract
-from fundamentus.drivers.html_collector import HtmlCollector
+from fundamentus.drivers.html_collector_factory import create_html_collector
 from fundamentus.drivers.http_requester import HttpRequester
+from fundamentus.drivers.cache_manager import CacheManager
+from fundamentus.drivers.http_session_pool import (
+    HttpSessionPool, configure_shared_session_pool, get_shared_session_pool)
+from fundamentus.drivers.rate_limiter import (configure_shared_rate_limiter,
+                                              get_shared_rate_limiter)
 from fundamentus.stages.extraction.extractor_html_information import \
     ExtractorHtmlInformation as Extractor
+from fundamentus.stages.processing.incremental_refresh import \
+    IncrementalRefresh
+from fundamentus.stages.processing.parse_result_cache import (
+    ParseResultCache, configure_shared_parse_cache, get_shared_parse_cache)
 from fundamentus.stages.transformation.transform_raw_information import \
     TransformRawInformation as Transformer
 
-from fundamentus.utilities.config import URL, INTERFACE
+from fundamentus.utilities.config import (BACKOFF_FACTOR, BACKOFF_MAX,
+                                          BACKOFF_RETRIES, CACHE_BACKEND,
+                                          CACHE_EXPIRE_AFTER, CACHE_NAME,
+                                          INTERFACE, MAX_CONCURRENCY,
+                                          NUMERIC_MODE,
+                                          PARSE_CACHE_DIRECTORY,
+                                          PARSE_CACHE_SIZE, PARSER, RATE_LIMIT,
+                                          RATE_LIMIT_BURST, SECTIONS, URL)
+from fundamentus.utilities.sections import validate_sections
+from fundamentus.utilities.stage_metrics import (StageMetrics,
+                                                 get_shared_stage_metrics)
 
 
 class FundamentusPipeline:
@@ -50,45 +73,251 @@ class FundamentusPipeline:
         ticker (str): The ticker symbol of the company.
         url (str): The base URL for the HTTP requests.
         interface (str): The interface for the HTTP requests.
+        session_pool (HttpSessionPool): The pool of keep-alive connections
+                                        shared by the HTTP requests.
+        parse_cache (ParseResultCache): The transformed pages, keyed by
+                                        their content hash.
+        parser (str): The HTML parser backend.
+        numeric_mode (str): The type of the transformed numbers.
+        incremental (IncrementalRefresh): The fundamental sections last seen
+                                          for each company.
+        metrics (StageMetrics): The time spent in each stage.
 
     Methods:
         get_all_information: Returns detailed financial information of companies.
         list_all_companies: Lists all companies with available data.
         list_all_property_funds: Lists all real estate investment funds
                                     with available data.
+        list_all_companies_and_property_funds: Lists both from a single parse.
+        iter_universe: Yields the information of every company as it completes.
+        iter_property_funds: Yields the information of every real estate
+                             investment fund as it completes.
+        connection_statistics: Reports the reuse of pooled connections.
+        configure_cache: Configures, once, the HTTP response cache shared
+                         by every pipeline.
+        configure_rate_limit: Configures, once, the request rate limit shared
+                              by every pipeline.
+        rate_limit_statistics: Reports the time spent throttled and the retries.
+        configure_parse_cache: Configures, once, the parse result cache shared
+                               by every pipeline.
+        parse_cache_statistics: Reports the pages that skipped the parse.
+        stage_metrics: Returns the time spent in each stage.
     """
 
-    def __init__(self, ticker: str = None, url: str = URL, interface: str = INTERFACE) -> None:
+    def __init__(self,
+                 ticker: str = None,
+                 url: str = URL,
+                 interface: str = INTERFACE,
+                 session_pool: HttpSessionPool = None,
+                 parse_cache: ParseResultCache = None,
+                 parser: str = PARSER,
+                 numeric_mode: str = NUMERIC_MODE,
+                 incremental: IncrementalRefresh = None,
+                 metrics: StageMetrics = None) -> None:
         """Initializes the FundamentusPipeline object.
 
         Args:
             ticker (str): The ticker symbol of the company.
             url (str): The base URL for the HTTP requests.
             interface (str): The interface for the HTTP requests.
+            session_pool (HttpSessionPool): The pool of keep-alive connections,
+                                            defaults to the process-wide shared pool.
+            parse_cache (ParseResultCache): The transformed pages, defaults to
+                                            the process-wide shared cache.
+            parser (str): The HTML parser backend (html.parser, lxml or selectolax).
+            numeric_mode (str): The type of the transformed numbers, 'decimal'
+                                (exact) or 'float' (fast, exportable to NumPy).
+            incremental (IncrementalRefresh): The fundamental sections last seen for
+                                              each company, None transforms every section.
+                                              A batch saves it when it ends.
+            metrics (StageMetrics): The time spent in each stage, defaults to
+                                    the process-wide shared metrics.
+
+        Raises:
+            ValueError: If the parser or the numeric mode is not supported.
+            ImportError: If the parser is not installed.
         """
 
+        # The options of the pipelines created for the other tickers.
+        self.__ticker = ticker
+        self.__url = url
+        self.__interface = interface
+        self.__parser = parser
+        self.__numeric_mode = numeric_mode
+
+        # The connection pool shared with every other pipeline.
+        self.__session_pool = session_pool or get_shared_session_pool()
+        # The parse results shared with every other pipeline.
+        self.__parse_cache = parse_cache or get_shared_parse_cache()
+        # The fundamental sections kept between refreshes.
+        self.__incremental = incremental
+        # The time spent in each stage, shared with every other pipeline.
+        self.__metrics = metrics or get_shared_stage_metrics()
+
         # A HTML information extractor.
         self.__extractor = Extractor(requester=HttpRequester(url=url,
                                                              params={'papel': ticker,
-                                                                     'interface': interface}),
-                                     collector=HtmlCollector())
+                                                                     'interface': interface},
+                                                             session_pool=self.__session_pool),
+                                     collector=create_html_collector(parser))
         # A raw information transformer.
-        self.__transformer = Transformer()
+        self.__transformer = Transformer(numeric_mode)
+
+    @staticmethod
+    def configure_cache(backend: str = CACHE_BACKEND,
+                        cache_name: str = CACHE_NAME,
+                        expire_after: int = CACHE_EXPIRE_AFTER) -> None:
+        """Configures the HTTP response cache shared by every pipeline.
+
+        The cache backend is opened once here, so the requests made by the
+        pipelines only perform a cache lookup. It should be called before
+        the pipelines are created.
+
+        Args:
+            backend (str): The cache backend (sqlite, memory or filesystem),
+                           None disables the cache.
+            cache_name (str): The cache path (database file or directory).
+            expire_after (int): Time, in seconds, until a response expires.
+
+        Raises:
+            ValueError: If the cache backend is not supported.
+        """
+
+        configure_shared_session_pool(cache_manager=CacheManager(backend=backend,
+                                                                 cache_name=cache_name,
+                                                                 expire_after=expire_after))
+
+    @staticmethod
+    def configure_rate_limit(requests_per_second: float = RATE_LIMIT,
+                             burst: int = RATE_LIMIT_BURST,
+                             max_retries: int = BACKOFF_RETRIES,
+                             backoff_factor: float = BACKOFF_FACTOR,
+                             backoff_max: float = BACKOFF_MAX) -> None:
+        """Configures the request rate limit shared by every pipeline.
+
+        The limit is shared by every thread and asynchronous task, so the
+        total rate stays under the configured value whatever the concurrency.
+        Responses 429 and 5xx are retried after the Retry-After header, or
+        after an exponential backoff with jitter. It should be called before
+        the pipelines are created.
+
+        Args:
+            requests_per_second (float): The sustained request rate,
+                                         None disables the limit.
+            burst (int): The number of requests that may be sent at once.
+            max_retries (int): The retries made on a throttled response.
+            backoff_factor (float): The base delay, in seconds, of the backoff.
+            backoff_max (float): The maximum delay, in seconds, between retries.
 
-    def get_all_information(self) -> TransformContract:
+        Raises:
+            ValueError: If the rate or the burst is not positive.
+        """
+
+        configure_shared_rate_limiter(requests_per_second=requests_per_second,
+                                      burst=burst,
+                                      max_retries=max_retries,
+                                      backoff_factor=backoff_factor,
+                                      backoff_max=backoff_max)
+
+    @staticmethod
+    def configure_parse_cache(max_entries: int = PARSE_CACHE_SIZE,
+                              directory: str = PARSE_CACHE_DIRECTORY) -> None:
+        """Configures the parse result cache shared by every pipeline.
+
+        A page whose content was already transformed is served from this
+        cache, skipping the collect and transform stages. It should be called
+        before the pipelines are created.
+
+        Args:
+            max_entries (int): The number of results kept in memory,
+                               0 disables the memory store.
+            directory (str): The directory of the on-disk store, None disables it.
+        """
+
+        configure_shared_parse_cache(max_entries=max_entries, directory=directory)
+
+    def __process(self, html: str, sections: FrozenSet[str]) -> TransformContract:
+        """Collects and transforms the HTML of the company.
+
+        Args:
+            html (str): The HTML content of the company page.
+            sections (FrozenSet[str]): The sections to collect and transform.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        with self.__metrics.time('parse', self.__ticker):
+            extract_contract = self.__extractor.extract_all_information_from_html(html, sections)
+
+        with self.__metrics.time('transform', self.__ticker):
+            return self.__transformer.transform_all_information(extract_contract, sections)
+
+    def get_all_information(self, sections: Optional[Iterable[str]] = None) -> TransformContract:
         """Retrieves detailed financial information of listed companies.
 
         This method extracts and transforms financial data of companies,
         including indicators such as net profit, net revenue, among others,
         providing a comprehensive view of the companies' financial and economic state.
 
+        A page already transformed is served from the parse result cache,
+        which is shared by every pipeline, so the returned contract must
+        not be modified. With an `incremental` state, a request for every
+        section reuses the fundamental sections while the last financial
+        statement date is unchanged.
+
+        Args:
+            sections (Iterable[str]): The sections to collect and transform, like
+                                      PRICE_SECTIONS; None returns every section.
+                                      The others are neither collected nor transformed,
+                                      so screening P/L and P/VP skips the balance sheet
+                                      and the income statement.
+
         Returns:
             TransformContract: A contract containing the transformed financial data.
+
+        Raises:
+            ValueError: If a section is unknown.
         """
 
-        extract_contract = self.__extractor.extract_all_information()
+        sections = validate_sections(sections)
+
+        with self.__metrics.time('http', self.__ticker):
+            html_information = self.__extractor.extract_response()
+
+        if getattr(html_information.response, 'from_cache', False):
+            self.__metrics.increment('http_cache_hit')
+        else:
+            self.__metrics.increment('http_cache_miss')
+
+        html = html_information.response.text
+
+        # A partial result is cached apart from the complete one.
+        variant = self.__transformer.numeric_mode
+        if sections != frozenset(SECTIONS):
+            variant = f'{variant}:{",".join(sorted(sections))}'
+
+        key = self.__parse_cache.key(html, variant)
+        contract = self.__parse_cache.get(key)
+
+        if contract is not None:
+            self.__metrics.increment('parse_cache_hit')
 
-        return self.__transformer.transform_all_information(extract_contract)
+            return contract
+
+        self.__metrics.increment('parse_cache_miss')
+
+        # Only the price sections are collected, unless the statement date changed.
+        if self.__incremental is not None and sections == frozenset(SECTIONS):
+            contract = self.__incremental.refresh(
+                self.__ticker, self.__transformer.numeric_mode,
+                lambda selected: self.__process(html, frozenset(selected)))
+        else:
+            contract = self.__process(html, sections)
+
+        self.__parse_cache.put(key, contract)
+
+        return contract
 
     def list_all_companies(self) -> TransformContract:
         """Lists all companies with available data.
@@ -119,3 +348,198 @@ class FundamentusPipeline:
         extract_contract = self.__extractor.extract_property_funds()
 
         return self.__transformer.transform_property_funds(extract_contract)
+
+    def list_all_companies_and_property_funds(self) -> TransformContract:
+        """Lists all companies and real estate investment funds at once.
+
+        The listing page is downloaded and parsed only once, and only its
+        tables of companies and funds are parsed, which makes loading the
+        whole universe of tickers much faster than calling list_all_companies
+        and list_all_property_funds.
+
+        Returns:
+            TransformContract: A contract whose information holds the
+                               'companies' and 'property_funds' lists.
+        """
+
+        extract_contract = self.__extractor.extract_listings()
+
+        return self.__transformer.transform_listings(extract_contract)
+
+    def __get_information_of(self,
+                             ticker: str,
+                             sections: Optional[Iterable[str]]) -> TransformContract:
+        """Retrieves the information of another ticker with the same options.
+
+        Args:
+            ticker (str): The ticker symbol.
+            sections (Iterable[str]): The sections to collect and transform.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        pipeline = FundamentusPipeline(ticker,
+                                       url=self.__url,
+                                       interface=self.__interface,
+                                       session_pool=self.__session_pool,
+                                       parse_cache=self.__parse_cache,
+                                       parser=self.__parser,
+                                       numeric_mode=self.__numeric_mode,
+                                       incremental=self.__incremental,
+                                       metrics=self.__metrics)
+
+        return pipeline.get_all_information(sections)
+
+    def __iter_information(
+            self,
+            tickers: Iterable[str],
+            sections: Optional[Iterable[str]],
+            max_in_flight: int) -> Iterator[Tuple[str, Union[TransformContract, Exception]]]:
+        """Yields the information of each ticker as soon as it completes.
+
+        At most `max_in_flight` tickers are requested at once, and a new one
+        is taken from `tickers` only when a result is yielded, so neither the
+        tickers nor the results are ever held in a list.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols, consumed lazily.
+            sections (Iterable[str]): The sections to collect and transform.
+            max_in_flight (int): The maximum number of tickers in progress.
+
+        Yields:
+            Tuple[str, Union[TransformContract, Exception]]: The ticker and its
+            contract, or the exception raised, in completion order.
+        """
+
+        sections = validate_sections(sections)
+        tickers = iter(tickers)
+
+        with self.__metrics.batch(), ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            in_flight = {executor.submit(self.__get_information_of, ticker, sections): ticker
+                         for ticker in islice(tickers, max_in_flight)}
+
+            try:
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        ticker = in_flight.pop(future)
+
+                        for next_ticker in islice(tickers, 1):
+                            in_flight[executor.submit(self.__get_information_of,
+                                                      next_ticker, sections)] = next_ticker
+
+                        exception = future.exception()
+                        self.__metrics.increment('tickers' if exception is None else 'failures')
+                        yield ticker, exception if exception is not None else future.result()
+            finally:
+                # A consumer that stops early does not wait for the queued tickers.
+                for future in in_flight:
+                    future.cancel()
+
+                if self.__incremental is not None:
+                    self.__incremental.save()
+
+    def iter_universe(
+            self,
+            tickers: Optional[Iterable[str]] = None,
+            sections: Optional[Iterable[str]] = None,
+            max_in_flight: int = MAX_CONCURRENCY
+    ) -> Iterator[Tuple[str, Union[TransformContract, Exception]]]:
+        """Yields the information of every company, one at a time, as each completes.
+
+        Memory does not grow with the size of the universe: results are
+        yielded as they arrive, and a failure on one ticker is yielded in
+        place of its contract instead of aborting the run. With an `incremental`
+        state, the fundamental sections of a company are transformed again only
+        when its last financial statement date changes.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols, None lists every company.
+            sections (Iterable[str]): The sections to collect and transform,
+                                      None returns every section.
+            max_in_flight (int): The maximum number of tickers in progress.
+
+        Yields:
+            Tuple[str, Union[TransformContract, Exception]]: The ticker and its
+            contract, or the exception raised, in completion order.
+        """
+
+        if tickers is None:
+            listings = self.list_all_companies_and_property_funds().transformed_information
+            tickers = (company['code'] for company in listings['companies'])
+
+        yield from self.__iter_information(tickers, sections, max_in_flight)
+
+    def iter_property_funds(
+            self,
+            sections: Optional[Iterable[str]] = None,
+            max_in_flight: int = MAX_CONCURRENCY
+    ) -> Iterator[Tuple[str, Union[TransformContract, Exception]]]:
+        """Yields the information of every real estate investment fund as each completes.
+
+        Args:
+            sections (Iterable[str]): The sections to collect and transform,
+                                      None returns every section.
+            max_in_flight (int): The maximum number of funds in progress.
+
+        Yields:
+            Tuple[str, Union[TransformContract, Exception]]: The fund code and its
+            contract, or the exception raised, in completion order.
+        """
+
+        listings = self.list_all_companies_and_property_funds().transformed_information
+        funds = (fund['code'] for fund in listings['property_funds'])
+
+        yield from self.__iter_information(funds, sections, max_in_flight)
+
+    def connection_statistics(self) -> Dict[str, int]:
+        """Reports how many HTTP connections were opened and reused.
+
+        The connection pool is shared by every pipeline, so the numbers
+        cover all the requests made through the same pool.
+
+        Returns:
+            Dict[str, int]: The number of requests sent, connections opened
+                            and connections reused.
+        """
+
+        return self.__session_pool.connection_statistics()
+
+    @staticmethod
+    def rate_limit_statistics() -> Dict[str, float]:
+        """Reports how much the HTTP requests were throttled.
+
+        The rate limiter is shared by every pipeline, so the numbers
+        cover all the requests made since it was configured.
+
+        Returns:
+            Dict[str, float]: The number of requests and retries, and the
+                              seconds spent waiting for the rate limit
+                              and backing off.
+        """
+
+        return get_shared_rate_limiter().metrics()
+
+    def parse_cache_statistics(self) -> Dict[str, int]:
+        """Reports how many pages skipped the collect and transform stages.
+
+        Returns:
+            Dict[str, int]: The number of memory hits, disk hits, misses
+                            and results kept in memory.
+        """
+
+        return self.__parse_cache.statistics()
+
+    def stage_metrics(self) -> StageMetrics:
+        """Returns the time spent in each stage of the pipeline.
+
+        The metrics are shared by the pipelines created for each ticker of
+        a batch, and exportable as JSON or in the Prometheus text format.
+
+        Returns:
+            StageMetrics: The latency histograms and counters of each stage.
+        """
+
+        return self.__metrics
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: fundamentus_pipeline.py
-#  Version: 0.0.6
+#  Version: 0.0.13
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -17,9 +17,16 @@
 # ------------------------------------------------------------------------------
 """Test the FundamentusPipeline."""
 
+import threading
+import time
+
 from fundamentus.contracts.transform_contract import TransformContract
 from fundamentus.drivers.mocks.companies_list import COMPANIES_LIST_MOCK
 from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.stages.processing.incremental_refresh import \
+    IncrementalRefresh
+from fundamentus.stages.processing.parse_result_cache import ParseResultCache
 from fundamentus.utilities.config import URL
 
 from .fundamentus_pipeline import FundamentusPipeline
@@ -89,3 +96,162 @@ def test_list_all_property_funds(requests_mock) -> None:
     assert isinstance(response, TransformContract)
     assert isinstance(response.transformed_information, list)
     assert isinstance(response.transformed_information[0], dict)
+
+
+def test_list_all_companies_and_property_funds(requests_mock) -> None:
+    """Test the list_all_companies_and_property_funds method."""
+
+    requests_mock.get(URL,
+                      status_code=COMPANIES_LIST_MOCK['status_code'],
+                      text=COMPANIES_LIST_MOCK['content'])
+
+    main_pipeline = FundamentusPipeline()
+    response = main_pipeline.list_all_companies_and_property_funds()
+
+    assert isinstance(response, TransformContract)
+    assert response.transformed_information['companies'] == \
+        main_pipeline.list_all_companies().transformed_information
+    assert response.transformed_information['property_funds'] == \
+        main_pipeline.list_all_property_funds().transformed_information
+
+
+def test_get_all_information_parse_cache(requests_mock) -> None:
+    """Test an unchanged page skips the collect and transform stages."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    main_pipeline = FundamentusPipeline('MGLU3')
+    first_response = main_pipeline.get_all_information()
+    second_response = FundamentusPipeline('WEGE3').get_all_information()
+
+    assert second_response is first_response
+    assert main_pipeline.parse_cache_statistics()['hits'] == 1
+
+
+def test_get_all_information_sections(requests_mock) -> None:
+    """Test only the requested sections are returned, cached apart from the whole page."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    main_pipeline = FundamentusPipeline('MGLU3')
+    screening = main_pipeline.get_all_information(
+        sections=['price_information', 'valuation_indicators'])
+    everything = main_pipeline.get_all_information()
+
+    assert list(screening.transformed_information) == ['price_information',
+                                                       'valuation_indicators']
+    assert screening.transformed_information['valuation_indicators'] == \
+        everything.transformed_information['valuation_indicators']
+    assert main_pipeline.parse_cache_statistics()['misses'] == 2
+
+
+def mock_universe(requests_mock, in_flight: dict) -> None:
+    """Serve the listing page, the stock page, and a 404 for the INVALID ticker."""
+
+    lock = threading.Lock()
+
+    def callback(request, context) -> str:
+        papel = request.qs.get('papel', [None])[0]
+
+        if papel is None:
+            return COMPANIES_LIST_MOCK['content']
+
+        with lock:
+            in_flight['current'] += 1
+            in_flight['maximum'] = max(in_flight['maximum'], in_flight['current'])
+
+        time.sleep(0.01)
+
+        with lock:
+            in_flight['current'] -= 1
+
+        # requests_mock lower cases the query string.
+        if papel == 'invalid':
+            context.status_code = 404
+            return 'Not Found'
+
+        return HTML_COLLECTOR_MOCK['content']
+
+    requests_mock.get(URL, text=callback)
+
+
+def test_iter_universe(requests_mock) -> None:
+    """Test every company is yielded, with failures in place of their contract."""
+
+    in_flight = {'current': 0, 'maximum': 0}
+    mock_universe(requests_mock, in_flight)
+
+    tickers = [f'TICK{number}' for number in range(7)] + ['INVALID']
+    results = dict(FundamentusPipeline().iter_universe(tickers=tickers, max_in_flight=3))
+
+    assert len(results) == 8
+    assert all(isinstance(results[f'TICK{number}'], TransformContract) for number in range(7))
+    assert isinstance(results['INVALID'], ExtractException)
+    assert in_flight['maximum'] <= 3
+
+
+def test_iter_universe_lists_companies(requests_mock) -> None:
+    """Test the companies and the funds of the listing page are streamed."""
+
+    mock_universe(requests_mock, {'current': 0, 'maximum': 0})
+
+    pipeline = FundamentusPipeline()
+    companies = [ticker for ticker, _ in pipeline.iter_universe(
+        sections=['price_information'])]
+    funds = [ticker for ticker, _ in pipeline.iter_property_funds(
+        sections=['price_information'])]
+
+    assert len(companies) == 25
+    assert len(funds) == 26
+    assert 'AALR3' in companies
+    assert 'ABCP11' in funds
+
+
+def test_iter_universe_stage_metrics(requests_mock, capsys) -> None:
+    """Test each stage is timed per ticker and the batch summary is printed."""
+
+    mock_universe(requests_mock, {'current': 0, 'maximum': 0})
+
+    pipeline = FundamentusPipeline()
+
+    # One ticker at a time, so the second page is found in the parse cache.
+    results = dict(pipeline.iter_universe(tickers=['TICK0', 'TICK1', 'INVALID'],
+                                          max_in_flight=1))
+
+    metrics = pipeline.stage_metrics()
+    records = metrics.to_dict()
+
+    assert len(results) == 3
+    assert records['counters'] == {'http_cache_miss': 2, 'parse_cache_miss': 1,
+                                   'parse_cache_hit': 1, 'tickers': 2,
+                                   'failures': 1, 'batches': 1}
+    assert records['stages']['http']['count'] == 3
+    assert records['stages']['parse']['count'] == 1
+    assert records['stages']['batch']['count'] == 1
+    assert set(metrics.ticker('TICK0')) >= {'http'}
+    assert 'Pipeline stage metrics' in capsys.readouterr().err
+
+
+def test_iter_universe_incremental(requests_mock, tmp_path) -> None:
+    """Test the fundamental sections are reused while the statement date is unchanged."""
+
+    mock_universe(requests_mock, {'current': 0, 'maximum': 0})
+
+    path = str(tmp_path / 'incremental.json')
+    responses, statistics = [], []
+
+    # Each run reads the state saved by the previous one.
+    for _ in range(2):
+        incremental = IncrementalRefresh(path)
+        pipeline = FundamentusPipeline(parse_cache=ParseResultCache(max_entries=0),
+                                       incremental=incremental)
+        responses.append(dict(pipeline.iter_universe(tickers=['TICK0', 'TICK1'])))
+        statistics.append(incremental.statistics())
+
+    assert responses[0] == responses[1]
+    assert statistics == [{'refreshed': 2, 'reused': 0, 'tickers': 2},
+                          {'refreshed': 0, 'reused': 2, 'tickers': 2}]
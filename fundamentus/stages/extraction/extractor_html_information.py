@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: extractor_html_information.py
-#  Version: 0.0.7
+#  Version: 0.0.12
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -18,8 +18,10 @@
 """Extractor HTML Information."""
 
 from datetime import datetime as dt
+from typing import Iterable, Optional
 
 from fundamentus.contracts.extract_contract import ExtractContract
+from fundamentus.contracts.request_contract import RequestContract
 from fundamentus.drivers.interfaces.html_collector import \
     HtmlCollectorInterface
 from fundamentus.drivers.interfaces.http_requester import \
@@ -31,28 +33,62 @@ from fundamentus.exceptions.extract_exception import ExtractException
 class ExtractorHtmlInformation:
     """Represents an HTML information extractor."""
 
-    def __init__(self, requester: HttpRequesterInterface,
+    def __init__(self, requester: Optional[HttpRequesterInterface],
                  collector: HtmlCollectorInterface) -> None:
         """Initialize the class.
 
-        :param requester: HttpRequesterInterface: Requester to make the request.
+        :param requester: HttpRequesterInterface: Requester to make the request,
+                          None when the HTML is downloaded elsewhere.
         :param collector: HtmlCollectorInterface: Collector to collect the information.
         """
 
         self.__requester = requester
         self.__collector = collector
 
-    def extract_all_information(self) -> ExtractContract:
+    def extract_response(self) -> RequestContract:
+        """Download the page without collecting its information.
+
+        :return: RequestContract: Response of the request of a single stock.
+        :raises ExtractException: If the request fails.
+        """
+
+        try:
+            return self.__requester.make_request()
+        except Exception as exception:
+            raise ExtractException(exception) from exception
+
+    def extract_html(self) -> str:
+        """Download the HTML without collecting its information.
+
+        :return: str: HTML content of a single stock.
+        :raises ExtractException: If the request fails.
+        """
+
+        return self.extract_response().response.text
+
+    def extract_all_information(self,
+                                sections: Optional[Iterable[str]] = None) -> ExtractContract:
         """Extract the information from the HTML.
 
+        :param sections: Iterable[str]: Sections to collect, None collects every section.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return self.extract_all_information_from_html(self.extract_html(), sections)
+
+    def extract_all_information_from_html(
+            self, html: str, sections: Optional[Iterable[str]] = None) -> ExtractContract:
+        """Extract the information from an already downloaded HTML.
+
+        :param html: str: HTML content of a single stock.
+        :param sections: Iterable[str]: Sections to collect, None collects every section.
         :return: ExtractContract: Extracted information.
         :raises ExtractException: If the extraction fails.
         """
 
         try:
-            html_information = self.__requester.make_request()
-            collect_information = self.__collector.collect_all_information(
-                html_information.response.text)
+            collect_information = self.__collector.collect_all_information(html, sections)
 
             return ExtractContract(raw_information=collect_information,
                                    extraction_date=dt.today().toordinal())
@@ -92,3 +128,20 @@ class ExtractorHtmlInformation:
                                    extraction_date=dt.today().toordinal())
         except Exception as exception:
             raise ExtractException(exception) from exception
+
+    def extract_listings(self) -> ExtractContract:
+        """Extract the companies and the property funds from a single parse.
+
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        try:
+            html_information = self.__requester.make_request()
+            collect_information = self.__collector.collect_listings(
+                html_information.response.text)
+
+            return ExtractContract(raw_information=collect_information,
+                                   extraction_date=dt.today().toordinal())
+        except Exception as exception:
+            raise ExtractException(exception) from exception
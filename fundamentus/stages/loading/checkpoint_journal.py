@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: checkpoint_journal.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Checkpoint Journal.
+
+A batch run over the whole universe takes long enough to be interrupted.
+This module stores the result of each completed ticker in its own file and
+appends the ticker and the location of that file to a JSON Lines journal,
+so an interrupted run can be resumed without requesting those tickers again.
+The results are plain JSON, so a journal naming any file only reads it as data.
+"""
+
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from typing import Dict
+
+from fundamentus.contracts.information_codec import dumps_contract, loads_contract
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.utilities.config import CHECKPOINT_JOURNAL_PATH
+
+# A ticker names its result file, so it may hold only letters, digits,
+# dots, hyphens and underscores, and may not start with a dot.
+TICKER_PATTERN = re.compile(r'[A-Za-z0-9_-][A-Za-z0-9._-]*')
+
+
+class CheckpointJournal:
+    """Represents the append-only journal of the tickers completed by a batch run.
+
+    Only successful results are recorded, so a resumed run retries the
+    tickers that failed.
+    """
+
+    def __init__(self,
+                 path: str = CHECKPOINT_JOURNAL_PATH,
+                 results_directory: str = None) -> None:
+        """Initialize the class.
+
+        :param path: str: Path of the journal.
+        :param results_directory: str: Directory of the results, defaults to
+                                  the journal path followed by ".results".
+        """
+
+        self.__path = path
+        self.__results_directory = results_directory or f'{path}.results'
+
+    @property
+    def path(self) -> str:
+        """Return the path of the journal."""
+
+        return self.__path
+
+    def completed(self) -> Dict[str, str]:
+        """Return the tickers already completed and the location of their results.
+
+        A line cut short by an interruption, or a result file that no longer
+        exists, is ignored, so its ticker is requested again.
+
+        :return: dict: The location of the result of each completed ticker.
+        """
+
+        completed = {}
+
+        if not os.path.exists(self.__path):
+            return completed
+
+        with open(self.__path, encoding='utf-8') as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if os.path.exists(entry['location']):
+                    completed[entry['ticker']] = entry['location']
+
+        return completed
+
+    def record(self, ticker: str, contract: TransformContract) -> str:
+        """Store the result of a ticker and append it to the journal.
+
+        The result is written before its journal line, and the line is
+        flushed to disk, so a recorded ticker can always be resumed.
+
+        :param ticker: str: The ticker symbol.
+        :param contract: TransformContract: The transformed information of the ticker.
+        :return: str: The location of the stored result.
+        :raises ValueError: If the ticker cannot name a file in the results directory.
+        """
+
+        if not TICKER_PATTERN.fullmatch(ticker):
+            raise ValueError(f'Invalid ticker for the checkpoint journal: {ticker!r}.')
+
+        os.makedirs(self.__results_directory, exist_ok=True)
+        location = os.path.join(self.__results_directory, f'{ticker}.json')
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.__results_directory)
+
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8') as result_file:
+            result_file.write(dumps_contract(contract))
+
+        os.replace(temporary_path, location)
+
+        entry = {'ticker': ticker,
+                 'location': location,
+                 'completed_at': datetime.now().isoformat(timespec='seconds')}
+
+        with open(self.__path, 'a', encoding='utf-8') as journal:
+            journal.write(json.dumps(entry) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+
+        return location
+
+    @staticmethod
+    def load(location: str) -> TransformContract:
+        """Return a stored result.
+
+        :param location: str: The location of the result.
+        :return: TransformContract: The transformed information of the ticker.
+        :raises ValueError: If the file is not a stored result.
+        """
+
+        with open(location, encoding='utf-8') as result_file:
+            return loads_contract(result_file.read())
+
+    def clear(self) -> None:
+        """Start a new run, forgetting every completed ticker and its result."""
+
+        if os.path.exists(self.__path):
+            os.remove(self.__path)
+
+        if not os.path.isdir(self.__results_directory):
+            return
+
+        for name in os.listdir(self.__results_directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.__results_directory, name))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: checkpoint_journal_test.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test of the checkpoint journal."""
+
+import os
+
+import pytest
+
+from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+
+from .checkpoint_journal import CheckpointJournal
+
+
+def test_record_and_load(tmp_path) -> None:
+    """Test a recorded result is listed as completed and loaded back."""
+
+    contract = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    journal = CheckpointJournal(str(tmp_path / 'checkpoint.jsonl'))
+
+    assert not journal.completed()
+
+    location = journal.record('VALE3', contract)
+
+    assert journal.completed() == {'VALE3': location}
+    assert location.endswith('VALE3.json')
+    assert journal.load(location) == contract
+
+    journal.clear()
+
+    assert not journal.completed()
+    assert not os.path.exists(location)
+
+
+def test_completed_skips_interrupted_entries(tmp_path) -> None:
+    """Test a truncated line and a missing result are not taken as completed."""
+
+    contract = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    journal = CheckpointJournal(str(tmp_path / 'checkpoint.jsonl'))
+
+    journal.record('VALE3', contract)
+    os.remove(journal.record('WEGE3', contract))
+
+    with open(journal.path, 'a', encoding='utf-8') as journal_file:
+        journal_file.write('{"ticker": "MGLU3", "loca')
+
+    assert set(journal.completed()) == {'VALE3'}
+
+
+def test_record_rejects_unsafe_tickers(tmp_path) -> None:
+    """Test a ticker that would leave the results directory is rejected."""
+
+    contract = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    journal = CheckpointJournal(str(tmp_path / 'checkpoint.jsonl'))
+
+    for ticker in ('../VALE3', 'a/b', '..', ''):
+        with pytest.raises(ValueError, match='Invalid ticker'):
+            journal.record(ticker, contract)
+
+    assert not journal.completed()
+
+
+def test_load_rejects_invalid_results(tmp_path) -> None:
+    """Test a result file that is not a stored contract is rejected."""
+
+    location = tmp_path / 'VALE3.json'
+    location.write_text('{"version": 1, "metadata": {}}', encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        CheckpointJournal.load(str(location))
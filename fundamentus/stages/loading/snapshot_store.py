@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: snapshot_store.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Snapshot Store.
+
+Each pipeline run is appended to a SQLite database as a dated snapshot,
+one row per ticker, date and indicator, so screens can be backtested over
+months of history without scraping again. The rows are clustered by ticker
+and date, and indexed by indicator and date, so a lookup or a time range
+reads only the rows it needs.
+"""
+
+import sqlite3
+from datetime import date
+from decimal import Decimal
+from typing import (Dict, Iterable, Iterator, List, Mapping, NamedTuple,
+                    Optional, Sequence, Tuple, Union)
+
+from fundamentus.contracts.information_contract import InformationMetadata
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.utilities.config import SNAPSHOT_STORE_PATH
+from fundamentus.utilities.numpy_export import (information_items,
+                                                ticker_contracts)
+
+# Numbers are stored as REAL and every other value as TEXT.
+Value = Union[float, str, None]
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS snapshots (
+    ticker TEXT NOT NULL,
+    snapshot_date TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    value,
+    PRIMARY KEY (ticker, snapshot_date, indicator)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS snapshots_by_indicator
+    ON snapshots (indicator, snapshot_date);
+CREATE INDEX IF NOT EXISTS snapshots_by_date
+    ON snapshots (snapshot_date);
+CREATE TABLE IF NOT EXISTS indicators (
+    indicator TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    tooltip TEXT NOT NULL
+) WITHOUT ROWID;
+'''
+
+
+class SnapshotRow(NamedTuple):
+    """Represents the value of an indicator of a ticker on a date."""
+
+    ticker: str
+    snapshot_date: str
+    indicator: str
+    value: Value
+
+
+def to_iso_date(snapshot_date: Union[date, str, None]) -> Optional[str]:
+    """Return a date in the ISO format the snapshots are keyed by.
+
+    :param snapshot_date: date | str: A date, or an ISO formatted string.
+    :return: str: The date as YYYY-MM-DD, or None.
+    :raises ValueError: If the string is not an ISO date.
+    """
+
+    if snapshot_date is None:
+        return None
+
+    if isinstance(snapshot_date, date):
+        # A datetime is also a date; its time is dropped.
+        return snapshot_date.strftime('%Y-%m-%d')
+
+    return date.fromisoformat(snapshot_date).isoformat()
+
+
+class SnapshotStore:
+    """Represents the history of the pipeline runs in a SQLite database.
+
+    It may be used as a context manager, which closes the database on exit.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_STORE_PATH) -> None:
+        """Initialize the class.
+
+        :param path: str: Path of the database, ':memory:' keeps it in memory.
+        """
+
+        self.__connection = sqlite3.connect(path)
+        self.__connection.executescript(SCHEMA)
+
+    def append(self,
+               contracts: Union[Mapping[str, Union[TransformContract, Exception]],
+                                Iterable[Union[TransformContract, Exception]]],
+               snapshot_date: Union[date, str, None] = None) -> int:
+        """Store the information of a run as the snapshot of a date.
+
+        A run appended twice on the same date replaces the earlier values.
+
+        :param contracts: The contract of each ticker, as returned by the batch
+                          pipeline, or the contracts alone; failures are skipped.
+                          Contracts transformed with only some sections must be
+                          given by ticker.
+        :param snapshot_date: date | str: Date of the snapshot, defaults to today.
+        :return: int: Number of values stored.
+        :raises ValueError: If a contract given alone has no stock identification.
+        """
+
+        snapshot_date = to_iso_date(snapshot_date or date.today())
+
+        rows: List[Tuple[str, str, str, Value]] = []
+        metadata: Dict[str, InformationMetadata] = {}
+
+        for ticker, contract in ticker_contracts(contracts):
+            information = contract.transformed_information
+
+            for indicator, item in information_items(information):
+                metadata.setdefault(indicator, InformationMetadata(item.title, item.tooltip))
+                value = float(item.value) if isinstance(item.value, Decimal) else item.value
+                rows.append((ticker, snapshot_date, indicator, value))
+
+        with self.__connection:
+            self.__connection.executemany(
+                'INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?)', rows)
+            self.__connection.executemany(
+                'INSERT OR REPLACE INTO indicators VALUES (?, ?, ?)',
+                [(indicator, *item) for indicator, item in metadata.items()])
+
+        return len(rows)
+
+    def dates(self) -> List[str]:
+        """Return the dates of the stored snapshots, oldest first."""
+
+        cursor = self.__connection.execute(
+            'SELECT DISTINCT snapshot_date FROM snapshots ORDER BY snapshot_date')
+
+        return [snapshot_date for (snapshot_date,) in cursor]
+
+    def metadata(self, indicator: str) -> InformationMetadata:
+        """Return the title and tooltip of an indicator.
+
+        :param indicator: str: The indicator path, like "valuation_indicators.dividend_yield".
+        :return: InformationMetadata: The title and tooltip.
+        :raises KeyError: If the indicator was never stored.
+        """
+
+        row = self.__connection.execute(
+            'SELECT title, tooltip FROM indicators WHERE indicator = ?', (indicator,)).fetchone()
+
+        if row is None:
+            raise KeyError(indicator)
+
+        return InformationMetadata(*row)
+
+    def value(self,
+              ticker: str,
+              indicator: str,
+              snapshot_date: Union[date, str]) -> Value:
+        """Return the value of an indicator of a ticker on a date.
+
+        :param ticker: str: The ticker symbol.
+        :param indicator: str: The indicator path.
+        :param snapshot_date: date | str: The date of the snapshot.
+        :return: The stored value, or None when it was not stored.
+        """
+
+        row = self.__connection.execute(
+            'SELECT value FROM snapshots '
+            'WHERE ticker = ? AND snapshot_date = ? AND indicator = ?',
+            (ticker, to_iso_date(snapshot_date), indicator)).fetchone()
+
+        return row[0] if row is not None else None
+
+    def history(self,
+                ticker: str,
+                indicator: str,
+                start: Union[date, str, None] = None,
+                end: Union[date, str, None] = None) -> List[Tuple[str, Value]]:
+        """Return the values of an indicator of a ticker over a period.
+
+        :param ticker: str: The ticker symbol.
+        :param indicator: str: The indicator path.
+        :param start: date | str: First date of the period, None has no limit.
+        :param end: date | str: Last date of the period, None has no limit.
+        :return: list: Pairs of date and value, oldest first.
+        """
+
+        return [(row.snapshot_date, row.value)
+                for row in self.query([ticker], [indicator], start, end)]
+
+    def cross_section(self,
+                      indicator: str,
+                      snapshot_date: Union[date, str]) -> Dict[str, Value]:
+        """Return the values of an indicator of every ticker on a date.
+
+        :param indicator: str: The indicator path.
+        :param snapshot_date: date | str: The date of the snapshot.
+        :return: dict: The value of each ticker.
+        """
+
+        return {row.ticker: row.value
+                for row in self.query(None, [indicator], snapshot_date, snapshot_date)}
+
+    def query(self,
+              tickers: Optional[Sequence[str]] = None,
+              indicators: Optional[Sequence[str]] = None,
+              start: Union[date, str, None] = None,
+              end: Union[date, str, None] = None) -> Iterator[SnapshotRow]:
+        """Yield the stored values matching every given filter.
+
+        The rows are read from the database as they are consumed, so a long
+        period is never loaded at once.
+
+        :param tickers: Sequence[str]: The ticker symbols, None matches every ticker.
+        :param indicators: Sequence[str]: The indicator paths, None matches every indicator.
+        :param start: date | str: First date of the period, None has no limit.
+        :param end: date | str: Last date of the period, None has no limit.
+        :return: Iterator[SnapshotRow]: The matching values, by ticker, date and indicator.
+        """
+
+        conditions: List[str] = []
+        parameters: List[str] = []
+
+        for column, values in (('ticker', tickers), ('indicator', indicators)):
+            if values is not None:
+                conditions.append(f'{column} IN ({", ".join("?" * len(values))})')
+                parameters.extend(values)
+
+        if start is not None:
+            conditions.append('snapshot_date >= ?')
+            parameters.append(to_iso_date(start))
+
+        if end is not None:
+            conditions.append('snapshot_date <= ?')
+            parameters.append(to_iso_date(end))
+
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        cursor = self.__connection.execute(
+            f'SELECT ticker, snapshot_date, indicator, value FROM snapshots{where} '
+            'ORDER BY ticker, snapshot_date, indicator', parameters)
+
+        for row in cursor:
+            yield SnapshotRow(*row)
+
+    def close(self) -> None:
+        """Close the database."""
+
+        self.__connection.close()
+
+    def __enter__(self) -> 'SnapshotStore':
+        return self
+
+    def __exit__(self, *exception_information) -> None:
+        self.close()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: snapshot_store_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test of the snapshot store."""
+
+from datetime import date
+
+import pytest
+
+from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+
+from .snapshot_store import SnapshotStore
+
+DIVIDEND_YIELD = 'valuation_indicators.dividend_yield'
+
+
+@pytest.fixture(name='store')
+def fixture_store() -> SnapshotStore:
+    """Return a store holding two snapshots of the mock stock."""
+
+    contract = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+
+    with SnapshotStore(':memory:') as store:
+        store.append({'VALE3': contract, 'INVALID': ExtractException('failed')},
+                     date(2024, 1, 2))
+        store.append([contract], '2024-02-01')
+
+        yield store
+
+
+def test_append_and_lookup(store: SnapshotStore) -> None:
+    """Test each run is stored as a dated snapshot and looked up by key."""
+
+    assert store.dates() == ['2024-01-02', '2024-02-01']
+    assert store.value('VALE3', DIVIDEND_YIELD, '2024-01-02') == pytest.approx(0.243)
+    assert store.value('VALE3', 'financial_summary.sector', date(2024, 2, 1)) == 'Mineração'
+    assert store.value('VALE3', DIVIDEND_YIELD, '2023-12-29') is None
+    assert store.metadata(DIVIDEND_YIELD).title == 'Dividend Yield'
+
+
+def test_time_range_queries(store: SnapshotStore) -> None:
+    """Test the values are read over a period, for a ticker or for every ticker."""
+
+    assert [snapshot_date for snapshot_date, _ in store.history('VALE3', DIVIDEND_YIELD)] == \
+        ['2024-01-02', '2024-02-01']
+    assert len(store.history('VALE3', DIVIDEND_YIELD, start='2024-01-15')) == 1
+    assert list(store.cross_section(DIVIDEND_YIELD, '2024-02-01')) == ['VALE3']
+    assert {row.indicator for row in store.query(end='2024-01-31')} >= {DIVIDEND_YIELD}
+
+
+def test_append_same_date_replaces(store: SnapshotStore) -> None:
+    """Test a run appended twice on the same date does not duplicate values."""
+
+    contract = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    stored = store.append([contract], '2024-02-01')
+
+    assert len(list(store.query(start='2024-02-01'))) == stored
+
+
+def test_append_partial_contracts_by_ticker(store: SnapshotStore) -> None:
+    """Test contracts without the identification are stored under the mapping key."""
+
+    contract = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    partial = TransformContract({'price_information':
+                                 contract.transformed_information['price_information']})
+
+    assert store.append({'PETR4': partial}, '2024-03-01') > 0
+    assert list(store.cross_section('price_information.price', '2024-03-01')) == ['PETR4']
+
+    with pytest.raises(ValueError, match='stock_identification'):
+        store.append([partial], '2024-03-01')
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: incremental_refresh.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Incremental Refresh.
+
+The balance sheet, the income statement and the indicators derived from them
+only change when a company publishes a new statement, while the price
+sections change with every trade. This module remembers, per ticker, the date
+of the last statement and the fundamental sections transformed from it, so a
+refresh transforms only the price sections until that date changes. The state
+file is plain JSON, so it is read back as data and never executed.
+"""
+
+import json
+import os
+import tempfile
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Iterable, NamedTuple, Optional
+
+from fundamentus.contracts.information_codec import (FORMAT_VERSION, MetadataTable,
+                                                     decode_information,
+                                                     encode_information,
+                                                     register_metadata)
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.utilities.config import (FUNDAMENTAL_SECTIONS,
+                                          INCREMENTAL_STATE_PATH, PRICE_SECTIONS,
+                                          SECTIONS)
+
+# Transforms the page of a ticker, restricted to some sections.
+SectionTransformer = Callable[[Iterable[str]], TransformContract]
+AsyncSectionTransformer = Callable[[Iterable[str]], Awaitable[TransformContract]]
+
+
+class TickerState(NamedTuple):
+    """Represents the fundamental sections of a ticker and the statement they come from."""
+
+    statement_date: str
+    numeric_mode: str
+    fundamentals: Dict
+
+
+class IncrementalRefresh:
+    """Represents the fundamental sections last seen for each ticker.
+
+    The price sections, which hold the last financial statement date, are
+    always transformed. The fundamental sections are transformed again only
+    when that date differs from the stored one. A ticker without a stored
+    state in its numeric mode has every section transformed at once.
+    """
+
+    def __init__(self, path: Optional[str] = INCREMENTAL_STATE_PATH) -> None:
+        """Initialize the class.
+
+        :param path: str: File keeping the state between runs, None keeps it in memory.
+        """
+
+        self.__path = path
+        self.__states: Dict[str, TickerState] = {}
+        self.__lock = Lock()
+
+        self.__refreshed = 0
+        self.__reused = 0
+
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as state_file:
+                self.__states = self.__decode(json.load(state_file))
+
+    @staticmethod
+    def __decode(data: Dict) -> Dict[str, TickerState]:
+        """Return the states of their JSON form.
+
+        :raises ValueError: If the file is not a stored state.
+        """
+
+        try:
+            if data['version'] != FORMAT_VERSION:
+                raise ValueError(f'Unsupported incremental state format: {data["version"]!r}.')
+
+            metadata: MetadataTable = data['metadata']
+            register_metadata(metadata)
+
+            return {ticker: TickerState(statement_date, numeric_mode,
+                                        decode_information(fundamentals, metadata))
+                    for ticker, (statement_date, numeric_mode, fundamentals)
+                    in data['tickers'].items()}
+        except (KeyError, TypeError) as error:
+            raise ValueError(f'Malformed incremental state: {error}.') from error
+
+    @staticmethod
+    def __encode(states: Dict[str, TickerState]) -> Dict:
+        """Return the JSON form of the states, with the titles and tooltips stored once."""
+
+        metadata: MetadataTable = {}
+        tickers = {ticker: [state.statement_date, state.numeric_mode,
+                            encode_information(state.fundamentals, metadata)]
+                   for ticker, state in states.items()}
+
+        return {'version': FORMAT_VERSION, 'metadata': metadata, 'tickers': tickers}
+
+    @staticmethod
+    def statement_date(information: Dict) -> str:
+        """Return the date of the last financial statement of a stock.
+
+        :param information: dict: The transformed price sections of a stock.
+        :return: str: The date of the last statement, as shown on the page.
+        """
+
+        return information['financial_summary']['last_financial_statement'].value
+
+    def fundamentals(self,
+                     ticker: str,
+                     statement_date: str,
+                     numeric_mode: str) -> Optional[Dict]:
+        """Return the stored fundamental sections, if they are still current.
+
+        :param ticker: str: The ticker symbol.
+        :param statement_date: str: The date of the last statement on the page.
+        :param numeric_mode: str: The type of the transformed numbers.
+        :return: dict: The fundamental sections, or None when they must be transformed.
+        """
+
+        with self.__lock:
+            state = self.__states.get(ticker)
+
+            if state is not None and state[:2] == (statement_date, numeric_mode):
+                self.__reused += 1
+
+                return state.fundamentals
+
+            self.__refreshed += 1
+
+            return None
+
+    def __is_known(self, ticker: str, numeric_mode: str) -> bool:
+        """Return whether a ticker has fundamental sections stored in a numeric mode."""
+
+        with self.__lock:
+            state = self.__states.get(ticker)
+
+            return state is not None and state.numeric_mode == numeric_mode
+
+    def __split(self, ticker: str, numeric_mode: str, information: Dict) -> TransformContract:
+        """Store the fundamental sections of a ticker transformed with every other section."""
+
+        fundamentals = {section: information[section] for section in FUNDAMENTAL_SECTIONS}
+        self.update(ticker, self.statement_date(information), numeric_mode, fundamentals)
+
+        with self.__lock:
+            self.__refreshed += 1
+
+        return TransformContract(information)
+
+    def update(self,
+               ticker: str,
+               statement_date: str,
+               numeric_mode: str,
+               fundamentals: Dict) -> None:
+        """Store the fundamental sections of a ticker.
+
+        :param ticker: str: The ticker symbol.
+        :param statement_date: str: The date of the statement they come from.
+        :param numeric_mode: str: The type of the transformed numbers.
+        :param fundamentals: dict: The transformed fundamental sections.
+        """
+
+        with self.__lock:
+            self.__states[ticker] = TickerState(statement_date, numeric_mode, fundamentals)
+
+    def refresh(self,
+                ticker: str,
+                numeric_mode: str,
+                transform: SectionTransformer) -> TransformContract:
+        """Transform the page of a ticker, reusing its fundamentals when current.
+
+        :param ticker: str: The ticker symbol.
+        :param numeric_mode: str: The type of the transformed numbers.
+        :param transform: Callable: Transforms the page, restricted to some sections.
+        :return: TransformContract: Every section of the ticker.
+        """
+
+        # An unknown ticker needs every section, so the page is transformed only once.
+        if not self.__is_known(ticker, numeric_mode):
+            return self.__split(ticker, numeric_mode, transform(SECTIONS).transformed_information)
+
+        information = transform(PRICE_SECTIONS).transformed_information
+        statement_date = self.statement_date(information)
+        fundamentals = self.fundamentals(ticker, statement_date, numeric_mode)
+
+        if fundamentals is None:
+            fundamentals = transform(FUNDAMENTAL_SECTIONS).transformed_information
+            self.update(ticker, statement_date, numeric_mode, fundamentals)
+
+        return TransformContract({**information, **fundamentals})
+
+    async def refresh_async(self,
+                            ticker: str,
+                            numeric_mode: str,
+                            transform: AsyncSectionTransformer) -> TransformContract:
+        """Coroutine version of refresh, for transformations run in worker processes.
+
+        :param ticker: str: The ticker symbol.
+        :param numeric_mode: str: The type of the transformed numbers.
+        :param transform: Callable: Coroutine transforming the page, restricted to some sections.
+        :return: TransformContract: Every section of the ticker.
+        """
+
+        if not self.__is_known(ticker, numeric_mode):
+            information = (await transform(SECTIONS)).transformed_information
+
+            return self.__split(ticker, numeric_mode, information)
+
+        information = (await transform(PRICE_SECTIONS)).transformed_information
+        statement_date = self.statement_date(information)
+        fundamentals = self.fundamentals(ticker, statement_date, numeric_mode)
+
+        if fundamentals is None:
+            fundamentals = (await transform(FUNDAMENTAL_SECTIONS)).transformed_information
+            self.update(ticker, statement_date, numeric_mode, fundamentals)
+
+        return TransformContract({**information, **fundamentals})
+
+    def save(self) -> None:
+        """Write the state to its file, if it has one."""
+
+        if self.__path is None:
+            return
+
+        with self.__lock:
+            data = self.__encode(dict(self.__states))
+
+        # Written to a temporary file first, so an interrupted run keeps the previous state.
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8') as state_file:
+            json.dump(data, state_file, ensure_ascii=False)
+
+        os.replace(temporary_path, self.__path)
+
+    def statistics(self) -> Dict[str, int]:
+        """Report how many tickers skipped the fundamental sections.
+
+        :return: dict: Number of tickers refreshed, reused and stored.
+        """
+
+        with self.__lock:
+            return {
+                'refreshed': self.__refreshed,
+                'reused': self.__reused,
+                'tickers': len(self.__states)
+            }
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: incremental_refresh_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test of the incremental refresh."""
+
+import copy
+import json
+from typing import Iterable, List
+
+import pytest
+
+from fundamentus.contracts.extract_contract import ExtractContract
+from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+from fundamentus.utilities.config import FUNDAMENTAL_SECTIONS, PRICE_SECTIONS, SECTIONS
+
+from .incremental_refresh import IncrementalRefresh
+
+
+class RecordingTransformer:
+    """Transforms an extract contract, recording the sections asked for."""
+
+    def __init__(self, extract_contract: ExtractContract) -> None:
+        self.extract_contract = extract_contract
+        self.calls: List[tuple] = []
+
+    def __call__(self, sections: Iterable[str]) -> TransformContract:
+        self.calls.append(tuple(sections))
+
+        return TransformRawInformation().transform_all_information(self.extract_contract,
+                                                                   sections)
+
+
+def with_statement_date(statement_date: str) -> ExtractContract:
+    """Return the mock extract contract with another last statement date."""
+
+    raw_information = copy.deepcopy(EXTRACT_CONTRACT_MOCK.raw_information)
+    raw_information['financial_summary']['last_financial_statement'][2] = statement_date
+
+    return ExtractContract(raw_information, EXTRACT_CONTRACT_MOCK.extraction_date)
+
+
+def test_refresh_reuses_current_fundamentals() -> None:
+    """Test that an unknown ticker is transformed once, then only its price sections."""
+
+    refresh = IncrementalRefresh()
+    transform = RecordingTransformer(EXTRACT_CONTRACT_MOCK)
+
+    first = refresh.refresh('VALE3', 'decimal', transform)
+    second = refresh.refresh('VALE3', 'decimal', transform)
+
+    assert list(first.transformed_information) == list(SECTIONS)
+    assert second == first
+    assert transform.calls == [SECTIONS, PRICE_SECTIONS]
+    assert refresh.statistics() == {'refreshed': 1, 'reused': 1, 'tickers': 1}
+
+
+def test_refresh_on_new_statement() -> None:
+    """Test that a new statement date, or numeric mode, refreshes the fundamentals."""
+
+    refresh = IncrementalRefresh()
+    refresh.refresh('VALE3', 'decimal', RecordingTransformer(EXTRACT_CONTRACT_MOCK))
+
+    transform = RecordingTransformer(with_statement_date('30/09/2022'))
+    refresh.refresh('VALE3', 'decimal', transform)
+    refresh.refresh('VALE3', 'float', transform)
+
+    assert transform.calls == [PRICE_SECTIONS, FUNDAMENTAL_SECTIONS, SECTIONS]
+    assert refresh.statistics()['refreshed'] == 3
+
+
+def test_save_and_load(tmp_path) -> None:
+    """Test that the state survives between runs."""
+
+    path = str(tmp_path / 'incremental.json')
+
+    refresh = IncrementalRefresh(path)
+    first = refresh.refresh('VALE3', 'decimal', RecordingTransformer(EXTRACT_CONTRACT_MOCK))
+    refresh.save()
+
+    transform = RecordingTransformer(EXTRACT_CONTRACT_MOCK)
+    second = IncrementalRefresh(path).refresh('VALE3', 'decimal', transform)
+
+    assert transform.calls == [PRICE_SECTIONS]
+    assert second == first
+
+    with open(path, encoding='utf-8') as state_file:
+        assert list(json.load(state_file)['tickers']) == ['VALE3']
+
+
+def test_load_rejects_invalid_state(tmp_path) -> None:
+    """Test that a file which is not a stored state is rejected."""
+
+    path = tmp_path / 'incremental.json'
+    path.write_text('{"version": 1, "tickers": {}}', encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        IncrementalRefresh(str(path))
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: parse_result_cache.py
+#  Version: 0.0.4
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Parse Result Cache.
+
+The HTTP cache avoids downloading a page again, but not parsing it again.
+This module keeps the transformed information under a hash of the page
+content, in memory with LRU eviction and, optionally, on disk, so an
+unchanged page skips the collect and transform stages completely. The
+on-disk entries are plain JSON, so a directory shared with other users can
+not run code in the process reading it.
+"""
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+from fundamentus.contracts.information_codec import dumps_contract, loads_contract
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.utilities.config import PARSE_CACHE_DIRECTORY, PARSE_CACHE_SIZE
+
+
+class ParseResultCache:
+    """Represents a cache of transformed information keyed by the page content.
+
+    The cached contracts are shared by every caller and must not be modified.
+    """
+
+    def __init__(self,
+                 max_entries: int = PARSE_CACHE_SIZE,
+                 directory: Optional[str] = PARSE_CACHE_DIRECTORY) -> None:
+        """Initialize the class.
+
+        :param max_entries: int: Number of results kept in memory, 0 disables the memory store.
+        :param directory: str: Directory of the on-disk store, None disables it.
+        """
+
+        self.__max_entries = max_entries
+        self.__directory = directory
+
+        self.__entries: 'OrderedDict[str, TransformContract]' = OrderedDict()
+        self.__lock = Lock()
+
+        self.__hits = 0
+        self.__disk_hits = 0
+        self.__misses = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(html: str, variant: str = '') -> str:
+        """Return the cache key of a page.
+
+        :param html: str: HTML content of the page.
+        :param variant: str: Options that change the transformed result, like the numeric mode.
+        :return: str: Hash of the page content.
+        """
+
+        content_hash = hashlib.blake2b(variant.encode('utf-8'), digest_size=20)
+        content_hash.update(b'\0')
+        content_hash.update(html.encode('utf-8'))
+
+        return content_hash.hexdigest()
+
+    def __path(self, key: str) -> str:
+        """Return the on-disk path of a key."""
+
+        return os.path.join(self.__directory, f'{key}.json')
+
+    def __remember(self, key: str, contract: TransformContract) -> None:
+        """Store a result in memory, evicting the least recently used one."""
+
+        if self.__max_entries <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[key] = contract
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[TransformContract]:
+        """Return the cached result of a page.
+
+        :param key: str: Cache key of the page.
+        :return: TransformContract: Cached result, or None if the page is unknown.
+        """
+
+        with self.__lock:
+            contract = self.__entries.get(key)
+
+            if contract is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+
+                return contract
+
+        if self.__directory is not None:
+            try:
+                with open(self.__path(key), encoding='utf-8') as cache_file:
+                    contract = loads_contract(cache_file.read())
+            except (OSError, ValueError):
+                contract = None
+
+            if contract is not None:
+                self.__remember(key, contract)
+
+                with self.__lock:
+                    self.__disk_hits += 1
+
+                return contract
+
+        with self.__lock:
+            self.__misses += 1
+
+        return None
+
+    def put(self, key: str, contract: TransformContract) -> None:
+        """Store the result of a page.
+
+        :param key: str: Cache key of the page.
+        :param contract: TransformContract: Transformed information of the page.
+        """
+
+        self.__remember(key, contract)
+
+        if self.__directory is not None:
+            # Written to a temporary file first, so readers never see a partial entry.
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.__directory)
+
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as cache_file:
+                cache_file.write(dumps_contract(contract))
+
+            os.replace(temporary_path, self.__path(key))
+
+    def get_or_process(self,
+                       html: str,
+                       process: Callable[[str], TransformContract],
+                       variant: str = '') -> TransformContract:
+        """Return the cached result of a page, processing it on a miss.
+
+        :param html: str: HTML content of the page.
+        :param process: Callable: Function that collects and transforms the page.
+        :param variant: str: Options that change the transformed result, like the numeric mode.
+        :return: TransformContract: Transformed information of the page.
+        """
+
+        key = self.key(html, variant)
+        contract = self.get(key)
+
+        if contract is None:
+            contract = process(html)
+            self.put(key, contract)
+
+        return contract
+
+    def statistics(self) -> Dict[str, int]:
+        """Report how many pages skipped the parse.
+
+        :return: dict: Number of memory hits, disk hits, misses and entries in memory.
+        """
+
+        with self.__lock:
+            return {
+                'hits': self.__hits,
+                'disk_hits': self.__disk_hits,
+                'misses': self.__misses,
+                'entries': len(self.__entries)
+            }
+
+    def clear(self) -> None:
+        """Remove every result kept in memory."""
+
+        with self.__lock:
+            self.__entries.clear()
+
+
+# Process-wide cache shared by every pipeline.
+__SHARED_PARSE_CACHE = ParseResultCache()
+
+
+def get_shared_parse_cache() -> ParseResultCache:
+    """Return the process-wide parse result cache.
+
+    :return: ParseResultCache: The shared cache.
+    """
+
+    return __SHARED_PARSE_CACHE
+
+
+def configure_shared_parse_cache(max_entries: int = PARSE_CACHE_SIZE,
+                                 directory: Optional[str] = PARSE_CACHE_DIRECTORY
+                                 ) -> ParseResultCache:
+    """Replace the process-wide parse result cache with a new configuration.
+
+    :param max_entries: int: Number of results kept in memory, 0 disables the memory store.
+    :param directory: str: Directory of the on-disk store, None disables it.
+    :return: ParseResultCache: The new shared cache.
+    """
+
+    global __SHARED_PARSE_CACHE  # pylint: disable=global-statement
+
+    __SHARED_PARSE_CACHE = ParseResultCache(max_entries=max_entries, directory=directory)
+
+    return __SHARED_PARSE_CACHE
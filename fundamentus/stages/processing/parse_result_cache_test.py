@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: parse_result_cache_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test the ParseResultCache."""
+
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+
+from .parse_result_cache import ParseResultCache
+from .process_pool_processor import process_html
+
+
+def test_get_or_process() -> None:
+    """Test an unchanged page is processed only once."""
+
+    calls = []
+
+    def process(html: str):
+        calls.append(html)
+        return process_html(html)
+
+    cache = ParseResultCache()
+    first_response = cache.get_or_process(HTML_COLLECTOR_MOCK['content'], process)
+    second_response = cache.get_or_process(HTML_COLLECTOR_MOCK['content'], process)
+
+    assert len(calls) == 1
+    assert second_response is first_response
+    assert cache.statistics() == {'hits': 1, 'disk_hits': 0, 'misses': 1, 'entries': 1}
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used result is evicted."""
+
+    cache = ParseResultCache(max_entries=2)
+    cache.put('first', 1)
+    cache.put('second', 2)
+    cache.get('first')
+    cache.put('third', 3)
+
+    assert cache.get('second') is None
+    assert cache.get('first') == 1
+    assert cache.get('third') == 3
+
+
+def test_disk_store(tmp_path) -> None:
+    """Test the results survive in the on-disk store."""
+
+    contract = process_html(HTML_COLLECTOR_MOCK['content'])
+    key = ParseResultCache.key(HTML_COLLECTOR_MOCK['content'])
+
+    ParseResultCache(directory=str(tmp_path)).put(key, contract)
+    cache = ParseResultCache(directory=str(tmp_path))
+
+    assert cache.get(key) == contract
+    assert cache.get(key) == contract
+    assert cache.statistics()['disk_hits'] == 1
+    assert cache.statistics()['hits'] == 1
+
+
+def test_disk_store_ignores_invalid_entries(tmp_path) -> None:
+    """Test that an entry which is not a stored contract is a miss."""
+
+    key = ParseResultCache.key(HTML_COLLECTOR_MOCK['content'])
+    (tmp_path / f'{key}.json').write_text('{"version": 1}', encoding='utf-8')
+
+    assert ParseResultCache(directory=str(tmp_path)).get(key) is None
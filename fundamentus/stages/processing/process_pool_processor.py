@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: process_pool_processor.py
+#  Version: 0.0.5
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Process Pool Processor.
+
+Parsing the HTML with BeautifulSoup is CPU-bound and holds the GIL, so in the
+batch pipelines the collect and transform stages run in worker processes.
+Each result is tagged with its ticker, so the output does not depend on which
+worker processed a page or in which order the pages finished.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.html_collector_factory import create_html_collector
+from fundamentus.stages.extraction.extractor_html_information import \
+    ExtractorHtmlInformation as Extractor
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation as Transformer
+from fundamentus.utilities.config import MAX_WORKERS, NUMERIC_MODE, PARSER
+
+
+def process_html(html: str,
+                 parser: str = PARSER,
+                 numeric_mode: str = NUMERIC_MODE,
+                 sections: Optional[Iterable[str]] = None) -> TransformContract:
+    """Collect and transform the HTML of a single company.
+
+    Module level function, so it can be sent to the worker processes.
+
+    :param html: str: HTML content of the company page.
+    :param parser: str: HTML parser backend.
+    :param numeric_mode: str: Type of the transformed numbers, decimal or float.
+    :param sections: Iterable[str]: Sections to transform, None transforms every section.
+    :return: TransformContract: Transformed information.
+    :raises ExtractException: If the extraction fails.
+    :raises TransformException: If the transformation fails.
+    """
+
+    extractor = Extractor(requester=None, collector=create_html_collector(parser))
+
+    return Transformer(numeric_mode).transform_all_information(
+        extractor.extract_all_information_from_html(html, sections), sections)
+
+
+class ProcessPoolProcessor:
+    """Represents a pool of processes collecting and transforming HTML pages.
+
+    It may be used as a context manager, which shuts the pool down on exit.
+    """
+
+    def __init__(self,
+                 max_workers: int = MAX_WORKERS,
+                 executor: Executor = None,
+                 parser: str = PARSER,
+                 numeric_mode: str = NUMERIC_MODE) -> None:
+        """Initialize the class.
+
+        :param max_workers: int: Number of worker processes, None uses every CPU.
+        :param executor: Executor: Custom executor, replaces the process pool.
+        :param parser: str: HTML parser backend used by the workers.
+        :param numeric_mode: str: Type of the transformed numbers, decimal or float.
+        """
+
+        self.__max_workers = max_workers
+        self.__executor = executor
+        self.__parser = parser
+        self.__numeric_mode = numeric_mode
+
+    @property
+    def executor(self) -> Executor:
+        """Return the executor, starting the worker processes on first use."""
+
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.__max_workers)
+
+        return self.__executor
+
+    def process_all(self, pages: Dict[str, str]) -> Iterator[Tuple[str, Union[TransformContract,
+                                                                              Exception]]]:
+        """Process many pages, yielding each result as soon as it is ready.
+
+        A failure on one page does not abort the others: its result is the
+        raised exception instead of the contract.
+
+        :param pages: dict: HTML content of each ticker.
+        :return: Iterator: Pairs of ticker and result, in completion order.
+        """
+
+        futures = {self.executor.submit(process_html, html, self.__parser,
+                                        self.__numeric_mode): ticker
+                   for ticker, html in pages.items()}
+
+        for future in as_completed(futures):
+            exception = future.exception()
+
+            yield futures[future], exception if exception is not None else future.result()
+
+    async def process_async(self,
+                            html: str,
+                            sections: Optional[Iterable[str]] = None) -> TransformContract:
+        """Process a single page without blocking the running event loop.
+
+        :param html: str: HTML content of the company page.
+        :param sections: Iterable[str]: Sections to transform, None transforms every section.
+        :return: TransformContract: Transformed information.
+        :raises ExtractException: If the extraction fails.
+        :raises TransformException: If the transformation fails.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor,
+                                                                process_html,
+                                                                html,
+                                                                self.__parser,
+                                                                self.__numeric_mode,
+                                                                sections)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __enter__(self) -> 'ProcessPoolProcessor':
+        return self
+
+    def __exit__(self, *exception_information) -> None:
+        self.shutdown()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: process_pool_processor_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test the ProcessPoolProcessor."""
+
+import asyncio
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+
+from .process_pool_processor import ProcessPoolProcessor, process_html
+
+
+def test_process_all() -> None:
+    """Test every page is processed, whatever worker handles it."""
+
+    pages = {ticker: HTML_COLLECTOR_MOCK['content']
+             for ticker in ('MGLU3', 'WEGE3', 'VALE3', 'PETR4')}
+    pages['INVALID'] = '<html><body></body></html>'
+
+    expected = process_html(HTML_COLLECTOR_MOCK['content'])
+
+    with ProcessPoolProcessor(max_workers=2) as processor:
+        response = dict(processor.process_all(pages))
+
+    assert set(response.keys()) == set(pages.keys())
+    for ticker in ('MGLU3', 'WEGE3', 'VALE3', 'PETR4'):
+        assert isinstance(response[ticker], TransformContract)
+        assert response[ticker] == expected
+    assert isinstance(response['INVALID'], ExtractException)
+
+
+def test_process_async() -> None:
+    """Test a page is processed from a running event loop."""
+
+    with ProcessPoolProcessor(max_workers=1) as processor:
+        response = asyncio.run(processor.process_async(HTML_COLLECTOR_MOCK['content']))
+
+    assert response == process_html(HTML_COLLECTOR_MOCK['content'])
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: transform_raw_information.py
-#  Version: 0.1.3
+#  Version: 0.1.10
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -28,12 +28,18 @@ for feeding into financial models.
 """
 
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Union
 
 from fundamentus.contracts.extract_contract import ExtractContract
 from fundamentus.contracts.information_contract import InformationItem
 from fundamentus.contracts.transform_contract import TransformContract
 from fundamentus.exceptions.transform_exception import TransformException
+from fundamentus.utilities.config import NUMERIC_MODE
+from fundamentus.utilities.number_normalizer import to_decimal, to_float
+from fundamentus.utilities.sections import validate_sections
+
+# Types of the transformed numbers.
+NUMERIC_MODES = ('decimal', 'float')
 
 
 # pylint: disable=too-few-public-methods
@@ -51,8 +57,35 @@ class TransformRawInformation:
 
     Methods are provided to process individual components of the financial data,
     as well as to transform comprehensive datasets for complete analysis.
+
+    Numbers are exact Decimals by default; with `numeric_mode='float'` they are
+    native floats, much faster for screening and ready to export into NumPy.
     """
 
+    def __init__(self, numeric_mode: str = NUMERIC_MODE) -> None:
+        """
+        Initializes the transformer.
+
+        Args:
+            numeric_mode (str): The type of the transformed numbers, 'decimal' or 'float'.
+
+        Raises:
+            ValueError: If the numeric mode is not supported.
+        """
+
+        if numeric_mode not in NUMERIC_MODES:
+            raise ValueError(f'Invalid numeric mode: {numeric_mode}. '
+                             f'Choose from: {", ".join(NUMERIC_MODES)}.')
+
+        self.__numeric_mode = numeric_mode
+        self.__to_number = to_float if numeric_mode == 'float' else to_decimal
+
+    @property
+    def numeric_mode(self) -> str:
+        """The type of the transformed numbers, 'decimal' or 'float'."""
+
+        return self.__numeric_mode
+
     @staticmethod
     def __remove_new_lines(string: str) -> str:
         """
@@ -108,122 +141,25 @@ class TransformRawInformation:
 
         return string.strip()
 
-    @staticmethod
-    def __remove_dot(string: str) -> str:
-        """
-        Removes all period (dot) characters from a given string.
-
-        This static method is used for cleaning strings by removing all
-        occurrences of the period character. It's particularly useful
-        in preprocessing numerical strings where dots may be used as
-        thousand separators or are otherwise present but not desired
-        in the final numerical representation.
-
-        Args:
-            string (str): The input string from which dots will be removed.
-
-        Returns:
-            str: A new string with all period characters removed.
-        """
-
-        return string.replace('.', '')
-
-    @staticmethod
-    def __change_comma_to_dot(string: str) -> str:
-        """
-        Replaces all comma characters with period (dot)
-        characters in a given string.
-
-        This method is essential for processing numerical strings
-        where commas are used as decimal separators, converting
-        them to a format that is compatible with the decimal
-        point notation used in Python. It ensures that numerical
-        strings can be correctly converted to float or Decimal types.
-
-        Args:
-            string (str): The input string in which commas will be
-            replaced with dots.
-
-        Returns:
-            str: The modified string with commas replaced by dots,
-            ready for numerical conversion.
-        """
-
-        return string.replace(',', '.')
-
-    @staticmethod
-    def __to_decimal(value: str) -> Decimal:
-        """
-        Convert a string to a Decimal, handling percentage values.
-
-        Converts string representations of numbers, including those
-        ending in '%', to Decimal. Percentage values are converted to
-        their decimal equivalent (e.g., "50%" becomes 0.5).
-
-        Args:
-            value (str): The string representing a number or
-                         percentage to convert.
-
-        Returns:
-            Decimal: The Decimal representation of the input string.
-        """
-
-        strip_value = value.strip()
-
-        if '-' == strip_value:
-            return Decimal(0)
-
-        if strip_value.endswith('%'):
-            strip_value = strip_value[:-1].strip()
-
-            if '-' == strip_value.strip():
-                return Decimal(0)
-
-            return Decimal(strip_value) / 100
-
-        return Decimal(strip_value) if strip_value is not None else None
-
-    @staticmethod
-    def __remove_currency_symbol(number: str) -> str:
-        """
-        Removes currency symbols from a given string.
-
-        This static method is designed to strip common currency symbols
-        (e.g., the dollar sign '$', the euro sign '€', or the Brazilian real 'R$')
-        from the input string, preparing it for numerical conversion or
-        further processing. While primarily focused on the Brazilian real symbol,
-        it can be extended to remove other currency symbols as needed.
-
-        Args:
-            number (str): The input string from which currency symbols are to be removed.
-
-        Returns:
-            str: The input string with currency symbols removed, ready for further processing.
-        """
-
-        return number.replace('R$', '')
-
-    def __number_processing(self, number: str) -> Decimal:
+    def __number_processing(self, number: str) -> Union[Decimal, float]:
         """
-        Processes a raw string representing a number and converts it into a Decimal.
+        Processes a raw string representing a number and converts it into a Decimal,
+        or into a float in the float numeric mode.
 
-        This method applies a series of cleaning steps to the input string, including removing currency
-        symbols, replacing commas with dots for decimal representation, and removing unnecessary spaces
-        or newline characters. The cleaned string is then converted into a Decimal for accurate financial
-        calculations.
+        The currency symbol, the thousands separators and the newlines are removed,
+        and the decimal comma is replaced by a dot, in a single expression instead of
+        one helper call per step. The cleaned string is then converted into a Decimal
+        for accurate financial calculations.
 
         Args:
             number (str): The raw string representation of a number, potentially including currency symbols,
             commas as decimal separators, and whitespace.
 
         Returns:
-            Decimal: The cleaned and converted Decimal object representing the input number.
+            Union[Decimal, float]: The cleaned and converted number.
         """
 
-        return self.__to_decimal(
-            self.__remove_currency_symbol(
-                self.__change_comma_to_dot(
-                    self.__remove_dot(self.__remove_new_lines(number)))))
+        return self.__to_number(number)
 
     def __transformation_of_stock_identification(self,
                                                  stock_identification: Dict) -> Dict:
@@ -245,11 +181,13 @@ class TransformRawInformation:
         """
 
         name = InformationItem(
+            path='stock_identification.name',
             title='Código',
             tooltip='Código da ação.',
             value=self.__string_processing(stock_identification['symbol'][0]))
 
         ticker = InformationItem(
+            path='stock_identification.ticker',
             title='Empresa',
             tooltip='Nome comercial da empresa.',
             value=self.__string_processing(stock_identification['name'][0]))
@@ -282,31 +220,37 @@ class TransformRawInformation:
         """
 
         market_valuation = InformationItem(
+            path='financial_summary.market_valuation',
             title=self.__string_processing(financial_summary['market_valuation'][0]),
             tooltip=self.__string_processing(financial_summary['market_valuation'][1]),
             value=self.__number_processing(financial_summary['market_valuation'][2]))
 
         enterprise_valuation = InformationItem(
+            path='financial_summary.enterprise_valuation',
             title=self.__string_processing(financial_summary['enterprise_valuation'][0]),
             tooltip=self.__string_processing(financial_summary['enterprise_valuation'][1]),
             value=self.__number_processing(financial_summary['enterprise_valuation'][2]))
 
         number_of_shares = InformationItem(
+            path='financial_summary.number_of_shares',
             title=self.__string_processing(financial_summary['number_of_shares'][0]),
             tooltip=self.__string_processing(financial_summary['number_of_shares'][1]),
             value=self.__number_processing(financial_summary['number_of_shares'][2]))
 
         last_financial_statement = InformationItem(
+            path='financial_summary.last_financial_statement',
             title=self.__string_processing(financial_summary['last_financial_statement'][0]),
             tooltip=self.__string_processing(financial_summary['last_financial_statement'][1]),
             value=self.__string_processing(financial_summary['last_financial_statement'][2]))
 
         sector = InformationItem(
+            path='financial_summary.sector',
             title=self.__string_processing(financial_summary['sector'][0]),
             tooltip=self.__string_processing(financial_summary['sector'][1]),
             value=self.__string_processing(financial_summary['sector'][2]))
 
         subsector = InformationItem(
+            path='financial_summary.subsector',
             title=self.__string_processing(financial_summary['subsector'][0]),
             tooltip=self.__string_processing(financial_summary['subsector'][1]),
             value=self.__string_processing(financial_summary['subsector'][2]))
@@ -340,11 +284,13 @@ class TransformRawInformation:
         """
 
         price = InformationItem(
+            path='price_information.price',
             title=self.__string_processing(price_information['price'][0]),
             tooltip=self.__string_processing(price_information['price'][1]),
             value=self.__number_processing(price_information['price'][2]))
 
         date = InformationItem(
+            path='price_information.date',
             title=self.__string_processing(price_information['date'][0]),
             tooltip=self.__string_processing(price_information['date'][1]),
             value=self.__string_processing(price_information['date'][2]))
@@ -370,6 +316,7 @@ class TransformRawInformation:
         """
 
         stock_type = InformationItem(
+            path='detailed_information.stock_type',
             title=self.__string_processing(
                 detailed_information['stock_type'][0]),
             tooltip=self.__string_processing(
@@ -378,6 +325,7 @@ class TransformRawInformation:
                 detailed_information['stock_type'][2]))
 
         traded_volume_per_day = InformationItem(
+            path='detailed_information.traded_volume_per_day',
             title=self.__string_processing(
                 detailed_information['traded_volume_per_day'][0]),
             tooltip=self.__string_processing(
@@ -386,6 +334,7 @@ class TransformRawInformation:
                 detailed_information['traded_volume_per_day'][2]))
 
         equity_value_per_share = InformationItem(
+            path='detailed_information.equity_value_per_share',
             title=self.__string_processing(
                 detailed_information['equity_value_per_share'][0]),
             tooltip=self.__string_processing(
@@ -394,6 +343,7 @@ class TransformRawInformation:
                 detailed_information['equity_value_per_share'][2]))
 
         earnings_per_share = InformationItem(
+            path='detailed_information.earnings_per_share',
             title=self.__string_processing(
                 detailed_information['earnings_per_share'][0]),
             tooltip=self.__string_processing(
@@ -402,6 +352,7 @@ class TransformRawInformation:
                 detailed_information['earnings_per_share'][2]))
 
         lowest_value = InformationItem(
+            path='detailed_information.variation_52_weeks.lowest_value',
             title='Mínimo',
             tooltip=self.__string_processing(
                 detailed_information['variation_52_weeks']['lowest_value'][0]),
@@ -409,6 +360,7 @@ class TransformRawInformation:
                 detailed_information['variation_52_weeks']['lowest_value'][1]))
 
         highest_value = InformationItem(
+            path='detailed_information.variation_52_weeks.highest_value',
             title='Máximo',
             tooltip=self.__string_processing(
                 detailed_information['variation_52_weeks']['highest_value']
@@ -446,6 +398,7 @@ class TransformRawInformation:
         """
 
         variation_day = InformationItem(
+            path='oscillations.variation_day',
             title=self.__string_processing(
                 oscillations_information['variation_day'][0]),
             tooltip='',
@@ -453,6 +406,7 @@ class TransformRawInformation:
                 oscillations_information['variation_day'][1]))
 
         variation_month = InformationItem(
+            path='oscillations.variation_month',
             title=self.__string_processing(
                 oscillations_information['variation_month'][0]),
             tooltip='',
@@ -460,6 +414,7 @@ class TransformRawInformation:
                 oscillations_information['variation_month'][1]))
 
         variation_30_days = InformationItem(
+            path='oscillations.variation_30_days',
             title=self.__string_processing(
                 oscillations_information['variation_30_days'][0]),
             tooltip='',
@@ -467,6 +422,7 @@ class TransformRawInformation:
                 oscillations_information['variation_30_days'][1]))
 
         variation_12_months = InformationItem(
+            path='oscillations.variation_12_months',
             title=self.__string_processing(
                 oscillations_information['variation_12_months'][0]),
             tooltip='',
@@ -474,6 +430,7 @@ class TransformRawInformation:
                 oscillations_information['variation_12_months'][1]))
 
         variation_2022 = InformationItem(
+            path='oscillations.variation_2022',
             title=self.__string_processing(
                 oscillations_information['variation_2022'][0]),
             tooltip='',
@@ -481,6 +438,7 @@ class TransformRawInformation:
                 oscillations_information['variation_2022'][1]))
 
         variation_2021 = InformationItem(
+            path='oscillations.variation_2021',
             title=self.__string_processing(
                 oscillations_information['variation_2021'][0]),
             tooltip='',
@@ -488,6 +446,7 @@ class TransformRawInformation:
                 oscillations_information['variation_2021'][1]))
 
         variation_2020 = InformationItem(
+            path='oscillations.variation_2020',
             title=self.__string_processing(
                 oscillations_information['variation_2020'][0]),
             tooltip='',
@@ -495,6 +454,7 @@ class TransformRawInformation:
                 oscillations_information['variation_2020'][1]))
 
         variation_2019 = InformationItem(
+            path='oscillations.variation_2019',
             title=self.__string_processing(
                 oscillations_information['variation_2019'][0]),
             tooltip='',
@@ -502,6 +462,7 @@ class TransformRawInformation:
                 oscillations_information['variation_2019'][1]))
 
         variation_2018 = InformationItem(
+            path='oscillations.variation_2018',
             title=self.__string_processing(
                 oscillations_information['variation_2018'][0]),
             tooltip='',
@@ -509,6 +470,7 @@ class TransformRawInformation:
                 oscillations_information['variation_2018'][1]))
 
         variation_2017 = InformationItem(
+            path='oscillations.variation_2017',
             title=self.__string_processing(
                 oscillations_information['variation_2017'][0]),
             tooltip='',
@@ -546,6 +508,7 @@ class TransformRawInformation:
     """
 
         price_divided_by_profit_title = InformationItem(
+            path='valuation_indicators.price_divided_by_profit_title',
             title=self.__string_processing(
                 valuation_indicators['price_divided_by_profit_title'][0]),
             tooltip=self.__string_processing(
@@ -554,6 +517,7 @@ class TransformRawInformation:
                 valuation_indicators['price_divided_by_profit_title'][2]))
 
         price_divided_by_asset_value = InformationItem(
+            path='valuation_indicators.price_divided_by_asset_value',
             title=self.__string_processing(
                 valuation_indicators['price_divided_by_asset_value'][0]),
             tooltip=self.__string_processing(
@@ -562,6 +526,7 @@ class TransformRawInformation:
                 valuation_indicators['price_divided_by_asset_value'][2]))
 
         price_divided_by_ebit = InformationItem(
+            path='valuation_indicators.price_divided_by_ebit',
             title=self.__string_processing(
                 valuation_indicators['price_divided_by_ebit'][0]),
             tooltip=self.__string_processing(
@@ -570,6 +535,7 @@ class TransformRawInformation:
                 valuation_indicators['price_divided_by_ebit'][2]))
 
         price_divided_by_net_revenue = InformationItem(
+            path='valuation_indicators.price_divided_by_net_revenue',
             title=self.__string_processing(
                 valuation_indicators['price_divided_by_net_revenue'][0]),
             tooltip=self.__string_processing(
@@ -578,6 +544,7 @@ class TransformRawInformation:
                 valuation_indicators['price_divided_by_net_revenue'][2]))
 
         price_divided_by_total_assets = InformationItem(
+            path='valuation_indicators.price_divided_by_total_assets',
             title=self.__string_processing(
                 valuation_indicators['price_divided_by_total_assets'][0]),
             tooltip=self.__string_processing(
@@ -586,6 +553,7 @@ class TransformRawInformation:
                 valuation_indicators['price_divided_by_total_assets'][2]))
 
         price_divided_by_net_current_assets = InformationItem(
+            path='valuation_indicators.price_divided_by_net_current_assets',
             title=self.__string_processing(
                 valuation_indicators['price_divided_by_net_current_assets']
                 [0]),
@@ -597,6 +565,7 @@ class TransformRawInformation:
                 [2]))
 
         dividend_yield = InformationItem(
+            path='valuation_indicators.dividend_yield',
             title=self.__string_processing(
                 valuation_indicators['dividend_yield'][0]),
             tooltip=self.__string_processing(
@@ -605,6 +574,7 @@ class TransformRawInformation:
                 valuation_indicators['dividend_yield'][2]))
 
         enterprise_value_by_ebitda = InformationItem(
+            path='valuation_indicators.enterprise_value_by_ebitda',
             title=self.__string_processing(
                 valuation_indicators['enterprise_value_by_ebitda'][0]),
             tooltip=self.__string_processing(
@@ -613,6 +583,7 @@ class TransformRawInformation:
                 valuation_indicators['enterprise_value_by_ebitda'][2]))
 
         enterprise_value_by_ebit = InformationItem(
+            path='valuation_indicators.enterprise_value_by_ebit',
             title=self.__string_processing(
                 valuation_indicators['enterprise_value_by_ebit'][0]),
             tooltip=self.__string_processing(
@@ -621,6 +592,7 @@ class TransformRawInformation:
                 valuation_indicators['enterprise_value_by_ebit'][2]))
 
         price_by_working_capital = InformationItem(
+            path='valuation_indicators.price_by_working_capital',
             title=self.__string_processing(
                 valuation_indicators['price_by_working_capital'][0]),
             tooltip=self.__string_processing(
@@ -660,6 +632,7 @@ class TransformRawInformation:
         """
 
         return_on_equity = InformationItem(
+            path='profitability_indicators.return_on_equity',
             title=self.__string_processing(
                 profitability_indicators['return_on_equity'][0]),
             tooltip=self.__string_processing(
@@ -668,6 +641,7 @@ class TransformRawInformation:
                 profitability_indicators['return_on_equity'][2]))
 
         return_on_invested_capital = InformationItem(
+            path='profitability_indicators.return_on_invested_capital',
             title=self.__string_processing(
                 profitability_indicators['return_on_invested_capital'][0]),
             tooltip=self.__string_processing(
@@ -676,6 +650,7 @@ class TransformRawInformation:
                 profitability_indicators['return_on_invested_capital'][2]))
 
         ebit_divided_by_total_assets = InformationItem(
+            path='profitability_indicators.ebit_divided_by_total_assets',
             title=self.__string_processing(
                 profitability_indicators['ebit_divided_by_total_assets'][0]),
             tooltip=self.__string_processing(
@@ -684,6 +659,7 @@ class TransformRawInformation:
                 profitability_indicators['ebit_divided_by_total_assets'][2]))
 
         net_revenue_growth_last_5_years = InformationItem(
+            path='profitability_indicators.net_revenue_growth_last_5_years',
             title=self.__string_processing(
                 profitability_indicators['net_revenue_growth_last_5_years']
                 [0]),
@@ -695,6 +671,7 @@ class TransformRawInformation:
                 [2]))
 
         net_revenue_divided_by_total_assets = InformationItem(
+            path='profitability_indicators.net_revenue_divided_by_total_assets',
             title=self.__string_processing(
                 profitability_indicators['net_revenue_divided_by_total_assets']
                 [0]),
@@ -706,6 +683,7 @@ class TransformRawInformation:
                 [2]))
 
         gross_profit_divided_by_net_revenue = InformationItem(
+            path='profitability_indicators.gross_profit_divided_by_net_revenue',
             title=self.__string_processing(
                 profitability_indicators['gross_profit_divided_by_net_revenue']
                 [0]),
@@ -717,6 +695,7 @@ class TransformRawInformation:
                 [2]))
 
         ebit_divided_by_net_revenue = InformationItem(
+            path='profitability_indicators.ebit_divided_by_net_revenue',
             title=self.__string_processing(
                 profitability_indicators['ebit_divided_by_net_revenue'][0]),
             tooltip=self.__string_processing(
@@ -725,6 +704,7 @@ class TransformRawInformation:
                 profitability_indicators['ebit_divided_by_net_revenue'][2]))
 
         net_income_divided_by_net_revenue = InformationItem(
+            path='profitability_indicators.net_income_divided_by_net_revenue',
             title=self.__string_processing(
                 profitability_indicators['net_income_divided_by_net_revenue']
                 [0]),
@@ -767,6 +747,7 @@ class TransformRawInformation:
         """
 
         current_liquidity = InformationItem(
+            path='indebtedness_indicators.current_liquidity',
             title=self.__string_processing(
                 indebtedness_indicators['current_liquidity'][0]),
             tooltip=self.__string_processing(
@@ -775,6 +756,7 @@ class TransformRawInformation:
                 indebtedness_indicators['current_liquidity'][2]))
 
         gross_debt_by_equity = InformationItem(
+            path='indebtedness_indicators.gross_debt_by_equity',
             title=self.__string_processing(
                 indebtedness_indicators['gross_debt_by_equity'][0]),
             tooltip=self.__string_processing(
@@ -783,6 +765,7 @@ class TransformRawInformation:
                 indebtedness_indicators['gross_debt_by_equity'][2]))
 
         net_debt_by_equity = InformationItem(
+            path='indebtedness_indicators.net_debt_by_equity',
             title=self.__string_processing(
                 indebtedness_indicators['net_debt_by_equity'][0]),
             tooltip=self.__string_processing(
@@ -791,6 +774,7 @@ class TransformRawInformation:
                 indebtedness_indicators['net_debt_by_equity'][2]))
 
         net_debt_by_ebitda = InformationItem(
+            path='indebtedness_indicators.net_debt_by_ebitda',
             title=self.__string_processing(
                 indebtedness_indicators['net_debt_by_ebitda'][0]),
             tooltip=self.__string_processing(
@@ -799,6 +783,7 @@ class TransformRawInformation:
                 indebtedness_indicators['net_debt_by_ebitda'][2]))
 
         equity_by_total_assets = InformationItem(
+            path='indebtedness_indicators.equity_by_total_assets',
             title=self.__string_processing(
                 indebtedness_indicators['equity_by_total_assets'][0]),
             tooltip=self.__string_processing(
@@ -833,20 +818,24 @@ class TransformRawInformation:
 
         if len(balance_sheet) == 4:
             total_assets = InformationItem(
+                path='balance_sheet.total_assets',
                 title=self.__string_processing(balance_sheet['total_assets'][0]),
                 tooltip=self.__string_processing(balance_sheet['total_assets'][1]),
                 value=self.__number_processing(balance_sheet['total_assets'][2]))
 
             credit_portfolio = InformationItem(
+                path='balance_sheet.credit_portfolio',
                 title=self.__string_processing(balance_sheet['credit_portfolio'][0]),
                 tooltip=self.__string_processing(balance_sheet['credit_portfolio'][1]),
                 value=self.__number_processing(balance_sheet['credit_portfolio'][2]))
 
             deposits = InformationItem(
+                path='balance_sheet.deposits',
                 title=self.__string_processing(balance_sheet['deposits'][0]),
                 tooltip=self.__string_processing(balance_sheet['deposits'][1]),
                 value=self.__number_processing(balance_sheet['deposits'][2]))
             equity = InformationItem(
+                path='balance_sheet.equity',
                 title=self.__string_processing(balance_sheet['equity'][0]),
                 tooltip=self.__string_processing(balance_sheet['equity'][1]),
                 value=self.__number_processing(balance_sheet['equity'][2]))
@@ -859,31 +848,37 @@ class TransformRawInformation:
             }
 
         total_assets = InformationItem(
+            path='balance_sheet.total_assets',
             title=self.__string_processing(balance_sheet['total_assets'][0]),
             tooltip=self.__string_processing(balance_sheet['total_assets'][1]),
             value=self.__number_processing(balance_sheet['total_assets'][2]))
 
         current_assets = InformationItem(
+            path='balance_sheet.current_assets',
             title=self.__string_processing(balance_sheet['current_assets'][0]),
             tooltip=self.__string_processing(balance_sheet['current_assets'][1]),
             value=self.__number_processing(balance_sheet['current_assets'][2]))
 
         cash = InformationItem(
+            path='balance_sheet.cash',
             title=self.__string_processing(balance_sheet['cash'][0]),
             tooltip=self.__string_processing(balance_sheet['cash'][1]),
             value=self.__number_processing(balance_sheet['cash'][2]))
 
         gross_debt = InformationItem(
+            path='balance_sheet.gross_debt',
             title=self.__string_processing(balance_sheet['gross_debt'][0]),
             tooltip=self.__string_processing(balance_sheet['gross_debt'][1]),
             value=self.__number_processing(balance_sheet['gross_debt'][2]))
 
         net_debt = InformationItem(
+            path='balance_sheet.net_debt',
             title=self.__string_processing(balance_sheet['net_debt'][0]),
             tooltip=self.__string_processing(balance_sheet['net_debt'][1]),
             value=self.__number_processing(balance_sheet['net_debt'][2]))
 
         equity = InformationItem(
+            path='balance_sheet.equity',
             title=self.__string_processing(balance_sheet['equity'][0]),
             tooltip=self.__string_processing(balance_sheet['equity'][1]),
             value=self.__number_processing(balance_sheet['equity'][2]))
@@ -915,6 +910,7 @@ class TransformRawInformation:
         """
 
         twelve_months_revenue = InformationItem(
+            path='income_statement.twelve_months.revenue',
             title=self.__string_processing(
                 income_statement['twelve_months']['revenue'][0]),
             tooltip=self.__string_processing(
@@ -923,6 +919,7 @@ class TransformRawInformation:
                 income_statement['twelve_months']['revenue'][2]))
 
         twelve_months_ebit = InformationItem(
+            path='income_statement.twelve_months.ebit',
             title=self.__string_processing(
                 income_statement['twelve_months']['ebit'][0]),
             tooltip=self.__string_processing(
@@ -931,6 +928,7 @@ class TransformRawInformation:
                 income_statement['twelve_months']['ebit'][2]))
 
         twelve_months_net_income = InformationItem(
+            path='income_statement.twelve_months.net_income',
             title=self.__string_processing(
                 income_statement['twelve_months']['net_income'][0]),
             tooltip=self.__string_processing(
@@ -939,6 +937,7 @@ class TransformRawInformation:
                 income_statement['twelve_months']['net_income'][2]))
 
         three_months_net_revenue = InformationItem(
+            path='income_statement.three_months.revenue',
             title=self.__string_processing(
                 income_statement['three_months']['revenue'][0]),
             tooltip=self.__string_processing(
@@ -947,6 +946,7 @@ class TransformRawInformation:
                 income_statement['three_months']['revenue'][2]))
 
         three_months_net_ebit = InformationItem(
+            path='income_statement.three_months.ebit',
             title=self.__string_processing(
                 income_statement['three_months']['ebit'][0]),
             tooltip=self.__string_processing(
@@ -955,6 +955,7 @@ class TransformRawInformation:
                 income_statement['three_months']['ebit'][2]))
 
         three_months_net_net_income = InformationItem(
+            path='income_statement.three_months.net_income',
             title=self.__string_processing(
                 income_statement['three_months']['net_income'][0]),
             tooltip=self.__string_processing(
@@ -975,7 +976,7 @@ class TransformRawInformation:
             }
         }
 
-    def __make_transformation(self, raw_information: Dict) -> Dict:
+    def __make_transformation(self, raw_information: Dict, sections: Iterable[str]) -> Dict:
         """
         Perform the comprehensive transformation of raw financial information.
 
@@ -995,6 +996,7 @@ class TransformRawInformation:
             raw_information (Dict): A dictionary containing all the raw financial
             data for a stock, organized by data categories (e.g., price information,
             detailed information, etc.).
+            sections (Iterable[str]): The transformed sections, the others are skipped.
 
         Returns:
             Dict: A dictionary containing all the transformed financial information,
@@ -1014,64 +1016,37 @@ class TransformRawInformation:
                     "detailed_information": {"stock_type": ["Stock Type", "", "Common"]},
                     ...
                 }
-            >>> transformed_info = __make_transformation(raw_info)
+            >>> transformed_info = __make_transformation(raw_info, SECTIONS)
             >>> print(transformed_info.keys())
             dict_keys(['price_information', 'detailed_information', 'oscillations', ...])
         """
 
-        # Processing stock identification information.
-        stock_identification = self.__transformation_of_stock_identification(
-            raw_information['identification'])
-
-        # Processing stock Financial Summary.
-        financial_summary = self.__transformation_of_financial_summary(
-            raw_information['financial_summary'])
-
-        # Processing stock price information.
-        price_information = self.__transformation_of_price_information(
-            raw_information['price'])
-
-        # Processing detailed stock information.
-        detailed_information = self.__transformation_of_detailed_information(
-            raw_information['detailed_information'])
-
-        # Processing stock price oscillation information.
-        oscillations = self.__transformation_of_oscillations(
-            raw_information['oscillations'])
-
-        # Processing stock valuation indicators.
-        valuation_indicators = self.__transformation_of_valuation_indicators(
-            raw_information['valuation_indicators'])
-
-        # Processing stock profitability indicators.
-        profitability_indicators = self.__transformation_of_profitability_indicators(
-            raw_information['profitability_indicators'])
-
-        # Processing stock indebtedness indicators.
-        indebtedness_indicators = self.__transformation_of_indebtedness_indicators(
-            raw_information['indebtedness_indicators'])
-
-        # Processing stock balance sheet indicators.
-        balance_sheet = self.__transformation_of_balance_sheet(
-            raw_information['balance_sheet'])
-
-        # Processing stock income statement information.
-        income_statement = self.__transformation_of_income_statement(
-            raw_information['income_statement'])
-
-        return {
-            'stock_identification': stock_identification,
-            'financial_summary': financial_summary,
-            'price_information': price_information,
-            'detailed_information': detailed_information,
-            'oscillations': oscillations,
-            'valuation_indicators': valuation_indicators,
-            'profitability_indicators': profitability_indicators,
-            'indebtedness_indicators': indebtedness_indicators,
-            'balance_sheet': balance_sheet,
-            'income_statement': income_statement
+        # Each transformed section, with the raw section it is built from.
+        transformations = {
+            'stock_identification': (self.__transformation_of_stock_identification,
+                                     'identification'),
+            'financial_summary': (self.__transformation_of_financial_summary,
+                                  'financial_summary'),
+            'price_information': (self.__transformation_of_price_information, 'price'),
+            'detailed_information': (self.__transformation_of_detailed_information,
+                                     'detailed_information'),
+            'oscillations': (self.__transformation_of_oscillations, 'oscillations'),
+            'valuation_indicators': (self.__transformation_of_valuation_indicators,
+                                     'valuation_indicators'),
+            'profitability_indicators': (self.__transformation_of_profitability_indicators,
+                                         'profitability_indicators'),
+            'indebtedness_indicators': (self.__transformation_of_indebtedness_indicators,
+                                        'indebtedness_indicators'),
+            'balance_sheet': (self.__transformation_of_balance_sheet, 'balance_sheet'),
+            'income_statement': (self.__transformation_of_income_statement,
+                                 'income_statement')
         }
 
+        # The sections are transformed in page order, whatever order they were asked in.
+        return {section: transformation(raw_information[raw_section])
+                for section, (transformation, raw_section) in transformations.items()
+                if section in sections}
+
     def __make_transformation_companies(self, raw_information: str) -> List[Dict[str, str]]:
         """
         Transforms raw company information into a structured list of dictionaries.
@@ -1137,7 +1112,9 @@ class TransformRawInformation:
         return transformed
 
     def transform_all_information(
-            self, extract_contract: ExtractContract) -> TransformContract:
+            self,
+            extract_contract: ExtractContract,
+            sections: Optional[Iterable[str]] = None) -> TransformContract:
         """
         Transforms all extracted information from an ExtractContract into a structured TransformContract.
 
@@ -1146,18 +1123,24 @@ class TransformRawInformation:
 
         Args:
             extract_contract (ExtractContract): The contract containing all raw extracted information.
+            sections (Iterable[str]): The sections to transform, like PRICE_SECTIONS; None
+                                      transforms every section. The raw information only
+                                      needs the requested sections.
 
         Returns:
             TransformContract: A contract containing all transformed information, structured for easy
                                access and analysis.
 
         Raises:
+            ValueError: If a section is unknown.
             TransformException: If an error occurs during the transformation process.
         """
 
+        sections = validate_sections(sections)
+
         try:
             transform_information = self.__make_transformation(
-                extract_contract.raw_information)
+                extract_contract.raw_information, sections)
 
             transform_contract = TransformContract(
                 transformed_information=transform_information)
@@ -1222,3 +1205,40 @@ class TransformRawInformation:
             return transform_contract
         except Exception as exception:
             raise TransformException(exception) from exception
+
+    def transform_listings(
+            self, extract_contract: ExtractContract) -> TransformContract:
+        """
+        Transforms extracted companies and property funds from an ExtractContract into a
+        TransformContract.
+
+        Both lists come from a single parse of the listing page, and are transformed exactly as
+        `transform_companies` and `transform_property_funds` do.
+
+        Args:
+            extract_contract (ExtractContract): The contract containing the raw lists of companies
+                                                and property funds.
+
+        Returns:
+            TransformContract: A contract whose information holds the 'companies' and
+                               'property_funds' lists.
+
+        Raises:
+            TransformException: If an error occurs during the transformation of the lists.
+        """
+
+        try:
+            raw_information = extract_contract.raw_information
+            transform_information = {
+                'companies': self.__make_transformation_companies(
+                    raw_information['companies']),
+                'property_funds': self.__make_transformation_property_funds(
+                    raw_information['property_funds'])
+            }
+
+            transform_contract = TransformContract(
+                transformed_information=transform_information)
+
+            return transform_contract
+        except Exception as exception:
+            raise TransformException(exception) from exception
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: transform_raw_information_test.py
-#  Version: 0.0.11
+#  Version: 0.0.14
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -17,6 +17,8 @@
 # ------------------------------------------------------------------------------
 """Test of transform raw information from the HTTP requester."""
 
+import pytest
+
 from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
 from fundamentus.contracts.mocks.extract_contract_companies import \
     EXTRACT_CONTRACT_COMPANIES_MOCK
@@ -143,6 +145,18 @@ class TestTransformRawInformation:
         assert isinstance(information['variation_2018'], InformationItem)
         assert isinstance(information['variation_2017'], InformationItem)
 
+    def test_information_keys_follow_the_key_path(self) -> None:
+        """Test that each item is keyed by its path in the transformed information."""
+
+        information = self.transformed.transformed_information
+
+        assert information['oscillations']['variation_day'].path == \
+            'oscillations.variation_day'
+        assert information['income_statement']['twelve_months']['revenue'].path == \
+            'income_statement.twelve_months.revenue'
+        assert information['detailed_information']['variation_52_weeks']['lowest_value'] \
+            .key.startswith('detailed_information.variation_52_weeks.lowest_value#')
+
     def test_transform_valuation_indicators(self) -> None:
         """Test of transform valuation indicators from the HTTP requester."""
 
@@ -304,3 +318,42 @@ def test_transform_raw_information_of_property_funds_exception() -> None:
         transformed = transform.transform_property_funds([])  # pylint: disable=unused-variable
     except TransformException as exception:
         assert isinstance(exception, TransformException)
+
+
+def test_transform_raw_information_float_mode() -> None:
+    """Test that the float numeric mode transforms the same numbers as floats."""
+
+    exact = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    fast = TransformRawInformation('float').transform_all_information(EXTRACT_CONTRACT_MOCK)
+
+    exact_summary = exact.transformed_information['financial_summary']
+    fast_summary = fast.transformed_information['financial_summary']
+
+    assert isinstance(fast_summary['market_valuation'].value, float)
+    assert fast_summary['market_valuation'].value == float(
+        exact_summary['market_valuation'].value)
+
+    exact_yield = exact.transformed_information['valuation_indicators']['dividend_yield']
+    fast_yield = fast.transformed_information['valuation_indicators']['dividend_yield']
+
+    assert fast_yield.value == pytest.approx(float(exact_yield.value))
+
+
+def test_transform_raw_information_invalid_numeric_mode() -> None:
+    """Test that an unknown numeric mode is refused."""
+
+    with pytest.raises(ValueError):
+        TransformRawInformation('int')
+
+
+def test_transform_raw_information_sections() -> None:
+    """Test that only the requested sections are transformed, in page order."""
+
+    transformed = TransformRawInformation().transform_all_information(
+        EXTRACT_CONTRACT_MOCK, ['valuation_indicators', 'price_information'])
+
+    assert list(transformed.transformed_information) == ['price_information',
+                                                         'valuation_indicators']
+
+    with pytest.raises(ValueError):
+        TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK, ['prices'])
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: config.py
-#  Version: 0.0.1
+#  Version: 0.0.7
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -20,3 +20,63 @@
 
 URL = 'https://www.fundamentus.com.br/detalhes.php'
 INTERFACE = 'mobile'
+
+# HTTP connection pool shared by every pipeline.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+MAX_RETRIES = 3
+
+# HTTP response cache, expired after 12 hours (43200 seconds).
+CACHE_BACKEND = 'sqlite'
+CACHE_NAME = 'fundamentus_cache'
+CACHE_EXPIRE_AFTER = 43200
+
+# Maximum number of requests in flight in the batch pipelines.
+MAX_CONCURRENCY = 10
+
+# Worker processes parsing the pages in the batch pipelines, None uses every CPU.
+MAX_WORKERS = None
+
+# Client-side rate limit, in requests per second, None disables it.
+RATE_LIMIT = None
+RATE_LIMIT_BURST = 5
+
+# Exponential backoff, with jitter, on throttled responses.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+BACKOFF_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+BACKOFF_MAX = 30
+
+# Transformed pages kept by content hash, in memory and optionally on disk.
+PARSE_CACHE_SIZE = 1024
+PARSE_CACHE_DIRECTORY = None
+
+# HTML parser backend: html.parser, lxml or selectolax.
+PARSER = 'html.parser'
+
+# Type of the transformed numbers: decimal (exact) or float (fast).
+NUMERIC_MODE = 'decimal'
+
+# Sections of the stock page, in page order. The price sections change with
+# every trade; the fundamental ones only when a new statement is published.
+PRICE_SECTIONS = ('stock_identification', 'financial_summary', 'price_information',
+                  'detailed_information', 'oscillations', 'valuation_indicators')
+FUNDAMENTAL_SECTIONS = ('profitability_indicators', 'indebtedness_indicators',
+                        'balance_sheet', 'income_statement')
+SECTIONS = PRICE_SECTIONS + FUNDAMENTAL_SECTIONS
+
+# Statement dates and fundamental sections kept by the incremental refresh;
+# None keeps them in memory.
+INCREMENTAL_STATE_PATH = None
+
+# SQLite database keeping a dated snapshot of every pipeline run.
+SNAPSHOT_STORE_PATH = 'fundamentus_snapshots.sqlite3'
+
+# Append-only journal of the tickers completed by a batch run, for resuming it.
+CHECKPOINT_JOURNAL_PATH = 'fundamentus_checkpoint.jsonl'
+
+# Upper bounds, in seconds, of the latency histogram buckets of each pipeline stage.
+METRICS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Print the stage metrics summary to stderr at the end of every batch; False only logs it.
+METRICS_SUMMARY = True
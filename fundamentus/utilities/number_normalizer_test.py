@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: number_normalizer_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Number Normalizer Test."""
+
+from decimal import Decimal
+
+import pytest
+
+from .number_normalizer import to_decimal, to_float
+
+
+@pytest.mark.parametrize('number, expected', [
+    ('R$ 1.234,56', Decimal('1234.56')),
+    ('R$ 34.501.000.000', Decimal('34501000000')),
+    ('\n-0,01\n', Decimal('-0.01')),
+    ('12,3%', Decimal('0.123')),
+    ('-12,3 %', Decimal('-0.123')),
+    ('-', Decimal(0)),
+    (' - %', Decimal(0)),
+])
+def test_to_decimal(number: str, expected: Decimal) -> None:
+    """Test the conversion of Brazilian formatted numbers to Decimal."""
+
+    assert to_decimal(number) == expected
+
+
+def test_to_float() -> None:
+    """Test the float fast path agrees with the Decimal path."""
+
+    for number in ('R$ 1.234,56', '12,3%', '-', '\n-0,01\n'):
+        assert to_float(number) == pytest.approx(float(to_decimal(number)))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: numpy_export.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Exports the numeric information of many stocks into a NumPy array.
+
+Each indicator is named by its path in the transformed information, like
+"valuation_indicators.dividend_yield" or "income_statement.twelve_months.ebit".
+"""
+
+from decimal import Decimal
+from typing import (Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple,
+                    Union)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from fundamentus.contracts.information_contract import InformationItem
+from fundamentus.contracts.transform_contract import TransformContract
+
+
+def information_items(transformed_information: Dict) -> Iterator[Tuple[str, InformationItem]]:
+    """Walks the information of a stock, nested sections included.
+
+    :param transformed_information: dict: The transformed information of a stock.
+    :return: Iterator: The indicator path and item of every information, in page order.
+    """
+
+    pending = [('', transformed_information)]
+
+    while pending:
+        prefix, section = pending.pop(0)
+
+        for key, item in section.items():
+            path = f'{prefix}{key}'
+
+            if isinstance(item, dict):
+                pending.append((f'{path}.', item))
+            elif isinstance(item, InformationItem):
+                yield path, item
+
+
+def ticker_contracts(
+        contracts: Union[Mapping[str, Union[TransformContract, Exception]],
+                         Iterable[Union[TransformContract, Exception]]]
+) -> Iterator[Tuple[str, TransformContract]]:
+    """Pairs each transformed stock with its ticker, skipping the failures.
+
+    The ticker is the key of a mapping, as returned by the batch pipeline,
+    so contracts transformed with only some sections are accepted. Contracts
+    given alone must carry their stock identification.
+
+    :param contracts: The contract of each ticker, or the contracts alone.
+    :return: Iterator: The ticker and contract of every transformed stock.
+    :raises ValueError: If a contract given alone has no stock identification.
+    """
+
+    if isinstance(contracts, Mapping):
+        pairs = contracts.items()
+    else:
+        pairs = ((None, contract) for contract in contracts)
+
+    for ticker, contract in pairs:
+        if not isinstance(contract, TransformContract):
+            continue
+
+        if ticker is None:
+            identification = contract.transformed_information.get('stock_identification')
+
+            if not identification or 'name' not in identification:
+                raise ValueError('A contract without the stock_identification section '
+                                 'has no ticker; pass a mapping of ticker to contract.')
+
+            ticker = identification['name'].value
+
+        yield ticker, contract
+
+
+def numeric_indicators(transformed_information: Dict) -> Dict[str, Union[Decimal, float]]:
+    """Flattens the numeric information of a stock.
+
+    :param transformed_information: dict: The transformed information of a stock.
+    :return: dict: The numeric values, by indicator path, in page order.
+    """
+
+    return {path: item.value
+            for path, item in information_items(transformed_information)
+            if isinstance(item.value, (Decimal, float))}
+
+
+def to_numpy(contracts: Iterable[TransformContract],
+             indicators: Sequence[str]) -> 'np.ndarray':
+    """Exports the indicators of many stocks into a two-dimensional array.
+
+    Transforming in the float numeric mode avoids converting every Decimal.
+
+    :param contracts: Iterable[TransformContract]: The transformed stocks, one per row.
+    :param indicators: Sequence[str]: The indicator paths, one per column.
+    :return: np.ndarray: A float64 array, with NaN where an indicator is missing.
+    :raises ImportError: If NumPy is not installed.
+    """
+
+    if np is None:
+        raise ImportError('The NumPy export requires numpy: '
+                          'pip install pyfundamentus[numpy]')
+
+    rows: List[List[float]] = []
+
+    for contract in contracts:
+        values = numeric_indicators(contract.transformed_information)
+        rows.append([float(values.get(indicator, 'nan')) for indicator in indicators])
+
+    return np.array(rows, dtype=np.float64).reshape(len(rows), len(indicators))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: numpy_export_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""NumPy Export Test."""
+
+import math
+
+import pytest
+
+from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+
+from .numpy_export import numeric_indicators, to_numpy
+
+
+def test_numeric_indicators() -> None:
+    """Test the flattening of the numeric information of a stock."""
+
+    transformed = TransformRawInformation('float').transform_all_information(
+        EXTRACT_CONTRACT_MOCK)
+    indicators = numeric_indicators(transformed.transformed_information)
+
+    assert 'valuation_indicators.dividend_yield' in indicators
+    assert 'income_statement.twelve_months.ebit' in indicators
+    assert 'stock_identification.symbol' not in indicators
+    assert all(isinstance(value, float) for value in indicators.values())
+
+
+def test_to_numpy() -> None:
+    """Test the export of many stocks into a NumPy array."""
+
+    np = pytest.importorskip('numpy')
+
+    exact = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    fast = TransformRawInformation('float').transform_all_information(EXTRACT_CONTRACT_MOCK)
+    indicators = ['valuation_indicators.dividend_yield', 'unknown.indicator']
+
+    array = to_numpy([exact, fast], indicators)
+
+    assert array.shape == (2, 2)
+    assert array.dtype == np.float64
+    assert array[0, 0] == pytest.approx(array[1, 0])
+    assert math.isnan(array[0, 1])
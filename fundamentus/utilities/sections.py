@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: sections.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Validates the sections requested from a stock page and trims the page to them."""
+
+from typing import FrozenSet, Iterable, Optional
+
+from fundamentus.utilities.config import SECTIONS
+
+# Frame, counted from the top of the stock page, holding each section.
+SECTION_FRAMES = {
+    'stock_identification': 0,
+    'financial_summary': 0,
+    'price_information': 0,
+    'detailed_information': 1,
+    'oscillations': 2,
+    'valuation_indicators': 4,
+    'profitability_indicators': 5,
+    'indebtedness_indicators': 6,
+    'balance_sheet': 7,
+    'income_statement': 8
+}
+FRAME_TAG = '<div class="frame">'
+
+
+def validate_sections(sections: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Validate the sections requested from a stock page.
+
+    :param sections: Iterable[str]: The requested sections, None requests every section.
+    :return: frozenset: The requested sections.
+    :raises ValueError: If a section is unknown.
+    """
+
+    if sections is None:
+        return frozenset(SECTIONS)
+
+    sections = frozenset(sections)
+    unknown = sections.difference(SECTIONS)
+
+    if unknown:
+        raise ValueError(f'Invalid sections: {", ".join(sorted(unknown))}. '
+                         f'Choose from: {", ".join(SECTIONS)}.')
+
+    return sections
+
+
+def truncate_page(html: str, sections: Iterable[str]) -> str:
+    """Cut the stock page after the frame of the last requested section.
+
+    The sections are laid out in page order, so the frames after the last
+    requested one need not be parsed at all. When the page does not have the
+    expected frames, it is returned whole.
+
+    :param html: str: HTML content of the stock page.
+    :param sections: Iterable[str]: The requested sections.
+    :return: str: The beginning of the page holding every requested section.
+    """
+
+    last_frame = max((SECTION_FRAMES[section] for section in sections), default=0)
+    position = -1
+
+    for _ in range(last_frame + 2):
+        position = html.find(FRAME_TAG, position + 1)
+
+        if position < 0:
+            return html
+
+    return html[:position]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: sections_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Sections Test."""
+
+import pytest
+
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+
+from .config import PRICE_SECTIONS, SECTIONS
+from .sections import truncate_page, validate_sections
+
+
+def test_validate_sections() -> None:
+    """Test the requested sections are validated."""
+
+    assert validate_sections(None) == frozenset(SECTIONS)
+    assert validate_sections(PRICE_SECTIONS) == frozenset(PRICE_SECTIONS)
+
+    with pytest.raises(ValueError):
+        validate_sections(['balance_sheet', 'cash_flow'])
+
+
+def test_truncate_page() -> None:
+    """Test the page is cut only after the frame of the last requested section."""
+
+    html = HTML_COLLECTOR_MOCK['content']
+
+    assert len(truncate_page(html, PRICE_SECTIONS)) < len(html) // 2
+    assert truncate_page(html, SECTIONS) == html
+    assert truncate_page('<html>not a stock</html>', PRICE_SECTIONS) == \
+        '<html>not a stock</html>'
@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: stage_metrics.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Stage Metrics.
+
+This module records where the time of the pipeline goes: a latency histogram
+per stage, like "http", "parse", "transform" or "export", counters of events
+like HTTP and parse cache hits and misses, and the seconds each ticker spent
+in each stage. The records can be exported as JSON or in the Prometheus text
+format, and a summary is printed to stderr at the end of every batch, or only
+logged at the INFO level when METRICS_SUMMARY is False.
+"""
+
+import json
+import logging
+import sys
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from fundamentus.utilities.config import METRICS_BUCKETS, METRICS_SUMMARY
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Represents the latencies observed in a stage, counted in fixed buckets."""
+
+    __slots__ = ('buckets', 'counts', 'count', 'total', 'maximum')
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initialize the class.
+
+        :param buckets: Sequence[float]: Upper bounds of the buckets, in seconds, ascending.
+        """
+
+        self.buckets = tuple(buckets)
+        # One count per bucket, and a last one for the latencies above every bound.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count a latency.
+
+        :param seconds: float: The latency, in seconds.
+        """
+
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def quantile(self, quantile: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket holding it.
+
+        :param quantile: float: The quantile, between 0 and 1.
+        :return: float: The estimated latency, in seconds, capped by the maximum.
+        """
+
+        rank = quantile * self.count
+        cumulative = 0
+
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+
+            if count and cumulative >= rank:
+                return min(bound, self.maximum)
+
+        return self.maximum
+
+    def to_dict(self) -> Dict:
+        """Return the histogram, with cumulative bucket counts keyed by upper bound."""
+
+        cumulative = 0
+        buckets = {}
+
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        buckets['+Inf'] = self.count
+
+        return {'count': self.count,
+                'sum': self.total,
+                'max': self.maximum,
+                'buckets': buckets}
+
+
+class StageMetrics:
+    """Represents the time spent in each stage of the pipelines.
+
+    A single instance can be shared by threads and asynchronous tasks.
+    The histograms and the counters add up over every batch, while the
+    seconds of each ticker are kept for the current batch only, so a
+    long-lived instance does not grow with every ticker ever timed.
+    """
+
+    def __init__(self,
+                 buckets: Sequence[float] = METRICS_BUCKETS,
+                 print_summary: bool = METRICS_SUMMARY) -> None:
+        """Initialize the class.
+
+        :param buckets: Sequence[float]: Upper bounds, in seconds, of the histogram buckets.
+        :param print_summary: bool: Whether the summary of each batch is printed to
+                              stderr; otherwise it is only logged at the INFO level.
+        :raises ValueError: If the bounds are not ascending.
+        """
+
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError('The histogram buckets must be ascending.')
+
+        self.__buckets = tuple(buckets)
+        self.__print_summary = print_summary
+        self.__lock = Lock()
+        self.__histograms: Dict[str, LatencyHistogram] = {}
+        self.__counters: Dict[str, int] = {}
+        self.__tickers: Dict[str, Dict[str, float]] = {}
+
+    def observe(self, stage: str, seconds: float, ticker: Optional[str] = None) -> None:
+        """Record the time spent in a stage.
+
+        :param stage: str: The stage, like "http" or "parse".
+        :param seconds: float: The time spent, in seconds.
+        :param ticker: str: The ticker the time was spent on, if any.
+        """
+
+        with self.__lock:
+            histogram = self.__histograms.get(stage)
+
+            if histogram is None:
+                histogram = self.__histograms[stage] = LatencyHistogram(self.__buckets)
+
+            histogram.observe(seconds)
+
+            if ticker is not None:
+                stages = self.__tickers.setdefault(ticker, {})
+                stages[stage] = stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def time(self, stage: str, ticker: Optional[str] = None) -> Iterator[None]:
+        """Record the time spent in the body of the with statement.
+
+        The time is recorded even when the body raises.
+
+        :param stage: str: The stage, like "http" or "parse".
+        :param ticker: str: The ticker the time is spent on, if any.
+        """
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, ticker)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Count an event.
+
+        :param counter: str: The event, like "http_cache_hit" or "failures".
+        :param amount: int: The number of events.
+        """
+
+        with self.__lock:
+            self.__counters[counter] = self.__counters.get(counter, 0) + amount
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Record a batch run, and report the summary when it ends.
+
+        The whole run is recorded in the "batch" stage. The seconds of the
+        tickers timed by earlier batches are forgotten when it starts.
+        """
+
+        with self.__lock:
+            self.__tickers.clear()
+
+        try:
+            with self.time('batch'):
+                yield
+        finally:
+            self.increment('batches')
+            summary = self.summary()
+
+            if self.__print_summary:
+                print(f'Pipeline stage metrics:\n{summary}', file=sys.stderr)
+            else:
+                LOGGER.info('Pipeline stage metrics:\n%s', summary)
+
+    def counters(self) -> Dict[str, int]:
+        """Return the number of each event counted."""
+
+        with self.__lock:
+            return dict(self.__counters)
+
+    def ticker(self, ticker: str) -> Dict[str, float]:
+        """Return the seconds a ticker spent in each stage.
+
+        :param ticker: str: The ticker symbol.
+        :return: dict: The seconds spent in each stage, empty when it was never timed.
+        """
+
+        with self.__lock:
+            return dict(self.__tickers.get(ticker, {}))
+
+    def to_dict(self) -> Dict:
+        """Return every record: the histogram of each stage, the counters and the tickers."""
+
+        with self.__lock:
+            return {'stages': {stage: histogram.to_dict()
+                               for stage, histogram in self.__histograms.items()},
+                    'counters': dict(self.__counters),
+                    'tickers': {ticker: dict(stages)
+                                for ticker, stages in self.__tickers.items()}}
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Return every record as JSON.
+
+        :param indent: int: The indentation, None writes a single line.
+        :return: str: The records of to_dict as JSON.
+        """
+
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = 'fundamentus') -> str:
+        """Return the histograms and the counters in the Prometheus text format.
+
+        The tickers are left out, so the number of series does not grow
+        with the universe.
+
+        :param prefix: str: The prefix of the metric names.
+        :return: str: The text exposition of the metrics.
+        """
+
+        records = self.to_dict()
+        lines: List[str] = [
+            f'# HELP {prefix}_stage_seconds Time spent in each stage of the pipeline.',
+            f'# TYPE {prefix}_stage_seconds histogram'
+        ]
+
+        for stage, histogram in records['stages'].items():
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{prefix}_stage_seconds_bucket'
+                             f'{{stage="{stage}",le="{bound}"}} {count}')
+
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {histogram["sum"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {histogram["count"]}')
+
+        lines.append(f'# HELP {prefix}_events_total Events counted by the pipeline.')
+        lines.append(f'# TYPE {prefix}_events_total counter')
+
+        for counter, count in records['counters'].items():
+            lines.append(f'{prefix}_events_total{{event="{counter}"}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """Return a table of the time spent in each stage, followed by the counters.
+
+        :return: str: One line per stage, with the count, total, mean, p95 and maximum.
+        """
+
+        with self.__lock:
+            lines = [f'{"stage":<12}{"count":>8}{"total s":>11}{"mean ms":>10}'
+                     f'{"p95 ms":>10}{"max ms":>10}']
+
+            for stage, histogram in self.__histograms.items():
+                mean = histogram.total / histogram.count
+                lines.append(f'{stage:<12}{histogram.count:>8}{histogram.total:>11.3f}'
+                             f'{mean * 1000:>10.1f}{histogram.quantile(0.95) * 1000:>10.1f}'
+                             f'{histogram.maximum * 1000:>10.1f}')
+
+            if self.__counters:
+                lines.append(', '.join(f'{counter}: {count}'
+                                       for counter, count in self.__counters.items()))
+
+        return '\n'.join(lines)
+
+    def clear(self) -> None:
+        """Forget every record."""
+
+        with self.__lock:
+            self.__histograms.clear()
+            self.__counters.clear()
+            self.__tickers.clear()
+
+
+__SHARED_STAGE_METRICS = StageMetrics()
+
+
+def get_shared_stage_metrics() -> StageMetrics:
+    """Return the process-wide stage metrics.
+
+    :return: StageMetrics: The shared metrics.
+    """
+
+    return __SHARED_STAGE_METRICS
+
+
+def configure_shared_stage_metrics(buckets: Sequence[float] = METRICS_BUCKETS,
+                                   print_summary: bool = METRICS_SUMMARY) -> StageMetrics:
+    """Replace the process-wide stage metrics with new, empty, ones.
+
+    :param buckets: Sequence[float]: Upper bounds, in seconds, of the histogram buckets.
+    :param print_summary: bool: Whether the summary of each batch is printed to stderr.
+    :return: StageMetrics: The new shared metrics.
+    """
+
+    global __SHARED_STAGE_METRICS  # pylint: disable=global-statement
+
+    __SHARED_STAGE_METRICS = StageMetrics(buckets, print_summary)
+
+    return __SHARED_STAGE_METRICS
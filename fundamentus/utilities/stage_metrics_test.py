@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: stage_metrics_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test of the stage metrics."""
+
+import json
+
+import pytest
+
+from .stage_metrics import StageMetrics
+
+
+def test_observe() -> None:
+    """Test the latencies are counted in cumulative buckets and per ticker."""
+
+    metrics = StageMetrics(buckets=(0.01, 0.1, 1))
+
+    for seconds in (0.005, 0.05, 0.05, 2):
+        metrics.observe('http', seconds, 'VALE3')
+
+    stage = metrics.to_dict()['stages']['http']
+
+    assert stage['count'] == 4
+    assert stage['sum'] == pytest.approx(2.105)
+    assert stage['max'] == 2
+    assert stage['buckets'] == {'0.01': 1, '0.1': 3, '1': 3, '+Inf': 4}
+    assert metrics.ticker('VALE3') == {'http': pytest.approx(2.105)}
+    assert not metrics.ticker('WEGE3')
+
+
+def test_time_and_increment() -> None:
+    """Test a timed block is recorded even when it raises."""
+
+    metrics = StageMetrics()
+
+    with pytest.raises(ValueError):
+        with metrics.time('parse', 'VALE3'):
+            raise ValueError
+
+    metrics.increment('cache_hit')
+    metrics.increment('cache_hit', 2)
+
+    assert metrics.to_dict()['stages']['parse']['count'] == 1
+    assert metrics.counters() == {'cache_hit': 3}
+
+    metrics.clear()
+
+    assert metrics.to_dict() == {'stages': {}, 'counters': {}, 'tickers': {}}
+
+
+def test_exports() -> None:
+    """Test the JSON, Prometheus and summary exports."""
+
+    metrics = StageMetrics(buckets=(0.1, 1))
+    metrics.observe('transform', 0.05, 'VALE3')
+    metrics.increment('cache_miss')
+
+    assert json.loads(metrics.to_json()) == metrics.to_dict()
+
+    prometheus = metrics.to_prometheus()
+
+    assert '# TYPE fundamentus_stage_seconds histogram' in prometheus
+    assert 'fundamentus_stage_seconds_bucket{stage="transform",le="0.1"} 1' in prometheus
+    assert 'fundamentus_stage_seconds_bucket{stage="transform",le="+Inf"} 1' in prometheus
+    assert 'fundamentus_stage_seconds_count{stage="transform"} 1' in prometheus
+    assert 'fundamentus_events_total{event="cache_miss"} 1' in prometheus
+    assert 'VALE3' not in prometheus
+
+    summary = metrics.summary().splitlines()
+
+    assert summary[1].split() == ['transform', '1', '0.050', '50.0', '50.0', '50.0']
+    assert summary[2] == 'cache_miss: 1'
+
+
+def test_batch_reports_and_resets_tickers(capsys, caplog) -> None:
+    """Test the summary of a batch is printed, and the tickers kept for one batch only."""
+
+    metrics = StageMetrics()
+
+    with metrics.batch():
+        metrics.observe('http', 0.01, 'VALE3')
+
+    assert 'Pipeline stage metrics' in capsys.readouterr().err
+
+    with metrics.batch():
+        metrics.observe('http', 0.01, 'WEGE3')
+
+    assert set(metrics.to_dict()['tickers']) == {'WEGE3'}
+    assert metrics.to_dict()['stages']['http']['count'] == 2
+    capsys.readouterr()
+
+    quiet = StageMetrics(print_summary=False)
+
+    with caplog.at_level('INFO', logger='fundamentus.utilities.stage_metrics'):
+        with quiet.batch():
+            pass
+
+    assert not capsys.readouterr().err
+    assert 'Pipeline stage metrics' in caplog.text
+
+
+def test_buckets_must_ascend() -> None:
+    """Test unordered buckets are refused."""
+
+    with pytest.raises(ValueError):
+        StageMetrics(buckets=(1, 0.1))
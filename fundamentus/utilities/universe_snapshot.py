@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: universe_snapshot.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Holds the information of many stocks as one columnar table.
+
+Each transformed stock repeats the title and the tooltip of every indicator.
+A snapshot keeps one row per ticker and one column per indicator path, like
+"valuation_indicators.dividend_yield", with the numeric columns in a single
+float64 array and the title and tooltip stored once per column.
+"""
+
+from decimal import Decimal
+from typing import (Dict, Iterable, List, Mapping, NamedTuple, Sequence,
+                    Tuple, Union)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.utilities.numpy_export import (information_items,
+                                                ticker_contracts)
+
+
+class ColumnMetadata(NamedTuple):
+    """Title and tooltip shared by every cell of a column."""
+
+    title: str
+    tooltip: str
+
+
+class UniverseSnapshot:
+    """Represents the information of many stocks, one row per ticker.
+
+    The numeric columns share one column-major float64 array, NaN where a
+    stock lacks the indicator, so each column is contiguous and the array
+    converts to pandas without a copy. The other values, like the sector or
+    the date of the last price, are kept in object arrays.
+    """
+
+    def __init__(self,
+                 tickers: Sequence[str],
+                 numeric_values: 'np.ndarray',
+                 numeric_columns: Sequence[str],
+                 text_values: Dict[str, 'np.ndarray'],
+                 metadata: Dict[str, ColumnMetadata]) -> None:
+        """Initialize the class.
+
+        Prefer `from_contracts`, which builds every argument.
+
+        :param tickers: Sequence[str]: The ticker of each row.
+        :param numeric_values: np.ndarray: The numeric values, shaped (tickers, numeric columns).
+        :param numeric_columns: Sequence[str]: The path of each numeric column.
+        :param text_values: dict: The object array of each other column, by path.
+        :param metadata: dict: The title and tooltip of each column, by path.
+        :raises ValueError: If the values do not match the tickers and columns.
+        """
+
+        if numeric_values.shape != (len(tickers), len(numeric_columns)):
+            raise ValueError('The numeric values do not match the tickers and columns.')
+
+        self.__tickers = tuple(tickers)
+        self.__rows = {ticker: row for row, ticker in enumerate(self.__tickers)}
+        self.__numeric_columns = {column: index for index, column in enumerate(numeric_columns)}
+        self.__numeric_values = np.asfortranarray(numeric_values, dtype=np.float64)
+        self.__numeric_values.flags.writeable = False
+        self.__text_values = dict(text_values)
+        self.__metadata = dict(metadata)
+
+    @classmethod
+    def from_contracts(cls,
+                       contracts: Union[Mapping[str, Union[TransformContract, Exception]],
+                                        Iterable[Union[TransformContract, Exception]]]
+                       ) -> 'UniverseSnapshot':
+        """Build a snapshot from transformed stocks.
+
+        Failed tickers, returned as exceptions by the batch pipeline, are
+        skipped. The columns follow the order they are first found in.
+
+        :param contracts: The contract of each ticker, as returned by the batch
+                          pipeline, or the contracts alone. Contracts transformed
+                          with only some sections must be given by ticker.
+        :return: UniverseSnapshot: One row per stock.
+        :raises ImportError: If NumPy is not installed.
+        :raises ValueError: If a contract given alone has no stock identification.
+        """
+
+        if np is None:
+            raise ImportError('The universe snapshot requires numpy: '
+                              'pip install pyfundamentus[numpy]')
+
+        tickers: List[str] = []
+        rows: List[Dict[str, object]] = []
+        metadata: Dict[str, ColumnMetadata] = {}
+        numeric_columns: Dict[str, None] = {}
+        text_columns: Dict[str, None] = {}
+
+        for ticker, contract in ticker_contracts(contracts):
+            information = contract.transformed_information
+            row = {}
+
+            for path, item in information_items(information):
+                if path not in metadata:
+                    metadata[path] = ColumnMetadata(item.title, item.tooltip)
+
+                if isinstance(item.value, (Decimal, float)):
+                    numeric_columns[path] = None
+                else:
+                    text_columns[path] = None
+
+                row[path] = item.value
+
+            tickers.append(ticker)
+            rows.append(row)
+
+        # A column numeric in one stock and textual in another is kept as text.
+        numeric = [column for column in numeric_columns if column not in text_columns]
+        numeric_values = np.full((len(rows), len(numeric)), np.nan, order='F')
+
+        for index, column in enumerate(numeric):
+            numeric_values[:, index] = [row.get(column, np.nan) for row in rows]
+
+        text_values = {}
+        for column in text_columns:
+            text_values[column] = np.empty(len(rows), dtype=object)
+            text_values[column][:] = [row.get(column) for row in rows]
+
+        return cls(tickers, numeric_values, numeric, text_values, metadata)
+
+    def __len__(self) -> int:
+        """Return the number of tickers."""
+
+        return len(self.__tickers)
+
+    @property
+    def tickers(self) -> Tuple[str, ...]:
+        """Return the ticker of each row."""
+
+        return self.__tickers
+
+    @property
+    def numeric_columns(self) -> Tuple[str, ...]:
+        """Return the path of each numeric column, in array order."""
+
+        return tuple(self.__numeric_columns)
+
+    @property
+    def text_columns(self) -> Tuple[str, ...]:
+        """Return the path of each non-numeric column."""
+
+        return tuple(self.__text_values)
+
+    @property
+    def numeric_values(self) -> 'np.ndarray':
+        """Return the read-only numeric array, shaped (tickers, numeric columns)."""
+
+        return self.__numeric_values
+
+    def metadata(self, column: str) -> ColumnMetadata:
+        """Return the title and tooltip of a column.
+
+        :param column: str: The column path.
+        :return: ColumnMetadata: The title and tooltip of the column.
+        :raises KeyError: If the column is unknown.
+        """
+
+        return self.__metadata[column]
+
+    def column(self, column: str) -> 'np.ndarray':
+        """Return the values of a column, one per ticker.
+
+        A numeric column is a read-only view of the snapshot array.
+
+        :param column: str: The column path.
+        :return: np.ndarray: The values of the column.
+        :raises KeyError: If the column is unknown.
+        """
+
+        if column in self.__numeric_columns:
+            return self.__numeric_values[:, self.__numeric_columns[column]]
+
+        return self.__text_values[column]
+
+    def row(self, ticker: str) -> Dict[str, object]:
+        """Return the values of a ticker, NaN where a numeric indicator is missing.
+
+        :param ticker: str: The ticker symbol.
+        :return: dict: The value of every column, by path.
+        :raises KeyError: If the ticker is unknown.
+        """
+
+        index = self.__rows[ticker]
+        values: Dict[str, object] = {
+            column: float(self.__numeric_values[index, position])
+            for column, position in self.__numeric_columns.items()
+        }
+        values.update({column: array[index] for column, array in self.__text_values.items()})
+
+        return values
+
+    def to_pandas(self, include_text: bool = True) -> 'pd.DataFrame':
+        """Convert the snapshot to a DataFrame indexed by ticker.
+
+        The numeric columns are backed by the snapshot array, without a copy.
+        The titles and tooltips are kept in `DataFrame.attrs['metadata']`.
+
+        :param include_text: bool: Whether to add the non-numeric columns.
+        :return: pd.DataFrame: One row per ticker, one column per indicator.
+        :raises ImportError: If pandas is not installed.
+        """
+
+        if pd is None:
+            raise ImportError('The pandas conversion requires pandas: '
+                              'pip install pyfundamentus[pandas]')
+
+        frame = pd.DataFrame(self.__numeric_values,
+                             index=pd.Index(self.__tickers, name='ticker'),
+                             columns=list(self.__numeric_columns),
+                             copy=False)
+
+        if include_text and self.__text_values:
+            text = pd.DataFrame(self.__text_values, index=frame.index, copy=False)
+            frame = pd.concat([frame, text], axis=1)
+
+        frame.attrs['metadata'] = {column: tuple(metadata)
+                                   for column, metadata in self.__metadata.items()
+                                   if column in frame.columns}
+
+        return frame
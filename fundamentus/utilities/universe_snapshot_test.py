@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: universe_snapshot_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Universe Snapshot Test."""
+
+import math
+
+import pytest
+
+from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+
+np = pytest.importorskip('numpy')
+
+from .universe_snapshot import UniverseSnapshot  # pylint: disable=wrong-import-position
+
+DIVIDEND_YIELD = 'valuation_indicators.dividend_yield'
+
+
+def build_snapshot() -> UniverseSnapshot:
+    """Build a snapshot of the mock stock, once exact and once in float mode."""
+
+    exact = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    fast = TransformRawInformation('float').transform_all_information(EXTRACT_CONTRACT_MOCK)
+
+    return UniverseSnapshot.from_contracts([exact, ExtractException('failed'), fast])
+
+
+def test_from_contracts() -> None:
+    """Test that each stock is a row and the failures are skipped."""
+
+    snapshot = build_snapshot()
+
+    assert len(snapshot) == 2
+    assert snapshot.tickers == ('VALE3', 'VALE3')
+    assert snapshot.numeric_values.shape == (2, len(snapshot.numeric_columns))
+    assert snapshot.numeric_values.dtype == np.float64
+    assert 'income_statement.twelve_months.ebit' in snapshot.numeric_columns
+    assert 'financial_summary.sector' in snapshot.text_columns
+
+
+def test_columns_and_metadata() -> None:
+    """Test that the values are typed and the metadata is kept once per column."""
+
+    snapshot = build_snapshot()
+    dividend_yield = snapshot.column(DIVIDEND_YIELD)
+
+    assert dividend_yield[0] == pytest.approx(dividend_yield[1])
+    assert not dividend_yield.flags.writeable
+    assert snapshot.metadata(DIVIDEND_YIELD).title == 'Dividend Yield'
+    assert snapshot.row('VALE3')[DIVIDEND_YIELD] == pytest.approx(dividend_yield[0])
+    assert list(snapshot.column('financial_summary.sector')) == ['Mineração', 'Mineração']
+
+
+def test_missing_indicator_is_nan() -> None:
+    """Test that an indicator absent from a stock is NaN."""
+
+    transformed = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    information = dict(transformed.transformed_information)
+    information['valuation_indicators'] = {}
+    partial = TransformContract(information)
+
+    snapshot = UniverseSnapshot.from_contracts([transformed, partial])
+
+    assert math.isnan(snapshot.column(DIVIDEND_YIELD)[1])
+
+
+def test_partial_contracts_by_ticker() -> None:
+    """Test that contracts without the identification take the ticker of the mapping."""
+
+    transformed = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    partial = TransformContract({'valuation_indicators':
+                                 transformed.transformed_information['valuation_indicators']})
+
+    snapshot = UniverseSnapshot.from_contracts({'VALE3': partial,
+                                                'INVALID': ExtractException('failed')})
+
+    assert snapshot.tickers == ('VALE3',)
+    assert snapshot.row('VALE3')[DIVIDEND_YIELD] == pytest.approx(
+        float(transformed.transformed_information['valuation_indicators']
+              ['dividend_yield'].value))
+
+    with pytest.raises(ValueError, match='stock_identification'):
+        UniverseSnapshot.from_contracts([partial])
+
+
+def test_to_pandas_without_copy() -> None:
+    """Test that the numeric columns are shared with the DataFrame."""
+
+    pytest.importorskip('pandas')
+
+    snapshot = build_snapshot()
+    frame = snapshot.to_pandas()
+
+    assert list(frame.index) == ['VALE3', 'VALE3']
+    assert frame.shape == (2, len(snapshot.numeric_columns) + len(snapshot.text_columns))
+    assert np.shares_memory(frame[DIVIDEND_YIELD].to_numpy(), snapshot.column(DIVIDEND_YIELD))
+    assert frame.attrs['metadata'][DIVIDEND_YIELD][0] == 'Dividend Yield'
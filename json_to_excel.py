@@ -1,5 +1,7 @@
 import pandas as pd
 
+from catalogo_indicadores import CATALOGO
+
 # Função para converter JSON em Excel
 def json_to_excel(json_file_path, excel_file_path):
     try:
@@ -7,9 +9,11 @@ def json_to_excel(json_file_path, excel_file_path):
         df = pd.read_json(json_file_path)
         
         # Verificar se as colunas esperadas estão presentes
-        expected_columns = ['Indicador', 'Classificação', 'Faixa de Referência', 'Interpretação', 'Classificação2']
+        expected_columns = ['Indicador', 'Classificação', 'Faixa de Referência',
+                            'Interpretação', 'Classificação2']
         if not all(col in df.columns for col in expected_columns):
-            raise ValueError("O JSON não contém todas as colunas esperadas: " + ", ".join(expected_columns))
+            raise ValueError("O JSON não contém todas as colunas esperadas: "
+                             + ", ".join(expected_columns))
         
         # Salvar o DataFrame como Excel
         df.to_excel(excel_file_path, sheet_name='Indicadores', index=False, engine='openpyxl')
@@ -22,6 +26,20 @@ def json_to_excel(json_file_path, excel_file_path):
     except Exception as e:
         print(f"Erro inesperado: {e}")
 
+# Função para exportar para Excel as interpretações do catálogo de indicadores,
+# com as mesmas colunas do JSON
+def catalogo_to_excel(excel_file_path):
+    try:
+        # Uma linha por indicador e classificação, lidas do catálogo compartilhado
+        df = pd.DataFrame(CATALOGO.interpretacoes())
+
+        # Salvar o DataFrame como Excel
+        df.to_excel(excel_file_path, sheet_name='Indicadores', index=False, engine='openpyxl')
+        print(f"Arquivo Excel '{excel_file_path}' gerado com sucesso!")
+
+    except Exception as e:
+        print(f"Erro inesperado: {e}")
+
 # Caminhos dos arquivos
 json_file_path = 'Indicadores_Atualizado_Critico.json'
 excel_file_path = 'Indicadores_Atualizado_Critico.xlsx'
@@ -30,4 +48,6 @@ excel_file_path = 'Indicadores_Atualizado_Critico.xlsx'
 if __name__ == "__main__":
     #json_to_excel('D:\indicadores_completo.json', 'D:\saida.xlsx')
     # Forma correta usando barras duplas
-    json_to_excel(r'D:\indicadores_completo.json', r'D:\saida.xlsx')
\ No newline at end of file
+    #json_to_excel(r'D:\indicadores_completo.json', r'D:\saida.xlsx')
+    # As interpretações de indicadores_completo.json agora fazem parte do catálogo de indicadores
+    catalogo_to_excel(r'D:\saida.xlsx')
\ No newline at end of file